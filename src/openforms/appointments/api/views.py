@@ -50,7 +50,7 @@ class ProductsListView(ListMixin, APIView):
 
     def get_objects(self):
         client = get_client()
-        return client.get_available_products()
+        return client.get_cached_available_products()
 
 
 # The serializer + @extend_schema approach for querystring params is not ideal, the
@@ -94,7 +94,7 @@ class LocationsListView(ListMixin, APIView):
         )
 
         client = get_client()
-        return client.get_locations([product])
+        return client.get_cached_locations([product])
 
 
 @extend_schema(
@@ -146,7 +146,7 @@ class DatesListView(ListMixin, APIView):
         )
 
         client = get_client()
-        dates = client.get_dates([product], location)
+        dates = client.get_cached_dates([product], location)
         return [{"date": date} for date in dates]
 
 
@@ -206,7 +206,9 @@ class TimesListView(ListMixin, APIView):
         )
 
         client = get_client()
-        times = client.get_times([product], location, serializer.validated_data["date"])
+        times = client.get_cached_times(
+            [product], location, serializer.validated_data["date"]
+        )
         return [{"time": time} for time in times]
 
 
@@ -1,14 +1,19 @@
+import hashlib
+import json
 import logging
+import uuid
 from dataclasses import dataclass
 from datetime import date, datetime
-from typing import Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
+from django.core.cache import caches
 from django.urls import reverse
 
 from rest_framework import serializers
 
 from openforms.plugins.plugin import AbstractBasePlugin
 from openforms.submissions.models import Submission
+from openforms.utils.cache import get_or_compute
 from openforms.utils.mixins import JsonSchemaSerializerMixin
 from openforms.utils.urls import build_absolute_uri
 
@@ -21,6 +26,8 @@ class EmptyOptions(JsonSchemaSerializerMixin, serializers.Serializer):
 
 logger = logging.getLogger(__name__)
 
+CACHE_ALIAS = "default"
+
 
 @dataclass()
 class AppointmentProduct:
@@ -79,6 +86,18 @@ class BasePlugin(AbstractBasePlugin):
 
     configuration_options = EmptyOptions
 
+    # Timeouts (in seconds) of the cached lookups used by the appointment API
+    # endpoints. Products and locations rarely change, while the available dates and
+    # times change as soon as appointments are made.
+    cache_timeouts = {
+        "products": 60 * 60,
+        "locations": 60 * 60,
+        "dates": 60,
+        "times": 10,
+    }
+    # operations affected by creating or deleting appointments
+    availability_operations = ("dates", "times")
+
     @property
     def is_enabled(self):
         # TODO currently not configurable,
@@ -216,6 +235,105 @@ class BasePlugin(AbstractBasePlugin):
         """
         raise NotImplementedError()
 
+    # caching
+
+    def _get_availability_version_key(self) -> str:
+        return f"appointments:{self.identifier}:availability-version"
+
+    def _get_cache_key(self, operation: str, *args) -> str:
+        bits = json.dumps(args, default=str, sort_keys=True)
+        digest = hashlib.md5(bits.encode("utf-8")).hexdigest()
+        key = f"appointments:{self.identifier}:{operation}:{digest}"
+        if operation in self.availability_operations:
+            cache = caches[CACHE_ALIAS]
+            version_key = self._get_availability_version_key()
+            version = cache.get(version_key)
+            if version is None:
+                cache.add(version_key, uuid.uuid4().hex, timeout=None)
+                version = cache.get(version_key)
+            key = f"{key}:{version}"
+        return key
+
+    def _get_cached(self, operation: str, args: tuple, compute: Callable[[], Any]):
+        timeout = self.cache_timeouts.get(operation)
+        if not timeout:
+            return compute()
+        key = self._get_cache_key(operation, *args)
+        return get_or_compute(caches[CACHE_ALIAS], key, compute, timeout=timeout)
+
+    def invalidate_availability_cache(self) -> None:
+        """
+        Discard the cached available dates and times.
+
+        This must be called after an appointment was created or deleted.
+        """
+        caches[CACHE_ALIAS].set(
+            self._get_availability_version_key(), uuid.uuid4().hex, timeout=None
+        )
+
+    def get_cached_available_products(
+        self, current_products: Optional[List[AppointmentProduct]] = None
+    ) -> List[AppointmentProduct]:
+        """
+        Cached variant of :meth:`get_available_products`.
+        """
+        return self._get_cached(
+            "products",
+            ([product.identifier for product in current_products or []],),
+            lambda: self.get_available_products(current_products),
+        )
+
+    def get_cached_locations(
+        self, products: List[AppointmentProduct]
+    ) -> List[AppointmentLocation]:
+        """
+        Cached variant of :meth:`get_locations`.
+        """
+        return self._get_cached(
+            "locations",
+            ([product.identifier for product in products],),
+            lambda: self.get_locations(products),
+        )
+
+    def get_cached_dates(
+        self,
+        products: List[AppointmentProduct],
+        location: AppointmentLocation,
+        start_at: Optional[date] = None,
+        end_at: Optional[date] = None,
+    ) -> List[date]:
+        """
+        Cached variant of :meth:`get_dates`.
+        """
+        # the default period depends on the current date
+        args = (
+            [product.identifier for product in products],
+            location.identifier,
+            start_at or date.today(),
+            end_at,
+        )
+        return self._get_cached(
+            "dates",
+            args,
+            lambda: self.get_dates(products, location, start_at, end_at),
+        )
+
+    def get_cached_times(
+        self,
+        products: List[AppointmentProduct],
+        location: AppointmentLocation,
+        day: date,
+    ) -> List[datetime]:
+        """
+        Cached variant of :meth:`get_times`.
+        """
+        args = ([product.identifier for product in products], location.identifier, day)
+        return self._get_cached(
+            "times",
+            args,
+            lambda: self.get_times(products, location, day),
+        )
+
     # cosmetics
 
     @staticmethod
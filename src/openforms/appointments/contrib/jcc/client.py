@@ -0,0 +1,74 @@
+"""
+Process-wide cache of the JCC SOAP clients.
+
+Building a :class:`zeep.Client` downloads and parses the WSDL (and the schemas it
+imports), which takes a considerable amount of time. The appointment API endpoints
+would pay this cost on every call, so the clients are built once per process and
+re-used.
+
+The clients are keyed by the WSDL location and a "client version", stored in the
+shared (Django) cache. The version is bumped whenever the JCC configuration or a
+SOAP service is changed, see :mod:`openforms.appointments.contrib.jcc.signals`, so
+that all processes pick up the new configuration.
+"""
+import uuid
+from functools import lru_cache
+from typing import Optional
+
+from django.core.cache import caches
+
+from requests import Session
+from requests.adapters import HTTPAdapter
+from zeep import Client
+from zeep.cache import InMemoryCache
+from zeep.transports import Transport
+
+CACHE_ALIAS = "default"
+VERSION_CACHE_KEY = "appointments:jcc:client-version"
+
+# the downloaded WSDL and XSD documents are kept for a day
+WSDL_CACHE_TIMEOUT = 60 * 60 * 24
+# the maximum number of connections kept alive per host
+POOL_MAXSIZE = 10
+
+
+def build_client(wsdl: str) -> Client:
+    session = Session()
+    adapter = HTTPAdapter(pool_maxsize=POOL_MAXSIZE)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    transport = Transport(
+        cache=InMemoryCache(timeout=WSDL_CACHE_TIMEOUT), session=session
+    )
+    return Client(wsdl, transport=transport)
+
+
+@lru_cache(maxsize=8)
+def _get_cached_client(wsdl: str, version: str) -> Client:
+    return build_client(wsdl)
+
+
+def get_client_version() -> Optional[str]:
+    cache = caches[CACHE_ALIAS]
+    version = cache.get(VERSION_CACHE_KEY)
+    if version is None:
+        # use add so that concurrent initializations settle on a single version
+        cache.add(VERSION_CACHE_KEY, uuid.uuid4().hex, timeout=None)
+        version = cache.get(VERSION_CACHE_KEY)
+    return version
+
+
+def invalidate_clients() -> None:
+    caches[CACHE_ALIAS].set(VERSION_CACHE_KEY, uuid.uuid4().hex, timeout=None)
+
+
+def get_client(wsdl: str) -> Client:
+    """
+    Retrieve the (cached) SOAP client for the WSDL location.
+    """
+    version = get_client_version()
+    # the cache is unavailable - do not risk using a client for an outdated
+    # configuration since invalidation cannot be communicated.
+    if version is None:
+        return build_client(wsdl)
+    return _get_cached_client(wsdl, version)
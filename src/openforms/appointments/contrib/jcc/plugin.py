@@ -6,7 +6,6 @@ from django.utils.html import format_html
 from django.utils.translation import gettext_lazy as _
 
 from requests.exceptions import RequestException
-from zeep import Client
 from zeep.exceptions import Error as ZeepError
 
 from openforms.plugins.exceptions import InvalidPluginConfiguration
@@ -24,6 +23,7 @@ from ...exceptions import (
     AppointmentException,
 )
 from ...utils import create_base64_qrcode
+from .client import get_client
 
 logger = logging.getLogger(__name__)
 
@@ -43,7 +43,7 @@ class Plugin(BasePlugin):
     verbose_name = "JCC-Plugin"
 
     def __init__(self, wsdl):
-        self.client = Client(wsdl)
+        self.client = get_client(wsdl)
 
     def get_available_products(
         self, current_products: Optional[List[AppointmentProduct]] = None
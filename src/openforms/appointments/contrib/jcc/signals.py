@@ -0,0 +1,19 @@
+from django.db import transaction
+from django.db.models.base import ModelBase
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from stuf.models import SoapService
+
+from .client import invalidate_clients
+from .models import JccConfig
+
+
+@receiver(post_save, sender=JccConfig, dispatch_uid="jcc.invalidate_config_save")
+@receiver(post_delete, sender=JccConfig, dispatch_uid="jcc.invalidate_config_delete")
+@receiver(post_save, sender=SoapService, dispatch_uid="jcc.invalidate_service_save")
+@receiver(post_delete, sender=SoapService, dispatch_uid="jcc.invalidate_service_delete")
+def invalidate_jcc_clients(sender: ModelBase, **kwargs) -> None:
+    invalidate_clients()
+    # other processes may have cached a client while the transaction was open
+    transaction.on_commit(invalidate_clients)
@@ -0,0 +1,37 @@
+import os
+
+from django.test import TestCase
+
+from stuf.tests.factories import SoapServiceFactory
+
+from ..client import get_client
+from ..models import JccConfig
+
+WSDL = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "mock/GenericGuidanceSystem2.wsdl")
+)
+
+
+class ClientCacheTests(TestCase):
+    def test_client_reused(self):
+        client = get_client(WSDL)
+
+        self.assertIs(get_client(WSDL), client)
+
+    def test_client_rebuilt_after_configuration_change(self):
+        client = get_client(WSDL)
+
+        config = JccConfig.get_solo()
+        config.service = SoapServiceFactory.create(url=WSDL)
+        config.save()
+
+        self.assertIsNot(get_client(WSDL), client)
+
+    def test_client_rebuilt_after_service_change(self):
+        service = SoapServiceFactory.create(url=WSDL)
+        client = get_client(WSDL)
+
+        service.label = "JCC"
+        service.save()
+
+        self.assertIsNot(get_client(WSDL), client)
@@ -1,5 +1,6 @@
-from datetime import datetime
+from datetime import date, datetime
 
+from django.core.cache import caches
 from django.test import TestCase, override_settings
 from django.urls import reverse
 
@@ -71,3 +72,59 @@ class BasePluginTests(TestCase):
         )
         change_url = f"https://example.com{change_path}"
         self.assertEqual(change_url, result)
+
+
+class CachingPlugin(BasePlugin):
+    def __init__(self, identifier: str):
+        super().__init__(identifier)
+        self.calls = []
+
+    def get_available_products(self, current_products=None):
+        self.calls.append("products")
+        return [AppointmentProduct(identifier="1", name="Test product 1")]
+
+    def get_times(self, products, location, day):
+        self.calls.append("times")
+        return [datetime(2021, 1, 1, 12, 0)]
+
+
+class BasePluginCacheTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        caches["default"].clear()
+        self.addCleanup(caches["default"].clear)
+        self.plugin = CachingPlugin("caching")
+        self.product = AppointmentProduct(identifier="1", name="")
+        self.location = AppointmentLocation(identifier="1", name="")
+
+    def test_lookups_are_cached(self):
+        first = self.plugin.get_cached_available_products()
+        second = self.plugin.get_cached_available_products()
+
+        self.assertEqual(first, second)
+        self.assertEqual(self.plugin.calls, ["products"])
+
+    def test_cache_key_depends_on_arguments(self):
+        self.plugin.get_cached_times([self.product], self.location, date(2021, 1, 1))
+        self.plugin.get_cached_times([self.product], self.location, date(2021, 1, 2))
+
+        self.assertEqual(self.plugin.calls, ["times", "times"])
+
+    def test_invalidate_availability(self):
+        self.plugin.get_cached_available_products()
+        self.plugin.get_cached_times([self.product], self.location, date(2021, 1, 1))
+
+        self.plugin.invalidate_availability_cache()
+        self.plugin.get_cached_available_products()
+        self.plugin.get_cached_times([self.product], self.location, date(2021, 1, 1))
+
+        # products are not affected by making appointments
+        self.assertEqual(self.plugin.calls, ["products", "times", "times"])
+
+    def test_caching_disabled_with_empty_timeout(self):
+        self.plugin.cache_timeouts = {**self.plugin.cache_timeouts, "products": 0}
+
+        self.plugin.get_cached_available_products()
+        self.plugin.get_cached_available_products()
+
+        self.assertEqual(self.plugin.calls, ["products", "products"])
@@ -138,6 +138,7 @@ def book_appointment_for_submission(submission: Submission) -> None:
         appointment_id = client.create_appointment(
             [product], location, start_at, appointment_client
         )
+        client.invalidate_availability_cache()
         appointment_info = AppointmentInfo.objects.create(
             status=AppointmentDetailsStatus.success,
             appointment_id=appointment_id,
@@ -228,6 +229,7 @@ def delete_appointment_for_submission(submission: Submission, client=None) -> No
 
     try:
         client.delete_appointment(appointment_info.appointment_id)
+        client.invalidate_availability_cache()
         appointment_info.cancel()
     except AppointmentDeleteFailed as e:
         logevent.appointment_cancel_failure(appointment_info, client, e)
@@ -507,6 +507,9 @@ SUBMISSION_REPORT_URL_TOKEN_TIMEOUT_DAYS = config(
 TEMPORARY_UPLOADS_REMOVED_AFTER_DAYS = config(
     "TEMPORARY_UPLOADS_REMOVED_AFTER_DAYS", default=2
 )
+SUBMISSION_EXPORTS_REMOVED_AFTER_DAYS = config(
+    "SUBMISSION_EXPORTS_REMOVED_AFTER_DAYS", default=7
+)
 
 # a custom default timeout for the requests library, added via monkeypatch in
 # :mod:`openforms.setup`. Value is in seconds.
@@ -514,6 +517,13 @@ DEFAULT_TIMEOUT_REQUESTS = config("DEFAULT_TIMEOUT_REQUESTS", default=10.0)
 
 MAX_FILE_UPLOAD_SIZE = config("MAX_FILE_UPLOAD_SIZE", default="50M", cast=Filesize())
 
+# Time (in seconds) that retrieved prefill values are shared between submissions of
+# the same person/company. Disabled by default.
+PREFILL_CACHE_TIMEOUT = config("PREFILL_CACHE_TIMEOUT", default=0)
+
+# Maximum number of connections kept alive per host for the StUF-ZDS/StUF-BG services.
+STUF_POOL_MAXSIZE = config("STUF_POOL_MAXSIZE", default=10)
+
 ##############################
 #                            #
 # 3RD PARTY LIBRARY SETTINGS #
@@ -606,6 +616,10 @@ CELERY_BEAT_SCHEDULE = {
         "task": "openforms.submissions.tasks.user_uploads.cleanup_unclaimed_temporary_files",
         "schedule": crontab(minute=30, hour=3),
     },
+    "cleanup-submission-exports": {
+        "task": "openforms.submissions.tasks.exports.cleanup_submission_exports",
+        "schedule": crontab(minute=15, hour=3),
+    },
     "cleanup_on_completion_results": {
         "task": "openforms.submissions.tasks.cleanup.cleanup_on_completion_results",
         "schedule": crontab(minute=45, hour=4),
@@ -620,6 +634,16 @@ RETRY_SUBMISSIONS_TIME_LIMIT = config(
     "RETRY_SUBMISSIONS_TIME_LIMIT", default=48  # hours
 )
 
+# Resizing (large) images is CPU intensive and may be routed to a dedicated queue, so
+# that it does not hold up the other tasks. Start a worker for that queue when
+# changing this.
+IMAGE_RESIZE_QUEUE = config("IMAGE_RESIZE_QUEUE", default="celery")
+CELERY_TASK_ROUTES = {
+    "openforms.submissions.tasks.user_uploads.resize_submission_attachment": {
+        "queue": IMAGE_RESIZE_QUEUE,
+    },
+}
+
 # Only ACK when the task has been executed. This prevents tasks from getting lost, with
 # the drawback that tasks should be idempotent (if they execute partially, the mutations
 # executed will be executed again!)
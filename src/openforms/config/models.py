@@ -1,6 +1,5 @@
 from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
-from django.template import Context, Template
 from django.template.loader import render_to_string
 from django.utils.encoding import force_str
 from django.utils.translation import gettext_lazy as _
@@ -14,6 +13,7 @@ from openforms.data_removal.constants import RemovalMethods
 from openforms.emails.validators import URLSanitationValidator
 from openforms.payments.validators import validate_payment_order_id_prefix
 from openforms.utils.fields import SVGOrImageField
+from openforms.utils.templates import render_from_string
 from openforms.utils.translations import ensure_default_language, runtime_gettext
 from openforms.utils.validators import DjangoTemplateValidator
 
@@ -465,7 +465,7 @@ class GlobalConfiguration(SingletonModel):
 
     def render_privacy_policy_label(self):
         template = self.privacy_policy_label
-        rendered_content = Template(template).render(Context({}))
+        rendered_content = render_from_string(template, {})
 
         return rendered_content
 
@@ -1,5 +1,6 @@
 from django import template
-from django.template import Context, Template
+
+from openforms.utils.templates import render_from_string
 
 from ..models import GlobalConfiguration
 
@@ -11,8 +12,8 @@ def privacy_policy():
     conf = GlobalConfiguration.get_solo()
     if conf.privacy_policy_url:
         template_string = '{% load i18n %}<a href="{{ privacy_policy }}">{% trans "privacy policy" %}</a>'
-        return Template(template_string).render(
-            Context({"privacy_policy": conf.privacy_policy_url})
+        return render_from_string(
+            template_string, {"privacy_policy": conf.privacy_policy_url}
         )
 
     return ""
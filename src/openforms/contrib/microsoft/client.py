@@ -1,8 +1,11 @@
 import json
 import os
+from functools import lru_cache
 from io import BytesIO
 from pathlib import Path
-from typing import Union
+from typing import Tuple, Union
+
+from django.utils.functional import cached_property
 
 from O365 import Account
 
@@ -37,6 +40,10 @@ class MSGraphClient:
     def is_authenticated(self):
         return self.account.is_authenticated
 
+    @cached_property
+    def upload_helper(self) -> "MSGraphUploadHelper":
+        return MSGraphUploadHelper(self)
+
 
 class MSGraphUploadHelper:
     """
@@ -88,3 +95,30 @@ class MSGraphUploadHelper:
             stream_size=stream_size,
             conflict_handling=ConflictHandling.replace,
         )
+
+
+@lru_cache(maxsize=8)
+def _get_cached_client(
+    service: MSGraphService, credentials: Tuple[str, str, str]
+) -> MSGraphClient:
+    return MSGraphClient(service)
+
+
+def get_client(service: MSGraphService) -> MSGraphClient:
+    """
+    Retrieve the (cached) authenticated client for the service.
+
+    The client is kept per process, so that the access token is re-used until it
+    expires - O365 then fetches a new token by itself. The credentials are part of
+    the cache key, changing them results in a new client.
+    """
+    credentials = (service.tenant_id, service.client_id, service.secret)
+    return _get_cached_client(service, credentials)
+
+
+def get_upload_helper(service: MSGraphService) -> MSGraphUploadHelper:
+    """
+    Retrieve the (cached) upload helper for the service, with the drive and root
+    folder already resolved.
+    """
+    return get_client(service).upload_helper
@@ -4,8 +4,9 @@ from django.test import TestCase
 
 import requests_mock
 from O365 import Account
+from O365.drive import Drive
 
-from ..client import MSGraphClient
+from ..client import MSGraphClient, _get_cached_client, get_client, get_upload_helper
 from ..exceptions import MSAuthenticationError
 from .factories import MSGraphServiceFactory
 
@@ -29,3 +30,48 @@ class MSGraphClientTests(TestCase):
             with patch.object(Account, "is_authenticated", True):
                 client = MSGraphClient(service)
                 self.assertTrue(client.is_authenticated)
+
+
+@requests_mock.Mocker(real_http=False)
+class CachedClientTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        _get_cached_client.cache_clear()
+        self.addCleanup(_get_cached_client.cache_clear)
+
+        patcher = patch.object(Account, "authenticate", return_value=True)
+        self.mock_authenticate = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_client_reused(self, m):
+        service = MSGraphServiceFactory.create()
+
+        client = get_client(service)
+
+        self.assertIs(get_client(service), client)
+        self.mock_authenticate.assert_called_once()
+
+    def test_new_client_after_credentials_change(self, m):
+        service = MSGraphServiceFactory.create()
+        client = get_client(service)
+
+        service.secret = "changed"
+        service.save()
+
+        self.assertIsNot(get_client(service), client)
+        self.assertEqual(self.mock_authenticate.call_count, 2)
+
+    def test_clients_per_service(self, m):
+        service1, service2 = MSGraphServiceFactory.create_batch(2)
+
+        self.assertIsNot(get_client(service1), get_client(service2))
+
+    def test_upload_helper_reused(self, m):
+        service = MSGraphServiceFactory.create()
+
+        with patch.object(Drive, "get_root_folder") as mock_get_root_folder:
+            uploader = get_upload_helper(service)
+
+            self.assertIs(get_upload_helper(service), uploader)
+
+        mock_get_root_folder.assert_called_once()
@@ -0,0 +1,183 @@
+"""
+Batched removal of submission data.
+
+Retention runs can touch a very large number of submissions. Instead of processing
+(and saving) submissions one by one or deleting everything in a single statement,
+submissions are processed in bounded batches of primary keys, using keyset
+pagination. Each batch is handled in its own transaction with set-based queries.
+
+Files of deleted records are not removed inside the transaction - their names are
+collected and their deletion is scheduled as a separate task once the batch is
+committed.
+"""
+from collections import defaultdict
+from functools import partial
+from typing import Dict, Iterator, List, Set
+
+from django.db import models, transaction
+from django.db.models import Q
+
+from openforms.forms.models import FormDefinition
+from openforms.submissions.models import (
+    Submission,
+    SubmissionFileAttachment,
+    SubmissionReport,
+    SubmissionStep,
+)
+from openforms.submissions.query import SubmissionQuerySet
+
+REMOVAL_BATCH_SIZE = 1000
+
+
+def iter_pk_batches(
+    queryset: SubmissionQuerySet, batch_size: int = REMOVAL_BATCH_SIZE
+) -> Iterator[List[int]]:
+    """
+    Yield the primary keys of the queryset in ascending batches.
+
+    The next batch is looked up after the previous one was processed, so the
+    processing may remove or modify the records of the batch.
+    """
+    pks = queryset.order_by("pk").values_list("pk", flat=True)
+    last_pk = 0
+    while True:
+        batch = list(pks.filter(pk__gt=last_pk)[:batch_size])
+        if not batch:
+            break
+        yield batch
+        last_pk = batch[-1]
+
+
+def _schedule_file_deletion(model: models.Model, field: str, names: List[str]):
+    from .tasks import delete_files
+
+    names = [name for name in names if name]
+    if not names:
+        return
+    transaction.on_commit(partial(delete_files.delay, model._meta.label, field, names))
+
+
+def _delete_with_files(model: models.Model, field: str, lookup: Q) -> None:
+    # use a plain queryset so that the files are not deleted in-process by the
+    # default manager of the model, but in a separate task instead
+    queryset = models.QuerySet(model=model).filter(lookup)
+    names = list(queryset.values_list(field, flat=True))
+    queryset.delete()
+    _schedule_file_deletion(model, field, names)
+
+
+def delete_submissions(
+    queryset: SubmissionQuerySet, batch_size: int = REMOVAL_BATCH_SIZE
+) -> int:
+    """
+    Delete the submissions in the queryset, batch per batch.
+
+    :return: the number of deleted submissions.
+    """
+    deleted = 0
+    for pks in iter_pk_batches(queryset, batch_size=batch_size):
+        with transaction.atomic():
+            _delete_with_files(
+                SubmissionFileAttachment,
+                "content",
+                Q(submission_step__submission__in=pks),
+            )
+            _delete_with_files(SubmissionReport, "content", Q(submission__in=pks))
+            Submission.objects.filter(pk__in=pks).delete()
+        deleted += len(pks)
+    return deleted
+
+
+class SensitiveFieldsCache:
+    """
+    Look up the sensitive fields of form definitions, once per form definition.
+    """
+
+    def __init__(self):
+        self._fields: Dict[int, Set[str]] = {}
+
+    def load(self, form_definition_ids: Set[int]) -> None:
+        missing = form_definition_ids - self._fields.keys()
+        if not missing:
+            return
+        for form_definition in FormDefinition.objects.filter(pk__in=missing).only(
+            "configuration"
+        ):
+            self._fields[form_definition.pk] = set(form_definition.sensitive_fields)
+
+    def __getitem__(self, form_definition_id: int) -> Set[str]:
+        return self._fields.get(form_definition_id, set())
+
+
+def _anonymize_batch(pks: List[int], sensitive_fields: SensitiveFieldsCache) -> None:
+    steps = list(
+        SubmissionStep.objects.filter(submission__in=pks)
+        .select_for_update(of=("self",))
+        .values_list("pk", "data", "form_step__form_definition_id")
+    )
+    sensitive_fields.load({form_definition_id for *_, form_definition_id in steps})
+
+    steps_to_update = []
+    steps_per_form_definition = defaultdict(list)
+    for pk, data, form_definition_id in steps:
+        fields = sensitive_fields[form_definition_id]
+        if not fields:
+            continue
+        steps_per_form_definition[form_definition_id].append(pk)
+        if data is None:
+            continue
+        data.update({key: "" for key in fields})
+        steps_to_update.append(SubmissionStep(pk=pk, data=data))
+
+    SubmissionStep.objects.bulk_update(
+        steps_to_update, ["data"], batch_size=REMOVAL_BATCH_SIZE
+    )
+    if steps_per_form_definition:
+        attachments_lookup = Q()
+        for form_definition_id, step_pks in steps_per_form_definition.items():
+            attachments_lookup |= Q(
+                submission_step__in=step_pks,
+                form_key__in=sensitive_fields[form_definition_id],
+            )
+        _delete_with_files(SubmissionFileAttachment, "content", attachments_lookup)
+
+    # We do keep the representation of the co-sign data, as that is used in PDF and
+    # confirmation e-mail generation and is usually a label derived from the source
+    # fields.
+    co_signed = Submission.objects.filter(pk__in=pks).exclude(co_sign_data={})
+    submissions_to_update = [
+        Submission(pk=pk, co_sign_data={**co_sign_data, "identifier": "", "fields": {}})
+        for pk, co_sign_data in co_signed.values_list("pk", "co_sign_data")
+    ]
+    Submission.objects.bulk_update(
+        submissions_to_update, ["co_sign_data"], batch_size=REMOVAL_BATCH_SIZE
+    )
+
+    Submission.objects.filter(pk__in=pks).update(
+        bsn="",
+        kvk="",
+        pseudo="",
+        prefill_data={},
+        _is_cleaned=True,
+    )
+
+
+def make_submissions_anonymous(
+    queryset: SubmissionQuerySet, batch_size: int = REMOVAL_BATCH_SIZE
+) -> int:
+    """
+    Remove the sensitive data of the submissions in the queryset, batch per batch.
+
+    This is the set-based equivalent of calling
+    :meth:`openforms.submissions.models.Submission.remove_sensitive_data` for
+    every submission.
+
+    :return: the number of processed submissions.
+    """
+    sensitive_fields = SensitiveFieldsCache()
+    processed = 0
+    for pks in iter_pk_batches(queryset, batch_size=batch_size):
+        with transaction.atomic():
+            _anonymize_batch(pks, sensitive_fields)
+        processed += len(pks)
+    return processed
@@ -1,7 +1,8 @@
-import itertools
 import logging
 from datetime import timedelta
+from typing import List
 
+from django.apps import apps
 from django.db.models import F
 
 from openforms.celery import app
@@ -9,6 +10,10 @@ from openforms.submissions.constants import RegistrationStatuses
 from openforms.submissions.models import Submission
 
 from .constants import RemovalMethods
+from .service import (
+    delete_submissions as delete_submissions_in_batches,
+    make_submissions_anonymous,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -25,10 +30,8 @@ def delete_submissions():
         removal_method=RemovalMethods.delete_permanently,
         time_since_creation__gt=(timedelta(days=1) * F("removal_limit")),
     )
-    logger.info(
-        "Deleting %s successful submissions", successful_submissions_to_delete.count()
-    )
-    successful_submissions_to_delete.delete()
+    deleted = delete_submissions_in_batches(successful_submissions_to_delete)
+    logger.info("Deleted %s successful submissions", deleted)
 
     incomplete_submissions_to_delete = Submission.objects.annotate_removal_fields(
         "incomplete_submissions_removal_limit",
@@ -41,10 +44,8 @@ def delete_submissions():
         removal_method=RemovalMethods.delete_permanently,
         time_since_creation__gt=(timedelta(days=1) * F("removal_limit")),
     )
-    logger.info(
-        "Deleting %s incomplete submissions", incomplete_submissions_to_delete.count()
-    )
-    incomplete_submissions_to_delete.delete()
+    deleted = delete_submissions_in_batches(incomplete_submissions_to_delete)
+    logger.info("Deleted %s incomplete submissions", deleted)
 
     errored_submissions_to_delete = Submission.objects.annotate_removal_fields(
         "errored_submissions_removal_limit",
@@ -55,21 +56,16 @@ def delete_submissions():
         time_since_creation__gt=(timedelta(days=1) * F("removal_limit")),
     )
 
-    logger.info(
-        "Deleting %s errored submissions", errored_submissions_to_delete.count()
-    )
-    errored_submissions_to_delete.delete()
+    deleted = delete_submissions_in_batches(errored_submissions_to_delete)
+    logger.info("Deleted %s errored submissions", deleted)
 
     other_submissions_to_delete = Submission.objects.annotate_removal_fields(
         "all_submissions_removal_limit"
     ).filter(
         time_since_creation__gt=(timedelta(days=1) * F("removal_limit")),
     )
-    logger.info(
-        "Deleting %s other submissions regardless of registration",
-        other_submissions_to_delete.count(),
-    )
-    other_submissions_to_delete.delete()
+    deleted = delete_submissions_in_batches(other_submissions_to_delete)
+    logger.info("Deleted %s other submissions regardless of registration", deleted)
 
 
 @app.task(ignore_result=True)
@@ -109,22 +105,23 @@ def make_sensitive_data_anonymous() -> None:
         _is_cleaned=False,
     )
 
-    logger.info(
-        "Anonymizing %s successful submissions",
-        successful_submissions.count(),
-    )
-    logger.info(
-        "anonymizing %s incomplete submissions",
-        incomplete_submissions.count(),
-    )
-    logger.info(
-        "anonymizing %s errored submissions",
-        errored_submissions.count(),
-    )
-
-    for submission in itertools.chain(
-        successful_submissions.iterator(),
-        incomplete_submissions.iterator(),
-        errored_submissions.iterator(),
+    for label, submissions in (
+        ("successful", successful_submissions),
+        ("incomplete", incomplete_submissions),
+        ("errored", errored_submissions),
     ):
-        submission.remove_sensitive_data()
+        anonymized = make_submissions_anonymous(submissions)
+        logger.info("Anonymized %s %s submissions", anonymized, label)
+
+
+@app.task(ignore_result=True)
+def delete_files(model_label: str, field_name: str, names: List[str]) -> None:
+    """
+    Delete the files of records that were removed from the database.
+    """
+    storage = apps.get_model(model_label)._meta.get_field(field_name).storage
+    for name in names:
+        try:
+            storage.delete(name)
+        except Exception as exc:
+            logger.warning("Deleting file %s failed: %s", name, exc, exc_info=exc)
@@ -0,0 +1,130 @@
+from unittest.mock import patch
+
+from django.test import TestCase
+
+from django_capture_on_commit_callbacks import capture_on_commit_callbacks
+
+from openforms.forms.tests.factories import FormStepFactory
+from openforms.submissions.models import (
+    Submission,
+    SubmissionFileAttachment,
+    SubmissionReport,
+)
+from openforms.submissions.tests.factories import (
+    SubmissionFactory,
+    SubmissionFileAttachmentFactory,
+    SubmissionReportFactory,
+    SubmissionStepFactory,
+)
+
+from ..service import delete_submissions, iter_pk_batches, make_submissions_anonymous
+
+
+class BatchedRemovalTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.form_step = FormStepFactory.create(
+            form_definition__configuration={
+                "components": [
+                    {"type": "textfield", "key": "name", "isSensitiveData": True},
+                    {"type": "file", "key": "upload", "isSensitiveData": True},
+                    {"type": "textfield", "key": "city"},
+                ]
+            }
+        )
+
+    def test_iter_pk_batches(self):
+        submissions = SubmissionFactory.create_batch(5)
+
+        batches = list(iter_pk_batches(Submission.objects.all(), batch_size=2))
+
+        self.assertEqual(
+            batches,
+            [
+                [submissions[0].pk, submissions[1].pk],
+                [submissions[2].pk, submissions[3].pk],
+                [submissions[4].pk],
+            ],
+        )
+
+    @patch("openforms.data_removal.tasks.delete_files.delay")
+    def test_delete_submissions_in_batches(self, mock_delete_files):
+        submissions = SubmissionFactory.create_batch(3, form=self.form_step.form)
+        kept = SubmissionFactory.create(form=self.form_step.form)
+        for submission in submissions + [kept]:
+            step = SubmissionStepFactory.create(
+                submission=submission, form_step=self.form_step, data={}
+            )
+            SubmissionFileAttachmentFactory.create(submission_step=step)
+            SubmissionReportFactory.create(submission=submission)
+
+        with capture_on_commit_callbacks(execute=True):
+            deleted = delete_submissions(
+                Submission.objects.exclude(pk=kept.pk), batch_size=2
+            )
+
+        self.assertEqual(deleted, 3)
+        self.assertEqual(list(Submission.objects.all()), [kept])
+        self.assertEqual(SubmissionFileAttachment.objects.count(), 1)
+        self.assertEqual(SubmissionReport.objects.count(), 1)
+        # the files are deleted in a separate task, per batch and per file field
+        self.assertEqual(mock_delete_files.call_count, 4)
+        deleted_attachments = [
+            name
+            for model_label, field, names in (
+                call.args for call in mock_delete_files.call_args_list
+            )
+            if model_label == "submissions.SubmissionFileAttachment"
+            for name in names
+        ]
+        self.assertEqual(len(deleted_attachments), 3)
+
+    @patch("openforms.data_removal.tasks.delete_files.delay")
+    def test_make_submissions_anonymous_in_batches(self, mock_delete_files):
+        submissions = SubmissionFactory.create_batch(
+            3,
+            form=self.form_step.form,
+            bsn="111222333",
+            co_sign_data={
+                "identifier": "123456782",
+                "representation": "Jane Doe",
+                "fields": {"voornaam": "Jane"},
+            },
+        )
+        for submission in submissions:
+            step = SubmissionStepFactory.create(
+                submission=submission,
+                form_step=self.form_step,
+                data={"name": "Jane", "city": "Amsterdam"},
+            )
+            SubmissionFileAttachmentFactory.create(
+                submission_step=step, form_key="city"
+            )
+            SubmissionFileAttachmentFactory.create(
+                submission_step=step, form_key="upload"
+            )
+
+        with capture_on_commit_callbacks(execute=True):
+            processed = make_submissions_anonymous(
+                Submission.objects.all(), batch_size=2
+            )
+
+        self.assertEqual(processed, 3)
+        for submission in submissions:
+            submission.refresh_from_db()
+            with self.subTest(submission=submission):
+                self.assertTrue(submission._is_cleaned)
+                self.assertEqual(submission.bsn, "")
+                self.assertEqual(
+                    submission.co_sign_data,
+                    {"identifier": "", "representation": "Jane Doe", "fields": {}},
+                )
+                step = submission.submissionstep_set.get()
+                self.assertEqual(
+                    step.data, {"name": "", "upload": "", "city": "Amsterdam"}
+                )
+                self.assertEqual(
+                    list(step.attachments.values_list("form_key", flat=True)),
+                    ["city"],
+                )
+        self.assertEqual(mock_delete_files.call_count, 2)
@@ -1,13 +1,13 @@
 import logging
 from typing import TYPE_CHECKING, Any, Dict, Tuple
 
-from django.template import Context, Template
 from django.template.defaultfilters import date as date_filter
 from django.urls import reverse
 
 from openforms.appointments.models import AppointmentInfo
 from openforms.config.models import GlobalConfiguration
 from openforms.forms.constants import ConfirmationEmailOptions
+from openforms.utils.templates import render_from_string
 from openforms.utils.urls import build_absolute_uri
 
 from .exceptions import SkipConfirmationEmail
@@ -80,5 +80,5 @@ def render_confirmation_email_template(
     template: str, context: dict, **extra_context: Any
 ) -> str:
     render_context = {**context, **extra_context}
-    rendered_content = Template(template).render(Context(render_context))
+    rendered_content = render_from_string(template, render_context)
     return rendered_content
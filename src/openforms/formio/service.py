@@ -1,3 +1,5 @@
+from typing import Dict, Tuple
+
 from django.urls import reverse
 
 from rest_framework.request import Request
@@ -8,8 +10,24 @@ from openforms.prefill import apply_prefill
 from openforms.submissions.models import Submission
 
 
-# TODO: it might be beneficial to memoize this function if it runs multiple times in
-# the context of the same request
+def _get_dynamic_configurations(submission: Submission) -> Dict[int, Tuple[dict, dict]]:
+    # the submission instance is shared by the serializers and form logic handling a
+    # request (or task), which makes it a suitable place to memoize the results. The
+    # entries map the identity of a configuration to the configuration itself (keeping
+    # it alive, so the identity remains valid) and its dynamic configuration.
+    if not hasattr(submission, "_dynamic_configurations"):
+        submission._dynamic_configurations = {}
+    return submission._dynamic_configurations
+
+
+def register_dynamic_configuration(configuration: dict, submission: Submission) -> None:
+    """
+    Mark a configuration derived from a dynamic configuration as dynamic itself.
+    """
+    dynamic_configurations = _get_dynamic_configurations(submission)
+    dynamic_configurations[id(configuration)] = (configuration, configuration)
+
+
 def get_dynamic_configuration(
     configuration: dict, request: Request, submission: Submission
 ) -> dict:
@@ -17,12 +35,25 @@ def get_dynamic_configuration(
     Given a static Formio configuration, apply the hooks to dynamically transform this.
 
     The configuration is modified in the context of the provided :arg:`submission`.
+
+    The results are memoized on the submission instance, keyed by the identity of the
+    (static) configuration object. Passing a configuration that is already the result
+    of this function returns it as-is, so serializers and form logic operating on the
+    same submission share a single dynamic configuration.
     """
-    configuration = handle_custom_types(
+    dynamic_configurations = _get_dynamic_configurations(submission)
+    entry = dynamic_configurations.get(id(configuration))
+    if entry is not None and entry[0] is configuration:
+        return entry[1]
+
+    dynamic_configuration = handle_custom_types(
         configuration, request=request, submission=submission
     )
-    configuration = apply_prefill(configuration, submission=submission)
-    return configuration
+    dynamic_configuration = apply_prefill(dynamic_configuration, submission=submission)
+
+    dynamic_configurations[id(configuration)] = (configuration, dynamic_configuration)
+    register_dynamic_configuration(dynamic_configuration, submission=submission)
+    return dynamic_configuration
 
 
 def update_configuration_for_request(configuration: dict, request: Request) -> dict:
@@ -1,7 +1,14 @@
+from copy import deepcopy
+from unittest.mock import patch
+
 from django.test import RequestFactory, TestCase
 from django.urls import reverse
 
-from openforms.formio.service import update_configuration_for_request
+from openforms.formio.service import (
+    get_dynamic_configuration,
+    update_configuration_for_request,
+)
+from openforms.submissions.tests.factories import SubmissionFactory
 
 
 class ServiceTestCase(TestCase):
@@ -25,3 +32,58 @@ class ServiceTestCase(TestCase):
             reverse("api:submissions:temporary-file-upload")
         )
         self.assertEqual(configuration["components"][0]["url"], url)
+
+    @patch(
+        "openforms.formio.service.handle_custom_types",
+        side_effect=lambda configuration, **kwargs: configuration,
+    )
+    def test_dynamic_configuration_memoized_for_submission(self, mock_handle):
+        request = RequestFactory().get("/")
+        submission = SubmissionFactory.create()
+        configuration = {"components": [{"type": "textfield", "key": "name"}]}
+
+        dynamic_configuration = get_dynamic_configuration(
+            configuration, request=request, submission=submission
+        )
+        again = get_dynamic_configuration(
+            configuration, request=request, submission=submission
+        )
+        # the dynamic result itself is not processed again
+        from_result = get_dynamic_configuration(
+            dynamic_configuration, request=request, submission=submission
+        )
+
+        self.assertIs(again, dynamic_configuration)
+        self.assertIs(from_result, dynamic_configuration)
+        mock_handle.assert_called_once()
+
+    @patch(
+        "openforms.formio.service.handle_custom_types",
+        side_effect=lambda configuration, **kwargs: configuration,
+    )
+    def test_dynamic_configuration_memoized_by_identity(self, mock_handle):
+        request = RequestFactory().get("/")
+        submission = SubmissionFactory.create()
+        configuration = {"components": [{"type": "textfield", "key": "name"}]}
+
+        get_dynamic_configuration(configuration, request=request, submission=submission)
+        get_dynamic_configuration(
+            deepcopy(configuration), request=request, submission=submission
+        )
+
+        self.assertEqual(mock_handle.call_count, 2)
+
+    @patch(
+        "openforms.formio.service.handle_custom_types",
+        side_effect=lambda configuration, **kwargs: configuration,
+    )
+    def test_dynamic_configuration_not_shared_between_submissions(self, mock_handle):
+        request = RequestFactory().get("/")
+        configuration = {"components": [{"type": "textfield", "key": "name"}]}
+
+        for submission in SubmissionFactory.create_batch(2):
+            get_dynamic_configuration(
+                configuration, request=request, submission=submission
+            )
+
+        self.assertEqual(mock_handle.call_count, 2)
@@ -0,0 +1,93 @@
+from django.test import SimpleTestCase
+
+from ..utils import ComponentIndex, ConfigurationOverlay, get_default_values
+
+CONFIGURATION = {
+    "components": [
+        {"type": "textfield", "key": "name", "defaultValue": "John"},
+        {
+            "type": "columns",
+            "key": "columns",
+            "columns": [
+                {
+                    "components": [
+                        {"type": "file", "key": "attachment", "isSensitiveData": True},
+                    ]
+                },
+                {
+                    "components": [
+                        {
+                            "type": "email",
+                            "key": "email",
+                            "confirmationRecipient": True,
+                        },
+                    ]
+                },
+            ],
+        },
+    ]
+}
+
+
+class ComponentIndexTests(SimpleTestCase):
+    def test_lookup_nested_components(self):
+        index = ComponentIndex(CONFIGURATION)
+
+        self.assertEqual(len(index), 4)
+        self.assertEqual(index.keys(), ["name", "columns", "attachment", "email"])
+        self.assertEqual(index.get("email")["type"], "email")
+        self.assertIsNone(index.get("unknown"))
+        self.assertEqual(
+            [component["key"] for component in index.get_by_type("file")],
+            ["attachment"],
+        )
+
+    def test_flags_and_defaults(self):
+        index = ComponentIndex(CONFIGURATION)
+
+        self.assertEqual(index.get_keys_with_flag("isSensitiveData"), ["attachment"])
+        self.assertEqual(index.get_keys_with_flag("confirmationRecipient"), ["email"])
+        self.assertEqual(get_default_values(CONFIGURATION), {"name": "John"})
+
+    def test_mutations_reflected_in_configuration(self):
+        configuration = {"components": [{"type": "textfield", "key": "name"}]}
+        index = ComponentIndex(configuration)
+
+        index.get("name")["hidden"] = True
+
+        self.assertTrue(configuration["components"][0]["hidden"])
+
+
+class ConfigurationOverlayTests(SimpleTestCase):
+    def test_apply_patches_copy_on_write(self):
+        index = ComponentIndex(CONFIGURATION)
+        overlay = ConfigurationOverlay(CONFIGURATION)
+
+        overlay.set(index.get_path(index.get("email")), "hidden", True)
+        result = overlay.apply()
+
+        new_email = result["components"][1]["columns"][1]["components"][0]
+        self.assertTrue(new_email["hidden"])
+        self.assertNotIn("hidden", index.get("email"))
+        # untouched parts are shared with the base configuration
+        self.assertIs(result["components"][0], CONFIGURATION["components"][0])
+        self.assertIs(
+            result["components"][1]["columns"][0],
+            CONFIGURATION["components"][1]["columns"][0],
+        )
+
+    def test_no_patches(self):
+        overlay = ConfigurationOverlay(CONFIGURATION)
+
+        self.assertIs(overlay.apply(), CONFIGURATION)
+
+    def test_get_patched_value(self):
+        index = ComponentIndex(CONFIGURATION)
+        overlay = ConfigurationOverlay(CONFIGURATION)
+        path = index.get_path(index.get("name"))
+
+        self.assertEqual(overlay.get(path, "defaultValue"), "John")
+
+        overlay.set(path, "defaultValue", "Jane")
+
+        self.assertEqual(overlay.get(path, "defaultValue"), "Jane")
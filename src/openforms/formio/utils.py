@@ -1,4 +1,8 @@
-from typing import Any, Dict
+from copy import copy
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+# location of a component in a configuration, e.g. ``("components", 0)``
+ComponentPath = Tuple[Union[str, int], ...]
 
 
 def iter_components(configuration: dict, recursive=True) -> dict:
@@ -15,14 +19,155 @@ def iter_components(configuration: dict, recursive=True) -> dict:
                 yield from iter_components(configuration=component, recursive=recursive)
 
 
-def get_default_values(configuration: dict) -> Dict[str, Any]:
-    defaults = {}
+def iter_components_with_paths(
+    configuration: dict, recursive=True, path: ComponentPath = ()
+) -> Iterator[Tuple[ComponentPath, dict]]:
+    """
+    Like :func:`iter_components`, but also yield the path of each component.
+    """
+    components = configuration.get("components")
+    if configuration.get("type") == "columns" and recursive:
+        assert not components, "Both nested components and columns found"
+        for index, column in enumerate(configuration["columns"]):
+            yield from iter_components_with_paths(
+                configuration=column,
+                recursive=recursive,
+                path=path + ("columns", index),
+            )
+
+    if components:
+        for index, component in enumerate(components):
+            component_path = path + ("components", index)
+            yield component_path, component
+            if recursive:
+                yield from iter_components_with_paths(
+                    configuration=component, recursive=recursive, path=component_path
+                )
+
+
+class ComponentIndex:
+    """
+    Index of the (nested) components of a Formio configuration.
+
+    The configuration is walked once, after which components can be looked up by
+    key or type without iterating over the whole configuration again. The indexed
+    components are the component objects of the configuration itself, so mutations
+    through the index are reflected in the configuration. Use a
+    :class:`ConfigurationOverlay` with :meth:`get_path` to modify components without
+    touching the (possibly shared) configuration.
+    """
+
+    def __init__(self, configuration: dict):
+        self.configuration = configuration
+        self.components: List[dict] = []
+        self._paths: Dict[int, ComponentPath] = {}
+        self._by_key: Dict[str, List[dict]] = {}
+        self._by_type: Dict[str, List[dict]] = {}
+        for path, component in iter_components_with_paths(configuration):
+            self.components.append(component)
+            self._paths[id(component)] = path
+            if "key" in component:
+                self._by_key.setdefault(component["key"], []).append(component)
+            if "type" in component:
+                self._by_type.setdefault(component["type"], []).append(component)
+
+    def __iter__(self) -> Iterator[dict]:
+        return iter(self.components)
+
+    def __len__(self) -> int:
+        return len(self.components)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._by_key
+
+    def keys(self) -> List[str]:
+        return list(self._by_key)
+
+    def get(self, key: str) -> Optional[dict]:
+        """
+        Return the first component with the given key, if any.
+        """
+        components = self._by_key.get(key)
+        return components[0] if components else None
 
-    for component in iter_components(configuration, recursive=True):
-        if "key" not in component:
-            continue
-        if "defaultValue" not in component:
-            continue
-        defaults[component["key"]] = component["defaultValue"]
+    def get_all(self, key: str) -> List[dict]:
+        return self._by_key.get(key, [])
 
-    return defaults
+    def get_path(self, component: dict) -> ComponentPath:
+        return self._paths[id(component)]
+
+    def get_by_type(self, *types: str) -> List[dict]:
+        if len(types) == 1:
+            return self._by_type.get(types[0], [])
+        return [
+            component for component in self.components if component.get("type") in types
+        ]
+
+    def get_keys_with_flag(self, flag: str) -> List[str]:
+        """
+        Return the keys of the components that have a truthy ``flag`` property.
+        """
+        return [
+            component["key"] for component in self.components if component.get(flag)
+        ]
+
+    def get_default_values(self) -> Dict[str, Any]:
+        return {
+            component["key"]: component["defaultValue"]
+            for component in self.components
+            if "key" in component and "defaultValue" in component
+        }
+
+
+class ConfigurationOverlay:
+    """
+    Copy-on-write changes to a Formio configuration.
+
+    Component property changes are recorded as patches addressed by the component
+    path. The base configuration is never modified - :meth:`apply` returns a new
+    configuration in which only the patched components and their parent containers
+    are (shallow) copied, all other components are shared with the base
+    configuration.
+    """
+
+    def __init__(self, configuration: dict):
+        self.configuration = configuration
+        self.patches: Dict[ComponentPath, Dict[str, Any]] = {}
+
+    def __bool__(self) -> bool:
+        return bool(self.patches)
+
+    def set(self, path: ComponentPath, property_name: str, value: Any) -> None:
+        self.patches.setdefault(path, {})[property_name] = value
+
+    def get(self, path: ComponentPath, property_name: str, default=None) -> Any:
+        patch = self.patches.get(path, {})
+        if property_name in patch:
+            return patch[property_name]
+
+        component = self.configuration
+        for bit in path:
+            component = component[bit]
+        return component.get(property_name, default)
+
+    def apply(self) -> dict:
+        if not self.patches:
+            return self.configuration
+
+        result = copy(self.configuration)
+        copies = {(): result}
+        for path, properties in self.patches.items():
+            node = result
+            for depth in range(1, len(path) + 1):
+                node_path = path[:depth]
+                if node_path not in copies:
+                    copies[node_path] = node[path[depth - 1]] = copy(
+                        node[path[depth - 1]]
+                    )
+                node = copies[node_path]
+            node.update(properties)
+        return result
+
+
+def get_default_values(configuration: dict) -> Dict[str, Any]:
+    return ComponentIndex(configuration).get_default_values()
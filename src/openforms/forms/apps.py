@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class CoreConfig(AppConfig):
     name = "openforms.forms"
     verbose_name = "OpenForms Form App"
+
+    def ready(self):
+        # load the signal receivers
+        from . import signals  # noqa
@@ -1,3 +1,4 @@
+from copy import copy
 from typing import Any, Dict
 
 from rest_framework.request import Request
@@ -40,9 +41,10 @@ def handle_custom_types(
             rewritten_components.append(component)
             continue
 
-        # if there is a handler, invoke it
+        # if there is a handler, invoke it - with a copy, since handlers modify the
+        # component and the input configuration must be left untouched
         handler = REGISTRY[type_key]
-        rewritten_components.append(handler(component, request, submission))
+        rewritten_components.append(handler(copy(component), request, submission))
 
     return {
         "components": rewritten_components,
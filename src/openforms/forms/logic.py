@@ -0,0 +1,291 @@
+"""
+Compiled and cached form logic rules.
+
+Evaluating form logic happens on every (debounced) change in the SDK, so the rules
+of a form are loaded and prepared once and then re-used. The plain rule data is
+stored in the shared (Django) cache so that all workers benefit from it, while the
+compiled callables are kept in a bounded per-process cache.
+
+Both caches are keyed by the form and the "logic version" of that form. The version
+is bumped whenever a :class:`openforms.forms.models.FormLogic` instance of the form
+is saved or deleted, see :mod:`openforms.forms.signals`.
+
+Each rule keeps track of the (top-level) data keys it depends on, which allows
+callers to only re-evaluate the rules affected by a change in the data.
+"""
+import uuid
+from copy import deepcopy
+from dataclasses import dataclass
+from functools import lru_cache, partial
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from django.core.cache import caches
+from django.utils.functional import cached_property
+
+from json_logic import jsonLogic
+
+from .constants import LogicActionTypes
+from .models import Form, FormLogic
+
+CACHE_ALIAS = "default"
+CACHE_TIMEOUT = 60 * 60 * 24
+
+# operators that look up information in the data passed to the evaluation
+DATA_OPERATORS = ("var", "missing", "missing_some")
+
+Expression = Any
+CompiledExpression = Callable[[Dict[str, Any]], Any]
+
+
+def _references_data(expression: Expression) -> bool:
+    if isinstance(expression, (list, tuple)):
+        return any(_references_data(item) for item in expression)
+    if not isinstance(expression, dict):
+        return False
+    return any(
+        operator in DATA_OPERATORS or _references_data(values)
+        for operator, values in expression.items()
+    )
+
+
+def _get_root_key(path: Any) -> Optional[str]:
+    if not isinstance(path, str) or not path:
+        return None
+    return path.split(".")[0]
+
+
+def get_variable_references(expression: Expression) -> Optional[Set[str]]:
+    """
+    Collect the top-level data keys an expression depends on.
+
+    If the references cannot be determined statically (for example because the
+    variable name is computed or the whole data object is referenced), ``None`` is
+    returned.
+    """
+    if isinstance(expression, (list, tuple)):
+        references = set()
+        for item in expression:
+            item_references = get_variable_references(item)
+            if item_references is None:
+                return None
+            references |= item_references
+        return references
+
+    if not isinstance(expression, dict):
+        return set()
+
+    references = set()
+    for operator, values in expression.items():
+        if operator not in DATA_OPERATORS:
+            nested = get_variable_references(values)
+            if nested is None:
+                return None
+            references |= nested
+            continue
+
+        if not isinstance(values, (list, tuple)):
+            values = [values]
+        if operator == "var":
+            paths = values[:1]
+        elif operator == "missing_some":
+            paths = values[1] if len(values) == 2 else None
+        else:
+            paths = values
+
+        if not isinstance(paths, (list, tuple)) or not paths:
+            return None
+        for path in paths:
+            root_key = _get_root_key(path)
+            if root_key is None:
+                return None
+            references.add(root_key)
+
+        # default values of ``var`` may be expressions themselves
+        nested = get_variable_references(values[1:]) if operator == "var" else set()
+        if nested is None:
+            return None
+        references |= nested
+
+    return references
+
+
+def _constant(value: Any, data: Dict[str, Any]) -> Any:
+    # the result is shared between evaluations, protect it against mutations
+    return deepcopy(value) if isinstance(value, (dict, list)) else value
+
+
+def compile_expression(expression: Expression) -> CompiledExpression:
+    """
+    Turn a JSON logic expression into a callable taking the data to evaluate with.
+
+    Expressions that do not depend on the data are evaluated once, upfront.
+    """
+    if not _references_data(expression):
+        return partial(_constant, jsonLogic(expression, {}))
+    return partial(jsonLogic, expression)
+
+
+@dataclass
+class CompiledAction:
+    action: Dict[str, Any]
+    value: Optional[CompiledExpression] = None
+
+    @property
+    def type(self) -> str:
+        return self.action["action"]["type"]
+
+    @property
+    def component(self) -> str:
+        return self.action.get("component", "")
+
+
+@dataclass
+class CompiledRule:
+    pk: int
+    json_logic_trigger: Expression
+    trigger: CompiledExpression
+    actions: List[CompiledAction]
+    # ``None`` means the dependencies are unknown and the rule must always be evaluated
+    dependencies: Optional[FrozenSet[str]] = None
+
+    @classmethod
+    def from_data(cls, pk: int, json_logic_trigger: Expression, actions: list):
+        compiled_actions = []
+        dependencies = get_variable_references(json_logic_trigger)
+        for action in actions:
+            value = None
+            if action["action"]["type"] == LogicActionTypes.value:
+                value = compile_expression(action["action"]["value"])
+                value_dependencies = get_variable_references(action["action"]["value"])
+                dependencies = (
+                    dependencies | value_dependencies
+                    if dependencies is not None and value_dependencies is not None
+                    else None
+                )
+            compiled_actions.append(CompiledAction(action=action, value=value))
+
+        return cls(
+            pk=pk,
+            json_logic_trigger=json_logic_trigger,
+            trigger=compile_expression(json_logic_trigger),
+            actions=compiled_actions,
+            dependencies=frozenset(dependencies) if dependencies is not None else None,
+        )
+
+    def has_action_type(self, action_type: str) -> bool:
+        return any(action.type == action_type for action in self.actions)
+
+
+@dataclass
+class CompiledRuleSet:
+    rules: Tuple[CompiledRule, ...]
+    version: Optional[str] = None
+
+    def __iter__(self) -> Iterator[CompiledRule]:
+        return iter(self.rules)
+
+    def __len__(self) -> int:
+        return len(self.rules)
+
+    def __getitem__(self, index: int) -> CompiledRule:
+        return self.rules[index]
+
+    @cached_property
+    def dependency_index(self) -> Dict[str, FrozenSet[int]]:
+        """
+        Map each referenced data key to the primary keys of the rules using it.
+        """
+        index = {}
+        for rule in self.rules:
+            for key in rule.dependencies or ():
+                index.setdefault(key, set()).add(rule.pk)
+        return {key: frozenset(pks) for key, pks in index.items()}
+
+    @cached_property
+    def dependency_keys(self) -> FrozenSet[str]:
+        return frozenset(self.dependency_index)
+
+    @cached_property
+    def _always_evaluate(self) -> FrozenSet[int]:
+        return frozenset(rule.pk for rule in self.rules if rule.dependencies is None)
+
+    def get_affected_rules(self, changed_keys: Iterable[str]) -> FrozenSet[int]:
+        """
+        Determine which rules (by primary key) must be evaluated for the changed keys.
+        """
+        affected = set(self._always_evaluate)
+        for key in changed_keys:
+            affected |= self.dependency_index.get(key, set())
+        return frozenset(affected)
+
+
+def _get_version_key(form_id: int) -> str:
+    return f"forms:logic-version:{form_id}"
+
+
+def _get_rules_key(form_id: int, version: str) -> str:
+    return f"forms:logic-rules:{form_id}:{version}"
+
+
+def _load_rules_data(form_id: int) -> List[Tuple[int, Expression, list]]:
+    return list(
+        FormLogic.objects.filter(form_id=form_id)
+        .order_by("pk")
+        .values_list("pk", "json_logic_trigger", "actions")
+    )
+
+
+def _compile(
+    rules_data: List[Tuple[int, Expression, list]], version: Optional[str] = None
+) -> CompiledRuleSet:
+    rules = tuple(CompiledRule.from_data(*rule_data) for rule_data in rules_data)
+    return CompiledRuleSet(rules=rules, version=version)
+
+
+@lru_cache(maxsize=256)
+def _get_compiled_rules(form_id: int, version: str) -> CompiledRuleSet:
+    cache = caches[CACHE_ALIAS]
+    key = _get_rules_key(form_id, version)
+    rules_data = cache.get(key)
+    if rules_data is None:
+        rules_data = _load_rules_data(form_id)
+        cache.set(key, rules_data, timeout=CACHE_TIMEOUT)
+    return _compile(rules_data, version=version)
+
+
+def get_logic_version(form_id: int) -> Optional[str]:
+    cache = caches[CACHE_ALIAS]
+    key = _get_version_key(form_id)
+    version = cache.get(key)
+    if version is None:
+        # use add so that concurrent initializations settle on a single version
+        cache.add(key, uuid.uuid4().hex, timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def invalidate_rules(form_id: int) -> None:
+    caches[CACHE_ALIAS].set(_get_version_key(form_id), uuid.uuid4().hex, timeout=None)
+
+
+def get_rules(form: Form) -> CompiledRuleSet:
+    """
+    Retrieve the compiled logic rules of a form, in a stable order.
+    """
+    version = get_logic_version(form.pk)
+    # the cache is unavailable - do not risk serving stale rules from the process
+    # cache since invalidation cannot be communicated.
+    if version is None:
+        return _compile(_load_rules_data(form.pk))
+    return _get_compiled_rules(form.pk, version)
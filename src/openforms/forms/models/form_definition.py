@@ -14,7 +14,7 @@ from django.utils.translation import gettext_lazy as _
 
 from autoslug import AutoSlugField
 
-from openforms.formio.utils import iter_components
+from openforms.formio.utils import ComponentIndex, iter_components
 
 from ..models import Form
 from ..tasks import detect_formiojs_configuration_snake_case
@@ -125,15 +125,26 @@ class FormDefinition(models.Model):
             configuration = self.configuration
         return iter_components(configuration=configuration, recursive=recursive)
 
+    def get_component_index(self) -> ComponentIndex:
+        """
+        Return the (cached) component index of the configuration.
+
+        The index is rebuilt when a different configuration is assigned.
+        """
+        index = getattr(self, "_component_index", None)
+        if index is None or index.configuration is not self.configuration:
+            index = self._component_index = ComponentIndex(self.configuration)
+        return index
+
     def get_all_keys(self) -> List[str]:
-        keys = [field["key"] for field in self.iter_components(recursive=True)]
+        keys = [field["key"] for field in self.get_component_index()]
         return keys
 
     def get_keys_for_email_summary(self) -> List[Tuple[str, str]]:
         """Return the key and the label of fields to include in the email summary"""
         keys_for_email_summary = []
 
-        for component in self.iter_components(recursive=True):
+        for component in self.get_component_index():
             if component.get("showInEmail"):
                 keys_for_email_summary.append((component["key"], component["label"]))
 
@@ -141,23 +152,11 @@ class FormDefinition(models.Model):
 
     def get_keys_for_email_confirmation(self) -> List[Tuple[str, str]]:
         """Return the key and the label of fields to include in the confirmation email"""
-        keys_for_email_confirmation = []
-
-        for component in self.iter_components(recursive=True):
-            if component.get("confirmationRecipient"):
-                keys_for_email_confirmation.append(component["key"])
-
-        return keys_for_email_confirmation
+        return self.get_component_index().get_keys_with_flag("confirmationRecipient")
 
     @cached_property
     def sensitive_fields(self):
-        sensitive_fields = []
-
-        for component in self.iter_components(recursive=True):
-            if component.get("isSensitiveData"):
-                sensitive_fields.append(component["key"])
-
-        return sensitive_fields
+        return self.get_component_index().get_keys_with_flag("isSensitiveData")
 
     @property
     def admin_name(self):
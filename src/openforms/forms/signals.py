@@ -0,0 +1,21 @@
+from functools import partial
+
+from django.db import transaction
+from django.db.models.base import ModelBase
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .logic import invalidate_rules
+from .models import FormLogic
+
+
+@receiver(post_save, sender=FormLogic, dispatch_uid="forms.invalidate_logic_on_save")
+@receiver(
+    post_delete, sender=FormLogic, dispatch_uid="forms.invalidate_logic_on_delete"
+)
+def invalidate_form_logic_rules(
+    sender: ModelBase, instance: FormLogic, **kwargs
+) -> None:
+    invalidate_rules(instance.form_id)
+    # other processes may have cached the old rules while the transaction was open
+    transaction.on_commit(partial(invalidate_rules, instance.form_id))
@@ -0,0 +1,104 @@
+from django.test import SimpleTestCase, TestCase
+
+from openforms.submissions.tests.form_logic.factories import FormLogicFactory
+
+from ..logic import compile_expression, get_rules, get_variable_references
+from .factories import FormFactory
+
+
+class CompileExpressionTests(TestCase):
+    def test_expression_referencing_data(self):
+        trigger = compile_expression({"==": [{"var": "foo"}, "bar"]})
+
+        self.assertTrue(trigger({"foo": "bar"}))
+        self.assertFalse(trigger({"foo": "baz"}))
+
+    def test_constant_expression(self):
+        trigger = compile_expression({"==": [1, 1]})
+
+        self.assertTrue(trigger({}))
+        self.assertTrue(trigger({"foo": "bar"}))
+
+    def test_constant_results_are_not_shared(self):
+        value = compile_expression({"merge": [[1], [2]]})
+
+        result = value({})
+        result.append(3)
+
+        self.assertEqual(value({}), [1, 2])
+
+
+class VariableReferencesTests(SimpleTestCase):
+    def test_nested_references(self):
+        expression = {
+            "and": [
+                {"==": [{"var": "foo.bar"}, 1]},
+                {"in": [{"var": ["baz", {"var": "default"}]}, ["a", "b"]]},
+                {"missing": ["quux"]},
+            ]
+        }
+
+        references = get_variable_references(expression)
+
+        self.assertEqual(references, {"foo", "baz", "default", "quux"})
+
+    def test_dynamic_references(self):
+        expressions = [
+            {"var": ""},
+            {"var": {"cat": ["foo", "bar"]}},
+            {"missing_some": [1, {"merge": [["a"], {"var": "b"}]}]},
+        ]
+
+        for expression in expressions:
+            with self.subTest(expression=expression):
+                self.assertIsNone(get_variable_references(expression))
+
+
+class CachedRulesTests(TestCase):
+    def test_rules_are_cached(self):
+        form = FormFactory.create()
+        FormLogicFactory.create(form=form)
+        get_rules(form)
+
+        with self.assertNumQueries(0):
+            rules = get_rules(form)
+
+        self.assertEqual(len(rules), 1)
+
+    def test_rules_invalidated_on_save(self):
+        form = FormFactory.create()
+        rule = FormLogicFactory.create(
+            form=form, json_logic_trigger={"==": [{"var": "foo"}, 1]}
+        )
+        self.assertTrue(get_rules(form)[0].trigger({"foo": 1}))
+
+        rule.json_logic_trigger = {"==": [{"var": "foo"}, 2]}
+        rule.save()
+
+        self.assertFalse(get_rules(form)[0].trigger({"foo": 1}))
+
+    def test_rules_invalidated_on_delete(self):
+        form = FormFactory.create()
+        rule = FormLogicFactory.create(form=form)
+        self.assertEqual(len(get_rules(form)), 1)
+
+        rule.delete()
+
+        self.assertEqual(len(get_rules(form)), 0)
+
+    def test_affected_rules(self):
+        form = FormFactory.create()
+        rule1 = FormLogicFactory.create(
+            form=form, json_logic_trigger={"==": [{"var": "foo"}, 1]}
+        )
+        rule2 = FormLogicFactory.create(
+            form=form, json_logic_trigger={"==": [{"var": "bar"}, 1]}
+        )
+        rule3 = FormLogicFactory.create(
+            form=form, json_logic_trigger={"==": [{"var": ""}, 1]}
+        )
+
+        affected = get_rules(form).get_affected_rules({"bar"})
+
+        self.assertEqual(affected, {rule2.pk, rule3.pk})
+        self.assertNotIn(rule1.pk, affected)
@@ -1,11 +1,25 @@
 from django.contrib import admin
+from django.contrib.admin.views.main import ChangeList
 from django.contrib.auth.mixins import PermissionRequiredMixin
 from django.urls import path
 
 from timeline_logger.models import TimelineLog
 from timeline_logger.views import TimelineLogListView
 
-from openforms.logging.models import AVGTimelineLogProxy, TimelineLogProxy
+from openforms.logging.models import (
+    AVGTimelineLogProxy,
+    TimelineLogProxy,
+    prefetch_log_objects,
+)
+
+
+class TimelineLogChangeList(ChangeList):
+    def get_results(self, request):
+        super().get_results(request)
+        # the (generic) related objects can't be prefetched on the queryset, as they
+        # differ per log entry
+        self.result_list = list(self.result_list)
+        prefetch_log_objects(self.result_list)
 
 
 @admin.register(TimelineLogProxy)
@@ -24,6 +38,13 @@ class TimelineLogProxyAdmin(admin.ModelAdmin):
     )
     date_hierarchy = "timestamp"
 
+    def get_queryset(self, request):
+        qs = super().get_queryset(request)
+        return qs.select_related("content_type", "user")
+
+    def get_changelist(self, request, **kwargs):
+        return TimelineLogChangeList
+
     def has_add_permission(self, request):
         return False
 
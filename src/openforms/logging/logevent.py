@@ -1,7 +1,11 @@
 import logging
-from typing import TYPE_CHECKING, Optional
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, List, Optional
 
+from django.db import DatabaseError
 from django.db.models import Model
+from django.utils import timezone
 
 from openforms.logging.constants import TimelineLogTags
 from openforms.payments.constants import PaymentStatus
@@ -20,6 +24,49 @@ if TYPE_CHECKING:  # pragma: nocover
 
 logger = logging.getLogger(__name__)
 
+# log entries collected by :func:`buffered_logging`, ``None`` if not buffering
+_log_buffer: ContextVar[Optional[List[Model]]] = ContextVar(
+    "timeline_log_buffer", default=None
+)
+
+
+@contextmanager
+def buffered_logging():
+    """
+    Collect the log entries created in the block and store them with a single query.
+
+    The entries are stored when the block exits. When an exception is raised, the
+    collected entries are stored one by one instead, without hiding the original
+    exception if that fails (e.g. in a broken transaction). Nested blocks are merged
+    into the outermost block. Log entries created in other threads (e.g. the parallel
+    prefill lookups) are stored immediately.
+
+    Can be used as decorator as well, e.g. for tasks creating multiple log entries.
+    """
+    # import locally or we'll get "AppRegistryNotReady: Apps aren't loaded yet."
+    from openforms.logging.models import TimelineLogProxy
+
+    if _log_buffer.get() is not None:
+        yield
+        return
+
+    logs = []
+    token = _log_buffer.set(logs)
+    try:
+        yield
+    except Exception:
+        _log_buffer.reset(token)
+        for log in logs:
+            try:
+                log.save()
+            except DatabaseError:
+                logger.exception("Could not store the log entry %s", log.template)
+        raise
+
+    _log_buffer.reset(token)
+    if logs:
+        TimelineLogProxy.objects.insert_logs(logs)
+
 
 def _create_log(
     object: Model,
@@ -53,12 +100,17 @@ def _create_log(
         #   save it on the TimelineLogProxy model
         user = None
 
-    TimelineLogProxy.objects.create(
+    log = TimelineLogProxy(
         content_object=object,
         template=f"logging/events/{event}.txt",
         extra_data=extra_data,
         user=user,
+        timestamp=timezone.now(),
     )
+    if (buffer := _log_buffer.get()) is not None:
+        buffer.append(log)
+    else:
+        log.save()
     # logger.debug('Logged event in %s %s %s', event, object._meta.object_name, object.pk)
 
 
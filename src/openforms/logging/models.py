@@ -1,7 +1,8 @@
-from typing import List
+from typing import Iterable, List, Tuple
 
 from django.contrib.contenttypes.models import ContentType
 from django.db import models
+from django.db.models import prefetch_related_objects
 from django.template.defaultfilters import capfirst
 from django.urls import reverse
 from django.utils import timezone
@@ -15,6 +16,39 @@ from openforms.logging.constants import TimelineLogTags
 from openforms.submissions.models import Submission
 
 
+def get_prefill_attribute_labels(form: Form) -> List[Tuple[str, str]]:
+    """
+    Return the prefill attributes of the form components with the component labels.
+
+    The result is kept on the form instance, so that log entries sharing the (prefetched)
+    form only walk the form components once.
+    """
+    labels = getattr(form, "_prefill_attribute_labels", None)
+    if labels is None:
+        labels = []
+        for component in form.iter_components(recursive=True):
+            try:
+                labels.append((component["prefill"]["attribute"], component["label"]))
+            except KeyError:
+                pass
+        form._prefill_attribute_labels = labels
+    return labels
+
+
+def prefetch_log_objects(logs: Iterable["TimelineLogProxy"]) -> None:
+    """
+    Prefetch the objects used to display the log entries, in a constant number of queries.
+
+    The content objects are fetched with one query per content type, and the forms of
+    the submissions with a single query. Entries referring to the same object share
+    the instance.
+    """
+    logs = list(logs)
+    prefetch_related_objects(logs, "content_object")
+    submissions = [log.content_object for log in logs if log.is_submission]
+    prefetch_related_objects(submissions, "form")
+
+
 class TimelineLogProxyQueryset(models.QuerySet):
     def filter_event(self, event: str):
         return self.filter(extra_data__log_event=event)
@@ -25,6 +59,19 @@ class TimelineLogProxyQueryset(models.QuerySet):
     def exclude_tag(self, tag: str):
         return self.exclude(extra_data__contains={tag: True})
 
+    def insert_logs(self, logs: List["TimelineLogProxy"]) -> None:
+        """
+        Insert the (unsaved) log entries with a single query, keeping their timestamps.
+
+        :meth:`bulk_create` would overwrite the ``auto_now_add`` timestamps with the
+        time of the insert - a raw insert stores the values as set on the entries. The
+        primary keys are not set on the entries.
+        """
+        fields = [
+            field for field in self.model._meta.concrete_fields if not field.primary_key
+        ]
+        self._insert(logs, fields=fields, raw=True)
+
 
 class TimelineLogProxy(TimelineLog):
     objects = TimelineLogProxyQueryset.as_manager()
@@ -97,15 +144,12 @@ class TimelineLogProxy(TimelineLog):
 
     def get_formatted_prefill_fields(self, fields) -> List:
         formatted_fields = []
-        components = self.content_object.form.iter_components(recursive=True)
+        labels = get_prefill_attribute_labels(self.content_object.form)
 
-        for component in components:
+        for attribute, label in labels:
             for field in fields:
-                try:
-                    if component["prefill"]["attribute"] == field:
-                        formatted_fields.append(f"{component['label']} ({field})")
-                except KeyError:
-                    pass
+                if attribute == field:
+                    formatted_fields.append(f"{label} ({field})")
 
         return formatted_fields
 
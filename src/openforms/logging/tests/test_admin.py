@@ -1,8 +1,15 @@
+from unittest.mock import Mock
+
 from django.contrib.auth.models import Permission
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
-from openforms.accounts.tests.factories import StaffUserFactory
+from privates.test import temp_private_root
+
+from openforms.accounts.tests.factories import StaffUserFactory, SuperUserFactory
+from openforms.forms.tests.factories import FormFactory
 from openforms.logging import logevent
 from openforms.logging.tests.factories import TimelineLogProxyFactory
 from openforms.submissions.tests.factories import SubmissionFactory
@@ -30,3 +37,39 @@ class AVGAuditLogListViewTests(TestCase):
         self.assertEqual(response.status_code, 200)
         # one log
         self.assertEqual(response.context_data["cl"].result_count, 1)
+
+
+@temp_private_root()
+class TimelineLogListViewTests(TestCase):
+    def test_number_of_queries_independent_of_number_of_entries(self):
+        user = SuperUserFactory.create()
+        self.client.force_login(user)
+        url = reverse("admin:logging_timelinelogproxy_changelist")
+        submission = SubmissionFactory.from_components(
+            components_list=[
+                {"key": "bsn", "label": "BSN", "prefill": {"attribute": "bsn"}},
+            ]
+        )
+        form = FormFactory.create()
+        plugin = Mock(identifier="demo", verbose_name="Demo")
+
+        def create_logs():
+            logevent.submission_start(submission)
+            logevent.prefill_retrieve_success(submission, plugin, ["bsn"])
+            logevent.form_submit_success(submission)
+            logevent.submission_details_view_admin(submission, user)
+            TimelineLogProxyFactory.create(content_object=form)
+
+        create_logs()
+        with CaptureQueriesContext(connection) as few_entries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+
+        for _ in range(3):
+            create_logs()
+        with CaptureQueriesContext(connection) as many_entries:
+            response = self.client.get(url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context_data["cl"].result_count, 20)
+        self.assertEqual(len(many_entries), len(few_entries))
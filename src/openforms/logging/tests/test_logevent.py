@@ -0,0 +1,89 @@
+from datetime import datetime, timedelta
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import IntegrityError, transaction
+from django.test import TestCase
+from django.utils import timezone
+
+from freezegun import freeze_time
+
+from openforms.logging import logevent
+from openforms.logging.models import TimelineLogProxy
+from openforms.submissions.tests.factories import SubmissionFactory
+
+
+class BufferedLoggingTests(TestCase):
+    def test_logs_stored_at_once(self):
+        submission = SubmissionFactory.create()
+        # warm the content type cache
+        ContentType.objects.get_for_model(submission)
+
+        with self.assertNumQueries(1):
+            with logevent.buffered_logging():
+                logevent.submission_start(submission)
+                logevent.form_submit_success(submission)
+
+        logs = TimelineLogProxy.objects.order_by("pk")
+        self.assertEqual(
+            [log.extra_data["log_event"] for log in logs],
+            ["submission_start", "form_submit_success"],
+        )
+        self.assertEqual(logs[0].content_object, submission)
+
+    def test_logs_keep_event_time(self):
+        submission = SubmissionFactory.create()
+
+        with freeze_time("2022-02-01T12:00:00Z") as frozen_time:
+            with logevent.buffered_logging():
+                logevent.submission_start(submission)
+                frozen_time.tick(delta=timedelta(seconds=5))
+                logevent.form_submit_success(submission)
+                frozen_time.tick(delta=timedelta(seconds=5))
+
+        logs = TimelineLogProxy.objects.order_by("pk")
+        self.assertEqual(
+            [log.timestamp for log in logs],
+            [
+                datetime(2022, 2, 1, 12, 0, 0, tzinfo=timezone.utc),
+                datetime(2022, 2, 1, 12, 0, 5, tzinfo=timezone.utc),
+            ],
+        )
+
+    def test_nested_blocks_merged(self):
+        submission = SubmissionFactory.create()
+
+        with logevent.buffered_logging():
+            with logevent.buffered_logging():
+                logevent.submission_start(submission)
+
+            self.assertFalse(TimelineLogProxy.objects.exists())
+
+        self.assertEqual(TimelineLogProxy.objects.count(), 1)
+
+    def test_logs_stored_on_exception(self):
+        submission = SubmissionFactory.create()
+
+        with self.assertRaises(ValueError):
+            with logevent.buffered_logging():
+                logevent.submission_start(submission)
+                raise ValueError("oops")
+
+        self.assertEqual(TimelineLogProxy.objects.count(), 1)
+
+    def test_original_exception_not_hidden_in_broken_transaction(self):
+        submission = SubmissionFactory.create()
+
+        with self.assertRaises(IntegrityError):
+            with transaction.atomic():
+                with logevent.buffered_logging():
+                    logevent.submission_start(submission)
+                    SubmissionFactory.create(uuid=submission.uuid)
+
+        self.assertFalse(TimelineLogProxy.objects.exists())
+
+    def test_logs_stored_immediately_without_buffering(self):
+        submission = SubmissionFactory.create()
+
+        logevent.submission_start(submission)
+
+        self.assertEqual(TimelineLogProxy.objects.count(), 1)
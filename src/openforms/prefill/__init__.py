@@ -28,7 +28,6 @@ So, to recap:
 """
 import logging
 from collections import defaultdict
-from copy import deepcopy
 from datetime import date, datetime
 from itertools import groupby
 from typing import TYPE_CHECKING, Any, Dict, List, Tuple
@@ -36,10 +35,13 @@ from typing import TYPE_CHECKING, Any, Dict, List, Tuple
 from glom import GlomError, Path, assign, glom
 from zgw_consumers.concurrent import parallel
 
+from openforms.formio.utils import ComponentPath, ConfigurationOverlay
 from openforms.logging import logevent
 from openforms.plugins.exceptions import PluginNotEnabled
 from openforms.typing import JSONObject
 
+from .cache import get_or_fetch
+
 if TYPE_CHECKING:  # pragma: nocover
     from openforms.submissions.models import Submission
 
@@ -64,10 +66,11 @@ def apply_prefill(configuration: JSONObject, submission: "Submission", register=
     :param register: A :class:`openforms.prefill.registry.Registry` instance, holding
       the registered plugins. Defaults to the default registry, but can be specified for
       dependency injection purposes in tests.
-    :return: Returns a mutated copy of the configuration, where components
-      ``defaultValue`` is set to the value from prefill plugins where possible. If the
+    :return: Returns a copy of the configuration, where components ``defaultValue``
+      is set to the value from prefill plugins where possible. If the
       ``defaultValue`` was set through the form builder, it may be overridden by the
-      prefill plugin value (if it's not ``None``).
+      prefill plugin value (if it's not ``None``). Only the prefilled components are
+      copied, the other components are shared with the input configuration.
     """
     from .registry import register as default_register
 
@@ -79,9 +82,9 @@ def apply_prefill(configuration: JSONObject, submission: "Submission", register=
     results = _fetch_prefill_values_cached(grouped_fields, submission, register)
 
     # finally, ensure the ``defaultValue`` is set based on prefill results
-    config_copy = deepcopy(configuration)
-    _set_default_values(config_copy, results)
-    return config_copy
+    overlay = ConfigurationOverlay(configuration)
+    _set_default_values(overlay, configuration, results)
+    return overlay.apply()
 
 
 def _fetch_prefill_values_cached(
@@ -153,7 +156,7 @@ def _fetch_prefill_values(
             raise PluginNotEnabled()
 
         try:
-            values = plugin.get_prefill_values(submission, fields)
+            values = _get_prefill_values(plugin, submission, fields)
         except Exception as e:
             logger.exception(f"exception in prefill plugin '{plugin_id}'")
             logevent.prefill_retrieve_failure(submission, plugin, e)
@@ -168,6 +171,18 @@ def _fetch_prefill_values(
     return dict(results)
 
 
+def _get_prefill_values(plugin, submission: "Submission", fields: List[str]):
+    # only values of authenticated users can be shared between submissions
+    identifier = getattr(submission, plugin.requires_auth or "", "")
+    if not identifier:
+        return plugin.get_prefill_values(submission, fields)
+
+    return get_or_fetch(
+        (plugin.identifier, plugin.requires_auth, identifier, sorted(fields)),
+        lambda: plugin.get_prefill_values(submission, fields),
+    )
+
+
 def _extract_prefill_fields(configuration: JSONObject) -> List[Dict[str, str]]:
     prefills = []
     components = configuration.get("components", [])
@@ -212,15 +227,20 @@ def format_date_value(date_value: str) -> str:
 
 
 def _set_default_values(
-    configuration: JSONObject, prefilled_values: Dict[str, Dict[str, Any]]
+    overlay: ConfigurationOverlay,
+    configuration: JSONObject,
+    prefilled_values: Dict[str, Dict[str, Any]],
+    path: ComponentPath = (),
 ) -> None:
     """
-    Mutates each component found in configuration according to the prefilled values.
+    Record the default value of each component according to the prefilled values.
 
+    :param overlay: The overlay collecting the changes to the entire form configuration.
     :param configuration: The Formiojs JSON schema describing an entire form or an
       individual component within the form.
     :param prefilled_values: A dict keyed by plugin ID, with values a dict keyed by the
       attribute ID. The value of each attribute key is the prefill value as retrieved.
+    :param path: The location of ``configuration`` in the entire form configuration.
 
     This function recurses to deal with the nested component structure. Each component
     is inspected for prefill configuration, which is then looked up in
@@ -243,10 +263,12 @@ def _set_default_values(
                 "Overwriting non-null default value for component %s",
                 configuration["id"],
             )
-        configuration["defaultValue"] = prefill_value
         if configuration["type"] == "date":
-            configuration["defaultValue"] = format_date_value(prefill_value)
+            prefill_value = format_date_value(prefill_value)
+        overlay.set(path, "defaultValue", prefill_value)
 
     if components := configuration.get("components"):
-        for component in components:
-            _set_default_values(component, prefilled_values)
+        for index, component in enumerate(components):
+            _set_default_values(
+                overlay, component, prefilled_values, path + ("components", index)
+            )
@@ -0,0 +1,86 @@
+"""
+Shared cache of the values retrieved by the prefill plugins.
+
+Prefill plugins consult personal records registries, which are slow and often billed
+per request. Without this cache, every new submission of the same person (and every
+co-sign lookup) queries the registry again, even if the same data was retrieved
+moments before.
+
+The cache is opt-in through the ``PREFILL_CACHE_TIMEOUT`` setting. Since the values
+are personal data, they are encrypted before they are stored and the cache keys do
+not contain the identifiers (BSN, KvK number...) themselves. Concurrent lookups of
+the same values are coalesced, so only one request is sent to the registry.
+"""
+import base64
+import hashlib
+import hmac
+import json
+from functools import lru_cache
+from typing import Any, Callable
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.serializers.json import DjangoJSONEncoder
+
+from cryptography.fernet import Fernet, InvalidToken
+
+from openforms.utils.cache import get_or_compute
+
+CACHE_ALIAS = "default"
+
+
+class _NotCacheable(Exception):
+    def __init__(self, value: Any):
+        self.value = value
+
+
+@lru_cache(maxsize=1)
+def _get_fernet(secret_key: str) -> Fernet:
+    key = hashlib.sha256(f"openforms.prefill.cache:{secret_key}".encode()).digest()
+    return Fernet(base64.urlsafe_b64encode(key))
+
+
+def _get_cache_key(*bits) -> str:
+    message = json.dumps(bits, cls=DjangoJSONEncoder).encode("utf-8")
+    digest = hmac.new(
+        settings.SECRET_KEY.encode("utf-8"), message, hashlib.sha256
+    ).hexdigest()
+    return f"prefill:values:{digest}"
+
+
+def get_or_fetch(bits: tuple, fetch: Callable[[], Any]) -> Any:
+    """
+    Look up the (encrypted) prefill values identified by ``bits`` in the cache.
+
+    On a miss, ``fetch`` is called to retrieve the values. Empty results are not
+    cached, as they are typically the result of (temporary) errors.
+
+    :param bits: the JSON-serializable bits identifying the values, e.g. the plugin,
+      the BSN and the requested attributes.
+    :param fetch: callable without arguments retrieving the values from the backend.
+    """
+    timeout = settings.PREFILL_CACHE_TIMEOUT
+    if not timeout:
+        return fetch()
+
+    fernet = _get_fernet(settings.SECRET_KEY)
+
+    def fetch_encrypted() -> bytes:
+        value = fetch()
+        if not value:
+            raise _NotCacheable(value)
+        serialized = json.dumps(value, cls=DjangoJSONEncoder)
+        return fernet.encrypt(serialized.encode("utf-8"))
+
+    try:
+        token = get_or_compute(
+            caches[CACHE_ALIAS], _get_cache_key(*bits), fetch_encrypted, timeout
+        )
+    except _NotCacheable as exc:
+        return exc.value
+
+    try:
+        return json.loads(fernet.decrypt(token))
+    except InvalidToken:
+        # e.g. the secret key was rotated
+        return fetch()
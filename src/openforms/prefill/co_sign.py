@@ -12,6 +12,7 @@ from typing import Optional
 from openforms.authentication.constants import AuthAttribute
 from openforms.submissions.models import Submission
 
+from .cache import get_or_fetch
 from .models import PrefillConfig
 from .registry import register
 
@@ -51,8 +52,10 @@ def add_co_sign_representation(submission: Submission, auth_attribute: str):
         plugin,
     )
 
-    values, representation = plugin.get_co_sign_values(
-        submission.co_sign_data["identifier"]
+    identifier = submission.co_sign_data["identifier"]
+    values, representation = get_or_fetch(
+        (default_plugin, "co-sign", auth_attribute, identifier),
+        lambda: plugin.get_co_sign_values(identifier),
     )
     submission.co_sign_data["fields"] = values
     submission.co_sign_data["representation"] = representation
@@ -0,0 +1,97 @@
+from unittest.mock import patch
+
+from django.core.cache import caches
+from django.test import TransactionTestCase, override_settings
+
+from openforms.authentication.constants import AuthAttribute
+from openforms.forms.tests.factories import FormStepFactory
+from openforms.submissions.tests.factories import SubmissionFactory
+
+from .. import apply_prefill
+from ..base import BasePlugin
+from ..registry import Registry
+
+register = Registry()
+
+
+@register("bsn-plugin")
+class BSNPlugin(BasePlugin):
+    requires_auth = AuthAttribute.bsn
+
+    def get_available_attributes(self):
+        return [("name", "Name")]
+
+    def get_prefill_values(self, submission, attributes):
+        return {"name": f"Person {submission.bsn}"}
+
+
+CONFIGURATION = {
+    "components": [
+        {
+            "type": "textfield",
+            "key": "name",
+            "prefill": {"plugin": "bsn-plugin", "attribute": "name"},
+        }
+    ]
+}
+
+
+@override_settings(PREFILL_CACHE_TIMEOUT=60)
+class PrefillCacheTests(TransactionTestCase):
+    def setUp(self):
+        super().setUp()
+        caches["default"].clear()
+        self.addCleanup(caches["default"].clear)
+
+        self.form_step = FormStepFactory.create(
+            form_definition__configuration=CONFIGURATION
+        )
+
+    def _prefill(self, submission):
+        configuration = apply_prefill(
+            configuration=CONFIGURATION, submission=submission, register=register
+        )
+        return configuration["components"][0]["defaultValue"]
+
+    @patch.object(BSNPlugin, "get_prefill_values", autospec=True)
+    def test_values_shared_between_submissions_of_same_person(self, mock_get):
+        mock_get.return_value = {"name": "Jane"}
+        submissions = SubmissionFactory.create_batch(
+            3, form=self.form_step.form, bsn="111222333"
+        )
+
+        values = [self._prefill(submission) for submission in submissions]
+
+        self.assertEqual(values, ["Jane", "Jane", "Jane"])
+        mock_get.assert_called_once()
+
+    def test_values_not_shared_between_persons(self):
+        submission_1 = SubmissionFactory.create(form=self.form_step.form, bsn="111")
+        submission_2 = SubmissionFactory.create(form=self.form_step.form, bsn="222")
+
+        self.assertEqual(self._prefill(submission_1), "Person 111")
+        self.assertEqual(self._prefill(submission_2), "Person 222")
+
+    def test_values_are_not_stored_in_plain_text(self):
+        submission = SubmissionFactory.create(form=self.form_step.form, bsn="111222333")
+
+        self._prefill(submission)
+
+        cache = caches["default"]
+        for key in cache._cache:
+            with self.subTest(key=key):
+                self.assertNotIn("111222333", key)
+                self.assertNotIn(b"Person", cache._cache[key])
+
+    @override_settings(PREFILL_CACHE_TIMEOUT=0)
+    @patch.object(BSNPlugin, "get_prefill_values", autospec=True)
+    def test_cache_disabled(self, mock_get):
+        mock_get.return_value = {"name": "Jane"}
+        submissions = SubmissionFactory.create_batch(
+            2, form=self.form_step.form, bsn="111222333"
+        )
+
+        for submission in submissions:
+            self._prefill(submission)
+
+        self.assertEqual(mock_get.call_count, 2)
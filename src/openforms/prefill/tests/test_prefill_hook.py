@@ -106,6 +106,21 @@ class PrefillHookTests(TransactionTestCase):
         self.assertIsNotNone(field["defaultValue"])
         self.assertIsInstance(field["defaultValue"], str)
 
+    def test_input_configuration_not_modified(self):
+        configuration = deepcopy(CONFIGURATION)
+        form_step = FormStepFactory.create(form_definition__configuration=configuration)
+        submission = SubmissionFactory.create(form=form_step.form)
+
+        new_configuration = apply_prefill(
+            configuration=configuration,
+            submission=submission,
+            register=register,
+        )
+
+        self.assertEqual(configuration, CONFIGURATION)
+        self.assertIsNot(new_configuration, configuration)
+        self.assertIsNotNone(new_configuration["components"][0]["defaultValue"])
+
     def test_complex_components(self):
         complex_configuration = {
             "display": "form",
@@ -4,7 +4,7 @@ from django.urls import reverse
 from django.utils.text import slugify
 from django.utils.translation import gettext_lazy as _
 
-from openforms.contrib.microsoft.client import MSGraphClient, MSGraphUploadHelper
+from openforms.contrib.microsoft.client import MSGraphClient, get_upload_helper
 from openforms.contrib.microsoft.exceptions import MSAuthenticationError
 from openforms.plugins.exceptions import InvalidPluginConfiguration
 from openforms.registrations.contrib.microsoft_graph.models import (
@@ -33,8 +33,7 @@ class MSGraphRegistration(BasePlugin):
         if not config.service:
             raise RegistrationFailed("No service configured.")
 
-        client = MSGraphClient(config.service)
-        uploader = MSGraphUploadHelper(client)
+        uploader = get_upload_helper(config.service)
 
         folder_name = self._get_folder_name(submission)
 
@@ -46,6 +45,8 @@ class MSGraphRegistration(BasePlugin):
         data = submission.get_merged_data()
         uploader.upload_json(data, f"{folder_name}/data.json")
 
+        # the uploads are not done concurrently - the (cached) client, its session and
+        # token handling are shared and not thread-safe
         for attachment in submission.attachments.all():
             uploader.upload_django_file(
                 attachment.content, f"{folder_name}/attachments/{attachment.file_name}"
@@ -58,8 +59,7 @@ class MSGraphRegistration(BasePlugin):
 
     def update_payment_status(self, submission: "Submission", options: dict):
         config = MSGraphRegistrationConfig.get_solo()
-        client = MSGraphClient(config.service)
-        uploader = MSGraphUploadHelper(client)
+        uploader = get_upload_helper(config.service)
 
         folder_name = self._get_folder_name(submission)
         self._set_payment(uploader, submission, folder_name)
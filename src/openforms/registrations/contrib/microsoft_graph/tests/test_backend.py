@@ -8,6 +8,7 @@ from O365 import Account
 from O365.drive import Drive
 from privates.test import temp_private_root
 
+from openforms.contrib.microsoft.client import _get_cached_client
 from openforms.contrib.microsoft.tests.factories import MSGraphServiceFactory
 from openforms.payments.constants import PaymentStatus
 from openforms.payments.tests.factories import SubmissionPaymentFactory
@@ -41,6 +42,11 @@ class MSGraphRegistrationBackendTests(TestCase):
         config.service = MSGraphServiceFactory.create()
         config.save()
 
+    def setUp(self):
+        super().setUp()
+        _get_cached_client.cache_clear()
+        self.addCleanup(_get_cached_client.cache_clear)
+
     @patch.object(MockFolder, "upload_file", return_value=None)
     def test_submission(self, upload_mock):
         data = {"foo": "bar", "some_list": ["value1", "value2"]}
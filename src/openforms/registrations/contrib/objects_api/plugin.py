@@ -23,6 +23,7 @@ from ...base import BasePlugin
 from ...constants import REGISTRATION_ATTRIBUTE, RegistrationAttribute
 from ...exceptions import NoSubmissionReference
 from ...registry import register
+from ...uploads import upload_concurrently
 from .checks import check_config
 from .config import ObjectsAPIOptionsSerializer
 from .models import ObjectsAPIConfig
@@ -72,15 +73,20 @@ class ObjectsAPIRegistration(BasePlugin):
         attachment_options["informatieobjecttype"] = options[
             "informatieobjecttype_attachment"
         ]
-        attachments = []
-        for attachment in submission.attachments:
+        # resolve the configuration upfront, the uploads run in worker threads
+        drc_service = config.drc_service
+        form_name = submission.form.admin_name
+
+        def upload_attachment(attachment) -> str:
             attachment_document = create_attachment_document(
-                submission.form.admin_name,
+                form_name,
                 attachment,
                 attachment_options,
-                get_drc=get_drc,
+                get_drc=lambda: drc_service,
             )
-            attachments.append(attachment_document["url"])
+            return attachment_document["url"]
+
+        attachments = upload_concurrently(upload_attachment, submission.attachments)
 
         objects_client = config.objects_service.build_client()
 
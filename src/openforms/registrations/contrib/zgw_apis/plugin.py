@@ -5,6 +5,7 @@ from django.utils.translation import gettext_lazy as _
 
 from rest_framework import serializers
 from zgw_consumers.api_models.constants import VertrouwelijkheidsAanduidingen
+from zgw_consumers.models import Service
 
 from openforms.submissions.mapping import SKIP, FieldConf, apply_data_mapping
 from openforms.submissions.models import Submission, SubmissionReport
@@ -14,6 +15,7 @@ from openforms.utils.validators import validate_rsin
 from ...base import BasePlugin
 from ...constants import REGISTRATION_ATTRIBUTE, RegistrationAttribute
 from ...registry import register
+from ...uploads import upload_concurrently
 from .checks import check_config
 from .models import ZgwConfig
 from .service import (
@@ -112,11 +114,18 @@ class ZGWRegistration(BasePlugin):
         # for now create generic status
         status = create_status(zaak)
 
-        for attachment in submission.attachments:
-            attachment = create_attachment_document(
-                submission.form.admin_name, attachment, options
+        # resolve the configuration upfront, the uploads run in worker threads
+        drc_service = zgw.drc_service
+        zrc_client = Service.get_client(zaak["url"])
+        form_name = submission.form.admin_name
+
+        def upload_attachment(attachment):
+            document = create_attachment_document(
+                form_name, attachment, options, get_drc=lambda: drc_service
             )
-            relate_document(zaak["url"], attachment["url"])
+            relate_document(zaak["url"], document["url"], client=zrc_client)
+
+        upload_concurrently(upload_attachment, submission.attachments)
 
         result = {
             "zaak": zaak,
@@ -1,15 +1,19 @@
 import logging
-from base64 import b64encode
 from datetime import date
 from typing import Optional
 
+from django.core.files import File
+from django.core.files.base import ContentFile
 from django.utils import timezone
 
+from zgw_consumers.client import ZGWClient
 from zgw_consumers.models import Service
 
 from openforms.registrations.contrib.zgw_apis.models import ZgwConfig
 from openforms.submissions.models import SubmissionFileAttachment, SubmissionReport
 
+from .streaming import create_with_content
+
 logger = logging.getLogger(__name__)
 
 
@@ -69,7 +73,7 @@ def set_zaak_payment(zaak_url: str, partial: bool = False) -> dict:
 
 def create_document(
     name: str,
-    base64_body: str,
+    content: File,
     options: dict,
     get_drc=default_get_drc,
 ) -> dict:
@@ -84,7 +88,6 @@ def create_document(
         "auteur": options["author"],
         "taal": options["language"],
         "formaat": options["format"],
-        "inhoud": base64_body,
         "status": options["status"],
         "bestandsnaam": options["filename"],
         "beschrijving": options["description"],
@@ -93,7 +96,9 @@ def create_document(
     if "vertrouwelijkheidaanduiding" in options:
         data["vertrouwelijkheidaanduiding"] = options["vertrouwelijkheidaanduiding"]
 
-    informatieobject = client.create("enkelvoudiginformatieobject", data)
+    informatieobject = create_with_content(
+        client, "enkelvoudiginformatieobject", data, content
+    )
     return informatieobject
 
 
@@ -103,9 +108,6 @@ def create_report_document(
     options: dict,
     get_drc=default_get_drc,
 ) -> dict:
-    submission_report.content.seek(0)
-    base64_body = b64encode(submission_report.content.read()).decode()
-
     document_options = {
         "author": "open-forms",
         "language": "nld",
@@ -117,7 +119,7 @@ def create_report_document(
 
     options = {**options, **document_options}
 
-    return create_document(name, base64_body, options, get_drc=get_drc)
+    return create_document(name, submission_report.content, options, get_drc=get_drc)
 
 
 def create_csv_document(
@@ -126,8 +128,6 @@ def create_csv_document(
     options: dict,
     get_drc=default_get_drc,
 ) -> dict:
-    base64_body = b64encode(csv_data.encode()).decode()
-
     document_options = {
         "author": "open-forms",
         "language": "nld",
@@ -139,7 +139,9 @@ def create_csv_document(
 
     options = {**options, **document_options}
 
-    return create_document(name, base64_body, options, get_drc=get_drc)
+    return create_document(
+        name, ContentFile(csv_data.encode()), options, get_drc=get_drc
+    )
 
 
 def create_attachment_document(
@@ -148,12 +150,6 @@ def create_attachment_document(
     options: dict,
     get_drc=default_get_drc,
 ) -> dict:
-    client = get_drc().build_client()
-    today = date.today().isoformat()
-
-    submission_attachment.content.seek(0)
-    base64_body = b64encode(submission_attachment.content.read()).decode()
-
     document_options = {
         "author": "open-forms",
         "language": "nld",
@@ -165,11 +161,16 @@ def create_attachment_document(
 
     options = {**options, **document_options}
 
-    return create_document(name, base64_body, options, get_drc=get_drc)
+    return create_document(
+        name, submission_attachment.content, options, get_drc=get_drc
+    )
 
 
-def relate_document(zaak_url: str, document_url: str) -> dict:
-    client = Service.get_client(zaak_url)
+def relate_document(
+    zaak_url: str, document_url: str, client: Optional[ZGWClient] = None
+) -> dict:
+    if client is None:
+        client = Service.get_client(zaak_url)
     data = {"zaak": zaak_url, "informatieobject": document_url}
 
     zio = client.create("zaakinformatieobject", data)
@@ -0,0 +1,172 @@
+"""
+Streaming uploads of document content to the Documenten API.
+
+The Documenten API expects the content of a document base64 encoded in the JSON
+body of the request. Building this body in memory takes well over twice the size of
+the file, for every upload. For large files, the body is produced while it is being
+sent instead: the file is read and encoded in chunks, so only a single chunk is kept
+in memory at a time.
+"""
+import json
+import math
+import uuid
+from base64 import b64encode
+from typing import Iterator
+
+from django.core.files import File
+
+import requests
+from requests.structures import CaseInsensitiveDict
+from zds_client import Client, ClientError
+from zds_client.schema import get_headers, get_operation_url
+
+# files smaller than this (in bytes) are sent as a regular JSON body
+STREAMING_THRESHOLD = 1024 * 1024
+# the number of bytes read at a time
+READ_CHUNK_SIZE = 3 * 64 * 1024
+
+
+class Base64JSONBody:
+    """
+    Readable JSON request body with the base64 encoded content of a file as value of
+    one of its attributes.
+
+    The length of the body is known upfront, so that ``requests`` sends it with a
+    ``Content-Length`` header rather than with chunked transfer encoding.
+    """
+
+    def __init__(self, data: dict, field: str, content: File):
+        self.data = data
+        self.field = field
+        self.content = content
+        self.content_size = content.size
+
+        placeholder = uuid.uuid4().hex
+        document = json.dumps({**data, field: placeholder})
+        prefix, suffix = document.split(placeholder)
+        self._prefix = prefix.encode("utf-8")
+        self._suffix = suffix.encode("utf-8")
+
+        self._length = (
+            len(self._prefix) + 4 * math.ceil(self.content_size / 3) + len(self._suffix)
+        )
+        self._chunks = self._iter_chunks()
+        self._buffer = b""
+        self._position = 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator[bytes]:
+        while chunk := self.read(READ_CHUNK_SIZE):
+            yield chunk
+
+    def summary(self) -> dict:
+        """
+        Describe the body without the encoded content, e.g. for request logs.
+        """
+        return {
+            **self.data,
+            self.field: f"<{self.content_size} bytes, base64 encoded>",
+        }
+
+    def _iter_chunks(self) -> Iterator[bytes]:
+        yield self._prefix
+        self.content.seek(0)
+        # reads may return fewer bytes than requested - only a multiple of 3 bytes is
+        # encoded at a time, so that the encoded chunks can be concatenated without
+        # padding in between. The remainder is carried over to the next read.
+        remainder = b""
+        while chunk := self.content.read(READ_CHUNK_SIZE):
+            chunk = remainder + chunk
+            cutoff = len(chunk) - len(chunk) % 3
+            chunk, remainder = chunk[:cutoff], chunk[cutoff:]
+            if chunk:
+                yield b64encode(chunk)
+        if remainder:
+            yield b64encode(remainder)
+        yield self._suffix
+
+    def tell(self) -> int:
+        return self._position
+
+    def read(self, size: int = -1) -> bytes:
+        while size < 0 or len(self._buffer) < size:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            self._buffer += chunk
+
+        if size < 0:
+            data, self._buffer = self._buffer, b""
+        else:
+            data, self._buffer = self._buffer[:size], self._buffer[size:]
+        self._position += len(data)
+        return data
+
+
+def _post_streaming(
+    client: Client, url: str, operation_id: str, body: Base64JSONBody
+) -> dict:
+    """
+    Send a streamed request body, like :meth:`zds_client.Client.request` does.
+
+    The zds client keeps a deep copy of every request body in its request log, which
+    would read the entire file into memory again - a summary is logged instead.
+    """
+    headers = CaseInsensitiveDict(
+        {"Accept": "application/json", "Content-Type": "application/json"}
+    )
+    for header, value in get_headers(client.schema, operation_id).items():
+        headers.setdefault(header, value)
+    if client.auth:
+        headers.update(client.auth.credentials())
+
+    pre_id = client.pre_request("POST", url, headers=headers, data=body)
+    response = requests.post(url, headers=headers, data=body)
+    try:
+        response_json = response.json()
+    except Exception:
+        response_json = None
+    client.post_response(pre_id, response_json)
+
+    client._log.add(
+        client.service,
+        url,
+        "POST",
+        dict(headers),
+        body.summary(),
+        response.status_code,
+        dict(response.headers),
+        response_json,
+    )
+
+    try:
+        response.raise_for_status()
+    except requests.HTTPError as exc:
+        if response.status_code >= 500:
+            raise
+        raise ClientError(response_json) from exc
+
+    assert response.status_code == 201, response_json
+    return response_json
+
+
+def create_with_content(
+    client: Client, resource: str, data: dict, content: File, field: str = "inhoud"
+) -> dict:
+    """
+    Create the resource with the base64 encoded ``content`` as value of ``field``.
+
+    Large files are streamed, see :class:`Base64JSONBody`.
+    """
+    if content.size < STREAMING_THRESHOLD:
+        content.seek(0)
+        body = {**data, field: b64encode(content.read()).decode()}
+        return client.create(resource, body)
+
+    operation_id = f"{resource}{client.operation_suffix_mapping['create']}"
+    url = get_operation_url(client.schema, operation_id, base_url=client.base_url)
+    return _post_streaming(
+        client, url, operation_id, Base64JSONBody(data, field, content)
+    )
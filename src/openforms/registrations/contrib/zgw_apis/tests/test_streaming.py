@@ -0,0 +1,159 @@
+import io
+import json
+from base64 import b64decode
+from unittest.mock import patch
+
+from django.core.files import File
+from django.core.files.base import ContentFile
+from django.test import SimpleTestCase, TestCase
+
+import requests_mock
+from zds_client import ClientError
+from zds_client.log import Log
+from zds_client.oas import schema_fetcher
+from zgw_consumers.test import generate_oas_component
+from zgw_consumers.test.schema_mock import mock_service_oas_get
+
+from ..service import create_document
+from ..streaming import Base64JSONBody
+from .factories import ZgwConfigFactory
+
+
+class ShortReadsIO(io.BytesIO):
+    """
+    Return fewer bytes than requested, like reads from a socket or pipe may do.
+    """
+
+    def read(self, size=-1):
+        return super().read(7)
+
+
+class Base64JSONBodyTests(SimpleTestCase):
+    def test_body_is_json_with_encoded_content(self):
+        for size in (0, 1, 2, 3, 100, 3 * 64 * 1024 + 1):
+            content = bytes(range(256)) * (size // 256) + bytes(range(size % 256))
+            with self.subTest(size=size):
+                body = Base64JSONBody(
+                    {"titel": "bijlage"}, "inhoud", ContentFile(content)
+                )
+
+                data = body.read()
+
+                self.assertEqual(len(data), len(body))
+                self.assertEqual(body.tell(), len(body))
+                document = json.loads(data)
+                self.assertEqual(document["titel"], "bijlage")
+                self.assertEqual(b64decode(document["inhoud"]), content)
+
+    def test_short_reads(self):
+        content = bytes(range(256)) * 10
+        body = Base64JSONBody(
+            {"titel": "bijlage"}, "inhoud", File(ShortReadsIO(content))
+        )
+
+        data = body.read()
+
+        self.assertEqual(len(data), len(body))
+        document = json.loads(data)
+        self.assertEqual(b64decode(document["inhoud"]), content)
+
+    def test_read_in_chunks(self):
+        body = Base64JSONBody({"titel": "bijlage"}, "inhoud", ContentFile(b"a" * 1000))
+
+        chunks = list(iter(lambda: body.read(100), b""))
+
+        self.assertTrue(all(len(chunk) == 100 for chunk in chunks[:-1]))
+        document = json.loads(b"".join(chunks))
+        self.assertEqual(b64decode(document["inhoud"]), b"a" * 1000)
+
+
+@requests_mock.Mocker()
+class CreateDocumentTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        config = ZgwConfigFactory.create(
+            drc_service__api_root="https://documenten.nl/api/v1/",
+        )
+        self.get_drc = lambda: config.drc_service
+        self.options = {
+            "informatieobjecttype": "https://catalogi.nl/api/v1/informatieobjecttypen/1",
+            "organisatie_rsin": "000000000",
+            "author": "open-forms",
+            "language": "nld",
+            "format": "application/pdf",
+            "status": "definitief",
+            "filename": "open-forms-inzending.pdf",
+            "description": "Ingezonden formulier",
+        }
+        schema_fetcher.cache.clear()
+        self.addCleanup(schema_fetcher.cache.clear)
+        Log.clear()
+        self.addCleanup(Log.clear)
+
+    def _install_mocks(self, m):
+        mock_service_oas_get(m, "https://documenten.nl/api/v1/", "documenten")
+        m.post(
+            "https://documenten.nl/api/v1/enkelvoudiginformatieobjecten",
+            status_code=201,
+            json=generate_oas_component(
+                "documenten",
+                "schemas/EnkelvoudigInformatieObject",
+                url="https://documenten.nl/api/v1/enkelvoudiginformatieobjecten/1",
+            ),
+        )
+
+    def test_small_document_sent_as_json(self, m):
+        self._install_mocks(m)
+
+        create_document(
+            "inzending", ContentFile(b"%PDF"), self.options, get_drc=self.get_drc
+        )
+
+        body = m.last_request.json()
+        self.assertEqual(b64decode(body["inhoud"]), b"%PDF")
+
+    @patch("openforms.registrations.contrib.zgw_apis.streaming.STREAMING_THRESHOLD", 0)
+    def test_large_document_streamed(self, m):
+        self._install_mocks(m)
+
+        create_document(
+            "inzending", ContentFile(b"%PDF"), self.options, get_drc=self.get_drc
+        )
+
+        request_body = m.last_request.body
+        self.assertIsInstance(request_body, Base64JSONBody)
+        body = json.loads(request_body.read())
+        self.assertEqual(body["bestandsnaam"], "open-forms-inzending.pdf")
+        self.assertEqual(b64decode(body["inhoud"]), b"%PDF")
+        self.assertEqual(
+            m.last_request.headers["Content-Length"], str(len(request_body))
+        )
+
+    @patch("openforms.registrations.contrib.zgw_apis.streaming.STREAMING_THRESHOLD", 0)
+    def test_streamed_request_logged_as_summary(self, m):
+        self._install_mocks(m)
+
+        create_document(
+            "inzending", ContentFile(b"%PDF"), self.options, get_drc=self.get_drc
+        )
+
+        entry = Log.entries()[-1]
+        self.assertEqual(entry["request"]["method"], "POST")
+        self.assertEqual(
+            entry["request"]["data"]["inhoud"], "<4 bytes, base64 encoded>"
+        )
+        self.assertEqual(entry["response"]["status"], 201)
+
+    @patch("openforms.registrations.contrib.zgw_apis.streaming.STREAMING_THRESHOLD", 0)
+    def test_streamed_request_client_error(self, m):
+        mock_service_oas_get(m, "https://documenten.nl/api/v1/", "documenten")
+        m.post(
+            "https://documenten.nl/api/v1/enkelvoudiginformatieobjecten",
+            status_code=400,
+            json={"invalidParams": []},
+        )
+
+        with self.assertRaises(ClientError):
+            create_document(
+                "inzending", ContentFile(b"%PDF"), self.options, get_drc=self.get_drc
+            )
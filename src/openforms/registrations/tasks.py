@@ -21,6 +21,7 @@ logger = logging.getLogger(__name__)
     ignore_result=False,
     once={"graceful": True},  # do not spam error monitoring
 )
+@logevent.buffered_logging()
 def register_submission(submission_id: int) -> Optional[dict]:
     """
     Attempt to register the submission with the configured backend.
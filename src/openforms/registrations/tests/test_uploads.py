@@ -0,0 +1,53 @@
+import threading
+import time
+
+from django.test import SimpleTestCase
+
+from ..uploads import upload_concurrently
+
+
+class UploadConcurrentlyTests(SimpleTestCase):
+    def test_results_in_order_of_items(self):
+        def upload(item):
+            # finish the first items last
+            time.sleep((5 - item) * 0.01)
+            return item * 2
+
+        results = upload_concurrently(upload, range(5))
+
+        self.assertEqual(results, [0, 2, 4, 6, 8])
+
+    def test_uploads_bounded(self):
+        lock = threading.Lock()
+        running = []
+        max_running = 0
+
+        def upload(item):
+            nonlocal max_running
+            with lock:
+                running.append(item)
+                max_running = max(max_running, len(running))
+            time.sleep(0.01)
+            with lock:
+                running.remove(item)
+
+        upload_concurrently(upload, range(10), max_workers=3)
+
+        self.assertLessEqual(max_running, 3)
+
+    def test_failure_raised_without_partial_result(self):
+        def upload(item):
+            if item == 1:
+                raise ValueError("upload failed")
+            return item
+
+        with self.assertRaisesMessage(ValueError, "upload failed"):
+            upload_concurrently(upload, range(5))
+
+    def test_single_item_in_calling_thread(self):
+        calling_thread = threading.get_ident()
+
+        results = upload_concurrently(lambda item: threading.get_ident(), ["item"])
+
+        self.assertEqual(results, [calling_thread])
+        self.assertEqual(upload_concurrently(lambda item: item, []), [])
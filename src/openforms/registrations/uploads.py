@@ -0,0 +1,54 @@
+"""
+Concurrent uploads for registration plugins.
+
+Submissions can have a considerable number of attachments, which registration
+plugins upload to the registration backend. Uploading them one after the other
+makes the registration time grow with every attachment, so the uploads are
+performed concurrently by a bounded number of threads instead.
+
+The upload callable is executed in worker threads, which use their own database
+connections. Anything requiring database access (e.g. configuration models) must be
+resolved upfront, in the calling thread.
+"""
+import logging
+from typing import Callable, Iterable, List, TypeVar
+
+from zgw_consumers.concurrent import parallel
+
+logger = logging.getLogger(__name__)
+
+# the maximum number of concurrent uploads for a single registration
+MAX_UPLOAD_WORKERS = 4
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def upload_concurrently(
+    upload: Callable[[T], R],
+    items: Iterable[T],
+    max_workers: int = MAX_UPLOAD_WORKERS,
+) -> List[R]:
+    """
+    Call ``upload`` for every item, concurrently.
+
+    The results are returned in the order of the items. If any of the uploads fails,
+    the uploads that did not start yet are cancelled, the running uploads are
+    awaited and the (first) exception is raised - no partial result is returned.
+    """
+    items = list(items)
+    if len(items) <= 1:
+        return [upload(item) for item in items]
+
+    with parallel(max_workers=min(max_workers, len(items))) as executor:
+        futures = [executor.submit(upload, item) for item in items]
+        try:
+            return [future.result() for future in futures]
+        except Exception:
+            cancelled = sum(future.cancel() for future in futures)
+            logger.warning(
+                "Upload failed, cancelled %d of %d uploads",
+                cancelled,
+                len(items),
+            )
+            raise
@@ -1,8 +1,12 @@
+from functools import partial
 from typing import Optional
 
 from django.contrib import admin, messages
 from django.contrib.contenttypes.admin import GenericTabularInline
+from django.db import transaction
 from django.template.defaultfilters import filesizeformat
+from django.urls import reverse
+from django.utils.html import format_html
 from django.utils.translation import gettext_lazy as _, ngettext
 
 from privates.admin import PrivateMediaMixin
@@ -19,15 +23,16 @@ from openforms.payments.models import SubmissionPayment
 
 from ..utils.admin import ReadOnlyAdminMixin
 from .constants import IMAGE_COMPONENTS, RegistrationStatuses
-from .exports import ExportFileTypes, export_submissions
+from .exports import ExportFileTypes
 from .models import (
     Submission,
+    SubmissionExport,
     SubmissionFileAttachment,
     SubmissionReport,
     SubmissionStep,
     TemporaryFileUpload,
 )
-from .tasks import on_completion_retry
+from .tasks import generate_submission_export, on_completion_retry
 
 
 class SubmissionTypeListFilter(admin.ListFilter):
@@ -244,8 +249,32 @@ class SubmissionAdmin(admin.ModelAdmin):
             )
             return
 
-        log_export_submissions(queryset.first().form, request.user)
-        return export_submissions(queryset, file_type)
+        form = queryset.first().form
+        log_export_submissions(form, request.user)
+
+        submission_ids = list(queryset.order_by("pk").values_list("pk", flat=True))
+        export = SubmissionExport.objects.create(
+            form=form,
+            user=request.user,
+            file_type=file_type.extension,
+            submission_ids=submission_ids,
+            total=len(submission_ids),
+        )
+        transaction.on_commit(partial(generate_submission_export.delay, export.id))
+
+        messages.info(
+            request,
+            format_html(
+                _(
+                    "The export is being generated in the background. You can "
+                    'download it from the <a href="{url}">export page</a> '
+                    "once it is done."
+                ),
+                url=reverse(
+                    "admin:submissions_submissionexport_change", args=(export.pk,)
+                ),
+            ),
+        )
 
     def export_csv(self, request, queryset):
         return self._export(request, queryset, ExportFileTypes.CSV)
@@ -310,6 +339,80 @@ class SubmissionReportAdmin(PrivateMediaMixin, admin.ModelAdmin):
         return False
 
 
+class SubmissionExportMediaView(PrivateMediaView):
+    def get_queryset(self):
+        qs = super().get_queryset()
+        # same restriction as the admin, exports contain the submitted data
+        if not self.request.user.is_superuser:
+            qs = qs.filter(user=self.request.user)
+        return qs
+
+    def get_sendfile_opts(self):
+        object = self.get_object()
+        return {
+            "attachment": True,
+            "attachment_filename": object.filename,
+            "mimetype": ExportFileTypes.get(object.file_type).content_type,
+        }
+
+
+@admin.register(SubmissionExport)
+class SubmissionExportAdmin(PrivateMediaMixin, admin.ModelAdmin):
+    list_display = (
+        "__str__",
+        "form",
+        "user",
+        "status",
+        "get_progress",
+        "created_on",
+        "completed_on",
+    )
+    list_filter = ("status", "file_type")
+    list_select_related = ("form", "user")
+    fields = (
+        "uuid",
+        "form",
+        "user",
+        "file_type",
+        "status",
+        "get_progress",
+        "get_download_link",
+        "error_information",
+        "created_on",
+        "completed_on",
+    )
+    readonly_fields = fields
+    date_hierarchy = "created_on"
+
+    private_media_fields = ("content",)
+    private_media_view_class = SubmissionExportMediaView
+
+    def get_queryset(self, request):
+        qs = super().get_queryset(request).defer("submission_ids")
+        if not request.user.is_superuser:
+            qs = qs.filter(user=request.user)
+        return qs
+
+    def get_progress(self, obj) -> str:
+        return f"{obj.processed}/{obj.total}"
+
+    get_progress.short_description = _("Progress")
+
+    def get_download_link(self, obj) -> str:
+        if not obj.content:
+            return "-"
+        url = reverse("admin:submissions_submissionexport_content", args=(obj.pk,))
+        return format_html('<a href="{url}">{name}</a>', url=url, name=obj.filename)
+
+    get_download_link.short_description = _("Download")
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+
 class TemporaryFileUploadMediaView(PrivateMediaView):
     def get_sendfile_opts(self):
         object = self.get_object()
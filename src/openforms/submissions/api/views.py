@@ -14,6 +14,7 @@ from openforms.api.parsers import MaxFilesizeMultiPartParser
 
 from ..attachments import clean_mime_type
 from ..models import SubmissionReport, TemporaryFileUpload
+from ..upload_handlers import use_hashing_upload_handlers
 from ..utils import add_upload_to_session, remove_upload_from_session
 from .permissions import (
     AnyActiveSubmissionPermission,
@@ -83,6 +84,8 @@ class TemporaryFileUploadView(GenericAPIView):
     permission_classes = [AnyActiveSubmissionPermission]
 
     def post(self, request, *args, **kwargs):
+        # hash the file while it's received, before the body is parsed
+        use_hashing_upload_handlers(request._request)
         serializer = self.get_serializer(
             data=request.data,
         )
@@ -98,6 +101,7 @@ class TemporaryFileUploadView(GenericAPIView):
             file_name=name,
             content_type=clean_mime_type(file.content_type),
             file_size=file.size,
+            content_hash=getattr(file, "sha256", ""),
         )
         add_upload_to_session(upload, self.request.session)
 
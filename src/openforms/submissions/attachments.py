@@ -1,11 +1,13 @@
 import os.path
 import re
 from datetime import timedelta
-from typing import Iterable, Optional, Tuple
+from functools import partial
+from tempfile import SpooledTemporaryFile
+from typing import Iterable, Iterator, Optional, Tuple
 from urllib.parse import urlparse
 
 from django.conf import settings
-from django.core.files.temp import NamedTemporaryFile
+from django.db import transaction
 from django.urls import Resolver404, resolve
 from django.utils.translation import gettext as _
 
@@ -21,9 +23,14 @@ from openforms.submissions.models import (
     SubmissionStep,
     TemporaryFileUpload,
 )
+from openforms.utils.files import calculate_sha256
 
 DEFAULT_IMAGE_MAX_SIZE = (10000, 10000)
 
+# the image is decoded/reduced to at least this many times the target size before the
+# final (more expensive) resampling step
+RESIZE_REDUCING_GAP = 2.0
+
 # validate the size as Formio does (client-side) - meaning 1MB is actually 1MiB
 # https://github.com/formio/formio.js/blob/4.12.x/src/components/file/File.js#L523
 file_size_cast = Filesize(system=Filesize.S_BINARY)
@@ -76,24 +83,30 @@ def append_file_num_postfix(
     return f"{new_name}{postfix}{ext}"
 
 
+def get_resize_size(component: dict) -> Optional[Tuple[int, int]]:
+    """
+    Return the maximum image size of the file component, if images must be resized.
+    """
+    if not glom(component, "of.image.resize.apply", default=False):
+        return None
+    return (
+        glom(component, "of.image.resize.width", default=DEFAULT_IMAGE_MAX_SIZE[0]),
+        glom(component, "of.image.resize.height", default=DEFAULT_IMAGE_MAX_SIZE[1]),
+    )
+
+
 def attach_uploads_to_submission_step(submission_step: SubmissionStep) -> list:
     # circular import
     from .tasks import resize_submission_attachment
 
-    components = list(submission_step.form_step.iter_components(recursive=True))
+    component_index = submission_step.form_step.form_definition.get_component_index()
+    components = component_index.get_by_type("file")
 
     uploads = resolve_uploads_from_data(components, submission_step.data)
 
     result = list()
     for key, (component, uploads) in uploads.items():
-        # grab resize settings
-        resize_apply = glom(component, "of.image.resize.apply", default=False)
-        resize_size = (
-            glom(component, "of.image.resize.width", default=DEFAULT_IMAGE_MAX_SIZE[0]),
-            glom(
-                component, "of.image.resize.height", default=DEFAULT_IMAGE_MAX_SIZE[1]
-            ),
-        )
+        resize_size = get_resize_size(component)
         file_max_size = file_size_cast(
             glom(component, "fileMaxSize", default=settings.MAX_FILE_UPLOAD_SIZE)
         )
@@ -121,14 +134,42 @@ def attach_uploads_to_submission_step(submission_step: SubmissionStep) -> list:
             )
             result.append((attachment, created))
 
-            if created and resize_apply and resize_size:
-                # NOTE there is a possible race-condition if user completes a submission before this resize task is done
-                # see https://github.com/open-formulieren/open-forms/issues/507
-                resize_submission_attachment.delay(attachment.id, resize_size)
+            if created and resize_size:
+                # the submission may be completed before this task is done, the
+                # completion flow resizes any remaining images before registration
+                # (see https://github.com/open-formulieren/open-forms/issues/507)
+                transaction.on_commit(
+                    partial(
+                        resize_submission_attachment.delay, attachment.id, resize_size
+                    )
+                )
 
     return result
 
 
+def get_attachments_to_resize(
+    submission: Submission,
+) -> Iterator[Tuple[SubmissionFileAttachment, Tuple[int, int]]]:
+    """
+    Yield the attachments of the submission with image resizing enabled and their size.
+    """
+    attachments = SubmissionFileAttachment.objects.for_submission(
+        submission
+    ).select_related("submission_step__form_step__form_definition")
+    component_indices = {}
+    for attachment in attachments:
+        form_definition = attachment.submission_step.form_step.form_definition
+        if form_definition.pk not in component_indices:
+            component_indices[
+                form_definition.pk
+            ] = form_definition.get_component_index()
+        component = component_indices[form_definition.pk].get(attachment.form_key)
+        if component is None:
+            continue
+        if resize_size := get_resize_size(component):
+            yield attachment, resize_size
+
+
 def cleanup_submission_temporary_uploaded_files(submission: Submission):
     for attachment in SubmissionFileAttachment.objects.for_submission(
         submission
@@ -224,13 +265,17 @@ def resize_attachment(
         # more specific
         return False
     else:
-        # check if we have work
+        # check if we have work - only the image header has been read at this point
         if image.width <= size[0] and image.height <= size[1]:
             return False
 
-        # TODO SpooledTemporaryFile but what limit?
-        with NamedTemporaryFile() as tmp:
-            image.thumbnail(size)
+        # thumbnail() decodes JPEG images at a reduced scale (draft mode) and reduces
+        # other images by an integer factor before resampling, which is much cheaper
+        # than decoding large (phone) photos at full size
+        image.thumbnail(size, reducing_gap=RESIZE_REDUCING_GAP)
+        with SpooledTemporaryFile(max_size=settings.FILE_UPLOAD_MAX_MEMORY_SIZE) as tmp:
             image.save(tmp, image.format)
+            tmp.seek(0)
+            attachment._content_hash = calculate_sha256(tmp)
             attachment.content.save(attachment.content.name, tmp, save=True)
             return True
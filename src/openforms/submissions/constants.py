@@ -31,3 +31,17 @@ class ProcessingResults(DjangoChoices):
 
     failed = ChoiceItem("failed", _("Failed, should return to the start of the form."))
     success = ChoiceItem("success", _("Success, proceed to confirmation page."))
+
+
+class ExportFormats(DjangoChoices):
+    csv = ChoiceItem("csv", _("CSV"))
+    xlsx = ChoiceItem("xlsx", _("Excel"))
+    json = ChoiceItem("json", _("JSON"))
+    xml = ChoiceItem("xml", _("XML"))
+
+
+class SubmissionExportStatuses(DjangoChoices):
+    pending = ChoiceItem("pending", _("Pending"))
+    in_progress = ChoiceItem("in_progress", _("In progress"))
+    done = ChoiceItem("done", _("Done"))
+    failed = ChoiceItem("failed", _("Failed"))
@@ -1,14 +1,31 @@
+import csv
 import dataclasses
+import json
+from typing import Any, BinaryIO, Callable, Iterator, List, Optional
 
-from django.http import FileResponse, HttpResponse
+from django.db.models import CharField, F, Func, Prefetch
 from django.utils.timezone import make_naive
 
 import tablib
 from lxml import etree
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font
 from tablib.formats._json import serialize_objects_handler
 
+from openforms.forms.models import Form
+
+from .models import Submission, SubmissionStep
 from .query import SubmissionQuerySet
 
+# number of submissions (with their steps) loaded in memory at a time
+EXPORT_CHUNK_SIZE = 500
+
+FIXED_HEADERS = ["Formuliernaam", "Inzendingdatum"]
+
+# called with the number of submissions processed so far
+ProgressCallback = Callable[[int], None]
+
 
 @dataclasses.dataclass
 class FileType:
@@ -24,14 +41,77 @@ class ExportFileTypes:
     JSON = FileType("json", "application/json")
     XML = FileType("xml", "text/xml")
 
+    @classmethod
+    def get(cls, extension: str) -> FileType:
+        for file_type in (cls.CSV, cls.XLSX, cls.JSON, cls.XML):
+            if file_type.extension == extension:
+                return file_type
+        raise ValueError(f"Unknown export file type '{extension}'")
+
+
+def get_data_headers(queryset: SubmissionQuerySet) -> List[str]:
+    """
+    Determine the data keys to export for the submissions.
+
+    The keys present in the submission data are collected in the database, without
+    loading the data itself. Keys of form components are ordered as in the form
+    definitions, other keys follow in alphabetical order.
+    """
+    steps = SubmissionStep.objects.filter(
+        submission__in=queryset.order_by().values("pk")
+    ).exclude(data=None)
+    data_keys = set(
+        steps.annotate(
+            key=Func(F("data"), function="jsonb_object_keys", output_field=CharField())
+        )
+        .order_by()
+        .values_list("key", flat=True)
+        .distinct()
+    )
 
-def create_submission_export(queryset: SubmissionQuerySet) -> tablib.Dataset:
     headers = []
-    for submission in queryset:
-        headers += list(submission.get_merged_data().keys())
-    headers = list(dict.fromkeys(headers))  # Remove duplicates
-    data = tablib.Dataset(headers=["Formuliernaam", "Inzendingdatum"] + headers)
-    for submission in queryset:
+    forms = Form.objects.filter(pk__in=queryset.order_by().values("form"))
+    for form in forms.order_by("pk"):
+        for component in form.iter_components(recursive=True):
+            key = component.get("key")
+            if key in data_keys and key not in headers:
+                headers.append(key)
+
+    return headers + sorted(data_keys - set(headers))
+
+
+def iter_submissions(
+    queryset: SubmissionQuerySet, chunk_size: int = EXPORT_CHUNK_SIZE
+) -> Iterator[Submission]:
+    """
+    Iterate over the submissions in chunks, with the steps prefetched per chunk.
+    """
+    queryset = (
+        queryset.select_related("form")
+        .prefetch_related(
+            Prefetch(
+                "submissionstep_set",
+                queryset=SubmissionStep.objects.exclude(data=None),
+            )
+        )
+        .order_by("pk")
+    )
+    last_pk = 0
+    while True:
+        chunk = list(queryset.filter(pk__gt=last_pk)[:chunk_size])
+        if not chunk:
+            break
+        yield from chunk
+        last_pk = chunk[-1].pk
+
+
+def iter_submission_rows(
+    queryset: SubmissionQuerySet,
+    headers: List[str],
+    progress: Optional[ProgressCallback] = None,
+) -> Iterator[List[Any]]:
+    processed = 0
+    for processed, submission in enumerate(iter_submissions(queryset), start=1):
         inzending_datum = (
             make_naive(submission.completed_on) if submission.completed_on else None
         )
@@ -42,23 +122,133 @@ def create_submission_export(queryset: SubmissionQuerySet) -> tablib.Dataset:
         merged_data = submission.get_merged_data()
         for header in headers:
             submission_data.append(merged_data.get(header))
-        data.append(submission_data)
+        yield submission_data
+        if progress is not None and processed % EXPORT_CHUNK_SIZE == 0:
+            progress(processed)
+
+    if progress is not None:
+        progress(processed)
+
+
+def create_submission_export(queryset: SubmissionQuerySet) -> tablib.Dataset:
+    headers = get_data_headers(queryset)
+    data = tablib.Dataset(headers=FIXED_HEADERS + headers)
+    for row in iter_submission_rows(queryset, headers):
+        data.append(row)
     return data
 
 
-def export_submissions(
-    queryset: SubmissionQuerySet, file_type: FileType
-) -> FileResponse:
-    export_data = create_submission_export(queryset)
-    filename = f"submissions_export.{file_type.extension}"
+class _Echo:
+    """
+    File-like object returning the written value, for streaming CSV output.
+    """
+
+    def write(self, value):
+        return value
+
 
-    response = HttpResponse(
-        export_data.export(file_type.extension),
-        content_type=file_type.content_type,
-    )
-    response["Content-Disposition"] = f'attachment; filename="{filename}"'
+def iter_csv(
+    queryset: SubmissionQuerySet, progress: Optional[ProgressCallback] = None
+) -> Iterator[str]:
+    headers = get_data_headers(queryset)
+    writer = csv.writer(_Echo())
+    yield writer.writerow(FIXED_HEADERS + headers)
+    for row in iter_submission_rows(queryset, headers, progress=progress):
+        yield writer.writerow(row)
+
+
+def iter_json(
+    queryset: SubmissionQuerySet, progress: Optional[ProgressCallback] = None
+) -> Iterator[str]:
+    data_headers = get_data_headers(queryset)
+    headers = FIXED_HEADERS + data_headers
+    yield "["
+    rows = iter_submission_rows(queryset, data_headers, progress=progress)
+    for index, row in enumerate(rows):
+        prefix = ", " if index else ""
+        yield prefix + json.dumps(
+            dict(zip(headers, row)),
+            default=serialize_objects_handler,
+            ensure_ascii=False,
+        )
+    yield "]"
+
+
+def iter_xml(
+    queryset: SubmissionQuerySet, progress: Optional[ProgressCallback] = None
+) -> Iterator[bytes]:
+    data_headers = get_data_headers(queryset)
+    headers = FIXED_HEADERS + data_headers
+    yield b"<?xml version='1.0' encoding='utf8'?>\n<submissions>\n"
+    for row in iter_submission_rows(queryset, data_headers, progress=progress):
+        element = XMLKeyValueExport.build_submission_element(zip(headers, row))
+        yield etree.tostring(
+            element, xml_declaration=False, encoding="utf8", pretty_print=True
+        )
+    yield b"</submissions>\n"
+
+
+def _xlsx_value(value):
+    # the write-only mode skips empty cells, which would result in rows with fewer
+    # columns than the header row
+    if value is None:
+        return ""
+    if isinstance(value, (list, dict)):
+        return str(value)
+    return value
+
+
+def write_xlsx(
+    queryset: SubmissionQuerySet,
+    file: BinaryIO,
+    progress: Optional[ProgressCallback] = None,
+) -> None:
+    """
+    Write the export to ``file`` using the write-only (streaming) openpyxl mode.
+    """
+    data_headers = get_data_headers(queryset)
+    headers = FIXED_HEADERS + data_headers
+
+    workbook = Workbook(write_only=True)
+    worksheet = workbook.create_sheet(title="Tablib Dataset")
+    worksheet.freeze_panes = "A2"
+
+    bold = Font(bold=True)
+    header_cells = []
+    for header in headers:
+        cell = WriteOnlyCell(worksheet, value=header)
+        cell.font = bold
+        header_cells.append(cell)
+    worksheet.append(header_cells)
+
+    for row in iter_submission_rows(queryset, data_headers, progress=progress):
+        worksheet.append([_xlsx_value(value) for value in row])
+
+    workbook.save(file)
+
+
+STREAMING_EXPORTS = {
+    ExportFileTypes.CSV.extension: iter_csv,
+    ExportFileTypes.JSON.extension: iter_json,
+    ExportFileTypes.XML.extension: iter_xml,
+}
 
-    return response
+
+def write_submission_export(
+    queryset: SubmissionQuerySet,
+    file_type: FileType,
+    file: BinaryIO,
+    progress: Optional[ProgressCallback] = None,
+) -> None:
+    """
+    Write the export of the submissions in the requested format to ``file``.
+    """
+    if file_type.extension not in STREAMING_EXPORTS:
+        write_xlsx(queryset, file, progress=progress)
+        return
+
+    for chunk in STREAMING_EXPORTS[file_type.extension](queryset, progress=progress):
+        file.write(chunk.encode("utf-8") if isinstance(chunk, str) else chunk)
 
 
 def _xml_basic_value(value) -> str:
@@ -104,14 +294,22 @@ class XMLKeyValueExport:
             </field>
     """
 
+    @classmethod
+    def build_submission_element(cls, row, parent=None):
+        if parent is not None:
+            elem = etree.SubElement(parent, "submission")
+        else:
+            elem = etree.Element("submission")
+        for key, value in row:
+            field = etree.SubElement(elem, "field", name=key)
+            _xml_value(field, value, wrap_single=True)
+        return elem
+
     @classmethod
     def export_set(cls, dset):
         root = etree.Element("submissions")
         for row in dset.dict:
-            elem = etree.SubElement(root, "submission")
-            for key, value in row.items():
-                field = etree.SubElement(elem, "field", name=key)
-                _xml_value(field, value, wrap_single=True)
+            cls.build_submission_element(row.items(), parent=root)
 
         return etree.tostring(
             root, xml_declaration=True, encoding="utf8", pretty_print=True
@@ -1,36 +1,118 @@
-from typing import TYPE_CHECKING, Any, Dict
+import json
+from typing import TYPE_CHECKING, Any, Dict, FrozenSet, Optional
 
-from json_logic import jsonLogic
+from django.core.cache import caches
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils.crypto import salted_hmac
 
-from openforms.formio.service import get_dynamic_configuration
-from openforms.formio.utils import get_default_values
+from openforms.formio.service import (
+    get_dynamic_configuration,
+    register_dynamic_configuration,
+)
+from openforms.formio.utils import ComponentIndex, ConfigurationOverlay
 from openforms.forms.constants import LogicActionTypes
-from openforms.forms.models import FormDefinition, FormLogic
-from openforms.prefill import JSONObject
+from openforms.forms.logic import CompiledRuleSet, get_rules
 
 if TYPE_CHECKING:  # pragma: nocover
     from .models import Submission, SubmissionStep
 
+EVALUATION_CACHE_TIMEOUT = 60 * 60
+
+
+def _get_evaluation_key(submission: "Submission") -> str:
+    return f"submissions:logic-evaluation-v3:{submission.uuid}"
+
+
+def _get_digest(submission: "Submission", key: str, value: Any) -> str:
+    # keyed with the SECRET_KEY and salted per submission - plain hashes of values
+    # like a BSN or a date are easily reversed by brute force
+    serialized = json.dumps(value, sort_keys=True, cls=DjangoJSONEncoder)
+    return salted_hmac(
+        f"openforms.submissions.form_logic:{submission.uuid}",
+        f"{key}:{serialized}",
+        algorithm="sha256",
+    ).hexdigest()
+
+
+def _load_previous_evaluation(
+    submission: "Submission", rules: CompiledRuleSet
+) -> Optional[dict]:
+    """
+    Load the results of the previous logic evaluation for the submission.
+
+    The results are only usable if they were produced with the same logic rules.
+    The evaluation is shared through the cache, so it does not contain the submitted
+    values: the inputs are stored as HMACs (keyed with the ``SECRET_KEY`` and salted
+    per submission) and only the trigger results are kept.
+    """
+    if rules.version is None:
+        return None
+
+    submission_state = submission.load_execution_state()
+    evaluation = submission_state.logic_evaluation
+    if evaluation is None:
+        evaluation = caches["default"].get(_get_evaluation_key(submission))
+    if not evaluation or evaluation["version"] != rules.version:
+        return None
+    return evaluation
+
+
+def _store_evaluation(
+    submission: "Submission",
+    rules: CompiledRuleSet,
+    data: Dict[str, Any],
+    results: Dict[int, bool],
+) -> None:
+    if rules.version is None:
+        return
+
+    evaluation = {
+        "version": rules.version,
+        "inputs": {
+            key: _get_digest(submission, key, data[key])
+            for key in rules.dependency_keys
+            if key in data
+        },
+        "results": results,
+    }
+    submission.load_execution_state().logic_evaluation = evaluation
+    caches["default"].set(
+        _get_evaluation_key(submission), evaluation, timeout=EVALUATION_CACHE_TIMEOUT
+    )
+
+
+def _get_changed_keys(
+    submission: "Submission",
+    rules: CompiledRuleSet,
+    previous_inputs: Dict[str, str],
+    data: Dict[str, Any],
+) -> FrozenSet[str]:
+    return frozenset(
+        key
+        for key in rules.dependency_keys
+        if (key in data) != (key in previous_inputs)
+        or (
+            key in data
+            and _get_digest(submission, key, data[key]) != previous_inputs[key]
+        )
+    )
+
 
 def set_property_value(
-    configuration: JSONObject,
+    overlay: ConfigurationOverlay,
+    component_index: ComponentIndex,
     component_key: str,
     property_name: str,
     property_value: str,
-) -> JSONObject:
-    # use :class:`FormDefinition` for the iter_components method
-    form_definition = FormDefinition()
-
-    # iter over the (nested) components, and when we find the specified key, mutate it and break
-    # out of the loop
-    for component in form_definition.iter_components(
-        configuration=configuration, recursive=True
-    ):
-        if component["key"] == component_key:
-            component[property_name] = property_value
-            break
+) -> None:
+    """
+    Record the new property value of a component in the overlay.
 
-    return configuration
+    The index must be built from the configuration of the overlay.
+    """
+    component = component_index.get(component_key)
+    if component is not None:
+        overlay.set(component_index.get_path(component), property_name, property_value)
 
 
 def evaluate_form_logic(
@@ -41,9 +123,13 @@ def evaluate_form_logic(
     **context,
 ) -> Dict[str, Any]:
     """
-    Process all the form logic rules and mutate the step configuration if required.
+    Process all the form logic rules and return the step configuration modified
+    accordingly.
+
+    The (dynamic) input configuration is not mutated, the changes are applied to a
+    copy-on-write copy.
     """
-    # grab the configuration that can be **mutated**
+    # grab the static configuration
     configuration = step.form_step.form_definition.configuration
 
     # we need to apply the context-specific configurations first before we can apply
@@ -54,13 +140,16 @@ def evaluate_form_logic(
         # view(set)s and serializers. Note that :func:`get_dynamic_configuration` is
         # planned for refactor as part of #1068, which should drop the ``request``
         # argument. The required information is available on the ``submission`` object
-        # already.
+        # already. The result is memoized on the submission.
         request=context.get("request"),
         submission=submission,
     )
 
+    component_index = ComponentIndex(configuration)
+    overlay = ConfigurationOverlay(configuration)
+
     # check what the default data values are
-    defaults = get_default_values(configuration)
+    defaults = component_index.get_default_values()
 
     # merge the default values and supplied data - supplied data overwrites defaults
     # if keys are present in both dicts
@@ -72,26 +161,61 @@ def evaluate_form_logic(
     # ensure this function is idempotent
     _evaluated = getattr(step, "_form_logic_evaluated", False)
     if _evaluated:
-        return configuration
+        return getattr(step, "_form_logic_configuration", configuration)
 
-    rules = FormLogic.objects.filter(form=step.form_step.form)
+    rules = get_rules(step.form_step.form)
     submission_state = submission.load_execution_state()
 
+    # when the data is dirty, typically only a single field changed since the
+    # previous evaluation - only re-evaluate the rules depending on changed fields and
+    # re-use the earlier results for the others.
+    previous = _load_previous_evaluation(submission, rules) if dirty else None
+    affected_rules = (
+        rules.get_affected_rules(
+            _get_changed_keys(submission, rules, previous["inputs"], data)
+        )
+        if previous is not None
+        else None
+    )
+
+    results = {}
     for rule in rules:
-        if jsonLogic(rule.json_logic_trigger, data):
-            for action in rule.actions:
+        if (
+            affected_rules is None
+            or rule.pk in affected_rules
+            or rule.pk not in previous["results"]
+        ):
+            triggered = bool(rule.trigger(data))
+        else:
+            triggered = previous["results"][rule.pk]
+        results[rule.pk] = triggered
+
+        if triggered:
+            # the computed values are not part of the stored evaluation
+            values = {
+                index: compiled_action.value(data)
+                for index, compiled_action in enumerate(rule.actions)
+                if compiled_action.value is not None
+            }
+            for index, compiled_action in enumerate(rule.actions):
+                action = compiled_action.action
                 action_details = action["action"]
                 if action_details["type"] == LogicActionTypes.value:
-                    new_value = jsonLogic(action_details["value"], data)
-                    configuration = set_property_value(
-                        configuration, action["component"], "value", new_value
+                    new_value = values[index]
+                    set_property_value(
+                        overlay,
+                        component_index,
+                        action["component"],
+                        "value",
+                        new_value,
                     )
                     step.data[action["component"]] = new_value
                 elif action_details["type"] == LogicActionTypes.property:
                     property_name = action_details["property"]["value"]
                     property_value = action_details["state"]
                     set_property_value(
-                        configuration,
+                        overlay,
+                        component_index,
                         action["component"],
                         property_name,
                         property_value,
@@ -104,6 +228,12 @@ def evaluate_form_logic(
                     )
                     submission_step_to_modify._is_applicable = False
 
+    _store_evaluation(submission, rules, data, results)
+
+    configuration = overlay.apply()
+    # the serializers apply the dynamic configuration hooks to the result again
+    register_dynamic_configuration(configuration, submission=submission)
+
     if dirty:
         # only keep the changes in the data, so that old values do not overwrite otherwise
         # debounced client-side data changes
@@ -118,15 +248,17 @@ def evaluate_form_logic(
         step.data = data_diff
 
     step._form_logic_evaluated = True
+    step._form_logic_configuration = configuration
 
     return configuration
 
 
 def check_submission_logic(submission, unsaved_data=None):
-    logic_rules = FormLogic.objects.filter(
-        form=submission.form,
-        actions__contains=[{"action": {"type": LogicActionTypes.step_not_applicable}}],
-    )
+    logic_rules = [
+        rule
+        for rule in get_rules(submission.form)
+        if rule.has_action_type(LogicActionTypes.step_not_applicable)
+    ]
 
     merged_data = submission.data
     if unsaved_data:
@@ -135,12 +267,12 @@ def check_submission_logic(submission, unsaved_data=None):
     submission_state = submission.load_execution_state()
 
     for rule in logic_rules:
-        if jsonLogic(rule.json_logic_trigger, merged_data):
-            for action in rule.actions:
-                if action["action"]["type"] != LogicActionTypes.step_not_applicable:
+        if rule.trigger(merged_data):
+            for compiled_action in rule.actions:
+                if compiled_action.type != LogicActionTypes.step_not_applicable:
                     continue
 
                 submission_step_to_modify = submission_state.resolve_step(
-                    action["form_step"]
+                    compiled_action.action["form_step"]
                 )
                 submission_step_to_modify._is_applicable = False
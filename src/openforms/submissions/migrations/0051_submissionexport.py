@@ -0,0 +1,156 @@
+# Generated by Django 3.2.12 on 2022-02-24 10:12
+
+import uuid
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+import django_better_admin_arrayfield.models.fields
+import privates.fields
+import privates.storages
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("forms", "0018_auto_20220221_1405"),
+        ("submissions", "0050_auto_20220215_1715"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SubmissionExport",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "uuid",
+                    models.UUIDField(
+                        default=uuid.uuid4, unique=True, verbose_name="UUID"
+                    ),
+                ),
+                (
+                    "file_type",
+                    models.CharField(
+                        choices=[
+                            ("csv", "CSV"),
+                            ("xlsx", "Excel"),
+                            ("json", "JSON"),
+                            ("xml", "XML"),
+                        ],
+                        max_length=10,
+                        verbose_name="file type",
+                    ),
+                ),
+                (
+                    "submission_ids",
+                    django_better_admin_arrayfield.models.fields.ArrayField(
+                        base_field=models.PositiveIntegerField(),
+                        blank=True,
+                        default=list,
+                        help_text="Primary keys of the submissions to export.",
+                        size=None,
+                        verbose_name="submission IDs",
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "Pending"),
+                            ("in_progress", "In progress"),
+                            ("done", "Done"),
+                            ("failed", "Failed"),
+                        ],
+                        default="pending",
+                        max_length=50,
+                        verbose_name="status",
+                    ),
+                ),
+                (
+                    "processed",
+                    models.PositiveIntegerField(
+                        default=0,
+                        help_text="Number of submissions written to the export so far.",
+                        verbose_name="processed",
+                    ),
+                ),
+                (
+                    "total",
+                    models.PositiveIntegerField(
+                        default=0,
+                        help_text="Number of submissions in the export.",
+                        verbose_name="total",
+                    ),
+                ),
+                (
+                    "content",
+                    privates.fields.PrivateMediaFileField(
+                        blank=True,
+                        storage=privates.storages.PrivateMediaFileSystemStorage(),
+                        upload_to="submission-exports/%Y/%m/%d",
+                        verbose_name="content",
+                    ),
+                ),
+                (
+                    "task_id",
+                    models.CharField(
+                        blank=True,
+                        help_text="ID of the celery task generating the export.",
+                        max_length=200,
+                        verbose_name="task id",
+                    ),
+                ),
+                (
+                    "error_information",
+                    models.TextField(blank=True, verbose_name="error information"),
+                ),
+                (
+                    "created_on",
+                    models.DateTimeField(auto_now_add=True, verbose_name="created on"),
+                ),
+                (
+                    "completed_on",
+                    models.DateTimeField(
+                        blank=True, null=True, verbose_name="completed on"
+                    ),
+                ),
+                (
+                    "form",
+                    models.ForeignKey(
+                        blank=True,
+                        help_text="Form of the exported submissions.",
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        to="forms.form",
+                        verbose_name="form",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        blank=True,
+                        help_text="User who requested the export.",
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="user",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "submission export",
+                "verbose_name_plural": "submission exports",
+                "ordering": ("-created_on",),
+            },
+        ),
+    ]
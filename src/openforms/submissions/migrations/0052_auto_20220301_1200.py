@@ -0,0 +1,33 @@
+# Generated by Django 3.2.12 on 2022-03-01 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("submissions", "0051_submissionexport"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="submissionfileattachment",
+            name="_content_hash",
+            field=models.CharField(
+                blank=True,
+                help_text="SHA256 hash of the content. Empty if it was not known when the attachment was stored.",
+                max_length=64,
+                verbose_name="content hash",
+            ),
+        ),
+        migrations.AddField(
+            model_name="temporaryfileupload",
+            name="content_hash",
+            field=models.CharField(
+                blank=True,
+                help_text="SHA256 hash of the uploaded file.",
+                max_length=64,
+                verbose_name="content hash",
+            ),
+        ),
+    ]
@@ -1,16 +1,17 @@
-import hashlib
 import logging
 import os.path
 import uuid
 import warnings
 from collections import OrderedDict, defaultdict
+from copy import deepcopy
 from dataclasses import dataclass
 from datetime import date, datetime, timedelta
 from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
 
-from django.core.files.base import ContentFile, File
+from django.conf import settings
+from django.core.files.base import ContentFile
 from django.db import models, transaction
-from django.template import Context, Template
+from django.db.models import F, Func
 from django.template.defaultfilters import date as fmt_date, time as fmt_time, yesno
 from django.template.loader import render_to_string
 from django.urls import resolve
@@ -30,7 +31,13 @@ from openforms.config.models import GlobalConfiguration
 from openforms.formio.formatters.service import format_value
 from openforms.forms.models import FormStep
 from openforms.payments.constants import PaymentStatus
-from openforms.utils.files import DeleteFileFieldFilesMixin, DeleteFilesQuerySetMixin
+from openforms.utils.files import (
+    DeleteFileFieldFilesMixin,
+    DeleteFilesQuerySetMixin,
+    calculate_sha256,
+    link_or_copy,
+)
+from openforms.utils.templates import render_from_string
 from openforms.utils.validators import (
     AllowedRedirectValidator,
     SerializerValidator,
@@ -38,7 +45,7 @@ from openforms.utils.validators import (
 )
 
 from ..contrib.kvk.validators import validate_kvk
-from .constants import RegistrationStatuses
+from .constants import ExportFormats, RegistrationStatuses, SubmissionExportStatuses
 from .pricing import get_submission_price
 from .query import SubmissionManager
 from .serializers import CoSignDataSerializer
@@ -50,6 +57,9 @@ logger = logging.getLogger(__name__)
 class SubmissionState:
     form_steps: List[FormStep]
     submission_steps: List["SubmissionStep"]
+    # results of the most recent form logic evaluation, see
+    # :func:`openforms.submissions.form_logic.evaluate_form_logic`
+    logic_evaluation: Optional[dict] = None
 
     def _get_step_offset(self):
         completed_steps = sorted(
@@ -335,6 +345,7 @@ class Submission(models.Model):
         super().refresh_from_db(*args, **kwargs)
         if hasattr(self, "_execution_state"):
             del self._execution_state
+        self.clear_merged_data_cache()
 
     def save_registration_status(self, status, result):
         self.registration_status = status
@@ -438,7 +449,7 @@ class Submission(models.Model):
             "public_reference": self.public_registration_reference,
             **self.data,
         }
-        rendered_content = Template(template).render(Context(context_data))
+        rendered_content = render_from_string(template, context_data)
 
         return rendered_content
 
@@ -545,22 +556,52 @@ class Submission(models.Model):
         return appointment_data
 
     def get_merged_data(self) -> dict:
-        merged_data = dict()
-
-        for step in self.submissionstep_set.exclude(data=None):
-            for key, value in step.data.items():
-                if key in merged_data:
-                    logger.warning(
-                        'Key "%s" was previously in merged_data and will be overwritten by: %s',
-                        key,
-                        value,
-                    )
-                merged_data[key] = value
+        """
+        Merge the data of all the submission steps.
+
+        Prefetched steps are used if available. The merged data is cached on the
+        instance, and cleared when a step related to this submission instance (e.g.
+        loaded through ``submission.submissionstep_set``) is saved or deleted, or when
+        the submission is refreshed from the database. Steps written through other
+        submission instances or with queryset updates are not seen until
+        :meth:`clear_merged_data_cache` or :meth:`refresh_from_db` is called.
+
+        A deep copy is returned so that callers can freely modify the result, including
+        nested values.
+        """
+        if not hasattr(self, "_merged_data"):
+            merged_data = dict()
+
+            prefetched = getattr(self, "_prefetched_objects_cache", {})
+            if "submissionstep_set" in prefetched:
+                steps = [
+                    step
+                    for step in prefetched["submissionstep_set"]
+                    if step.data is not None
+                ]
+            else:
+                steps = self.submissionstep_set.exclude(data=None)
+
+            for step in steps:
+                for key, value in step.data.items():
+                    if key in merged_data:
+                        logger.warning(
+                            'Key "%s" was previously in merged_data and will be overwritten by: %s',
+                            key,
+                            value,
+                        )
+                    merged_data[key] = value
+
+            self._merged_data = merged_data
 
-        return merged_data
+        return deepcopy(self._merged_data)
 
     data = property(get_merged_data)
 
+    def clear_merged_data_cache(self) -> None:
+        if hasattr(self, "_merged_data"):
+            del self._merged_data
+
     @staticmethod
     def _get_value_label(possible_values: list, value: str) -> str:
         for possible_value in possible_values:
@@ -771,6 +812,20 @@ class SubmissionStep(models.Model):
     def __str__(self):
         return f"SubmissionStep {self.pk}: Submission {self.submission_id} submitted on {self.created_on}"
 
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        self._clear_submission_data_cache()
+
+    def delete(self, *args, **kwargs):
+        result = super().delete(*args, **kwargs)
+        self._clear_submission_data_cache()
+        return result
+
+    def _clear_submission_data_cache(self) -> None:
+        # only the related instance that is already loaded can hold cached data
+        if self._meta.get_field("submission").is_cached(self):
+            self.submission.clear_merged_data_cache()
+
     @property
     def completed(self) -> bool:
         # TODO: should check that all the data for the form definition is present?
@@ -904,6 +959,13 @@ class TemporaryFileUpload(DeleteFileFieldFilesMixin, models.Model):
         default=0,
         help_text=_("Size in bytes of the uploaded file."),
     )
+    # calculated while receiving the upload, to not have to read the file again
+    content_hash = models.CharField(
+        _("content hash"),
+        max_length=64,
+        blank=True,
+        help_text=_("SHA256 hash of the uploaded file."),
+    )
     created_on = models.DateTimeField(_("created on"), auto_now_add=True)
 
     objects = TemporaryFileUploadQuerySet.as_manager()
@@ -942,19 +1004,20 @@ class SubmissionFileAttachmentManager(models.Manager):
                 False,
             )
         except self.model.DoesNotExist:
-            return (
-                self.create(
-                    submission_step=submission_step,
-                    temporary_file=upload,
-                    form_key=form_key,
-                    # wrap in File() so it will be physically copied
-                    content=File(upload.content, name=upload.file_name),
-                    content_type=upload.content_type,
-                    original_name=upload.file_name,
-                    file_name=file_name,
-                ),
-                True,
+            attachment = self.model(
+                submission_step=submission_step,
+                temporary_file=upload,
+                form_key=form_key,
+                content_type=upload.content_type,
+                original_name=upload.file_name,
+                file_name=file_name,
+                _content_hash=upload.content_hash,
             )
+            # the temporary upload is cleaned up separately, so the attachment needs
+            # its own file - (hard) link it rather than copying the data
+            link_or_copy(upload.content, attachment.content, upload.file_name)
+            attachment.save(force_insert=True)
+            return attachment, True
 
 
 class SubmissionFileAttachment(DeleteFileFieldFilesMixin, models.Model):
@@ -990,6 +1053,14 @@ class SubmissionFileAttachment(DeleteFileFieldFilesMixin, models.Model):
     )
     content_type = models.CharField(_("content type"), max_length=255)
     created_on = models.DateTimeField(_("created on"), auto_now_add=True)
+    _content_hash = models.CharField(
+        _("content hash"),
+        max_length=64,
+        blank=True,
+        help_text=_(
+            "SHA256 hash of the content. Empty if it was not known when the attachment was stored."
+        ),
+    )
 
     objects = SubmissionFileAttachmentManager.from_queryset(
         SubmissionFileAttachmentQuerySet
@@ -1010,13 +1081,116 @@ class SubmissionFileAttachment(DeleteFileFieldFilesMixin, models.Model):
     @property
     def content_hash(self) -> str:
         """
-        Calculate the sha256 hash of the content.
+        Retrieve the sha256 hash of the content.
+
+        The hash is stored when the attachment is created from an upload. For older
+        attachments, it is calculated from the content.
 
         MD5 is fast, but has known collisions, so we use sha256 instead.
         """
-        chunk_size = 8192
-        sha256 = hashlib.sha256()
+        if self._content_hash:
+            return self._content_hash
         with self.content.open(mode="rb") as file_content:
-            while chunk := file_content.read(chunk_size):
-                sha256.update(chunk)
-        return sha256.hexdigest()
+            return calculate_sha256(file_content)
+
+
+class SubmissionExportQuerySet(DeleteFilesQuerySetMixin, models.QuerySet):
+    pass
+
+
+class SubmissionExport(DeleteFileFieldFilesMixin, models.Model):
+    """
+    Export of a selection of submissions, generated in the background.
+    """
+
+    uuid = models.UUIDField(_("UUID"), unique=True, default=uuid.uuid4)
+    form = models.ForeignKey(
+        "forms.Form",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        verbose_name=_("form"),
+        help_text=_("Form of the exported submissions."),
+    )
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        verbose_name=_("user"),
+        help_text=_("User who requested the export."),
+    )
+    file_type = models.CharField(
+        _("file type"),
+        max_length=10,
+        choices=ExportFormats.choices,
+    )
+    submission_ids = ArrayField(
+        base_field=models.PositiveIntegerField(),
+        default=list,
+        blank=True,
+        verbose_name=_("submission IDs"),
+        help_text=_("Primary keys of the submissions to export."),
+    )
+    status = models.CharField(
+        _("status"),
+        max_length=50,
+        choices=SubmissionExportStatuses.choices,
+        default=SubmissionExportStatuses.pending,
+    )
+    processed = models.PositiveIntegerField(
+        _("processed"),
+        default=0,
+        help_text=_("Number of submissions written to the export so far."),
+    )
+    total = models.PositiveIntegerField(
+        _("total"),
+        default=0,
+        help_text=_("Number of submissions in the export."),
+    )
+    content = PrivateMediaFileField(
+        verbose_name=_("content"),
+        upload_to="submission-exports/%Y/%m/%d",
+        blank=True,
+    )
+    task_id = models.CharField(
+        verbose_name=_("task id"),
+        max_length=200,
+        help_text=_("ID of the celery task generating the export."),
+        blank=True,
+    )
+    error_information = models.TextField(_("error information"), blank=True)
+    created_on = models.DateTimeField(_("created on"), auto_now_add=True)
+    completed_on = models.DateTimeField(_("completed on"), null=True, blank=True)
+
+    objects = SubmissionExportQuerySet.as_manager()
+
+    class Meta:
+        verbose_name = _("submission export")
+        verbose_name_plural = _("submission exports")
+        ordering = ("-created_on",)
+
+    def __str__(self):
+        return _("{file_type} export of {total} submissions").format(
+            file_type=self.get_file_type_display(), total=self.total
+        )
+
+    @property
+    def filename(self) -> str:
+        return f"submissions_export.{self.file_type}"
+
+    def get_submissions(self) -> models.QuerySet:
+        # unnest the stored IDs in the database instead of sending the (potentially
+        # very long) list of IDs along with every query
+        submission_ids = (
+            SubmissionExport.objects.filter(pk=self.pk)
+            .annotate(
+                submission_id=Func(
+                    F("submission_ids"),
+                    function="unnest",
+                    output_field=models.PositiveIntegerField(),
+                )
+            )
+            .values("submission_id")
+        )
+        return Submission.objects.filter(pk__in=submission_ids)
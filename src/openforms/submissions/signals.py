@@ -4,8 +4,13 @@ from django.db.models.base import ModelBase
 from django.db.models.signals import post_delete
 from django.dispatch import Signal, receiver
 
+from celery import states
+from celery.signals import task_postrun, task_revoked
+
 from openforms.submissions.models import SubmissionReport
 
+from .status import record_task_state
+
 logger = logging.getLogger(__name__)
 
 
@@ -39,3 +44,17 @@ def delete_submission_report_files(
     logger.debug("Deleting file %r", instance.content.name)
 
     instance.content.delete(save=False)
+
+
+# the receivers below feed the submission processing status, see
+# :mod:`openforms.submissions.status` - only the states of tracked tasks are recorded
+
+
+@task_postrun.connect
+def record_finished_task_state(task_id: str, state: str, **kwargs) -> None:
+    record_task_state(task_id, state)
+
+
+@task_revoked.connect
+def record_revoked_task_state(request, **kwargs) -> None:
+    record_task_state(request.id, states.REVOKED)
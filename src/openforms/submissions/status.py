@@ -1,40 +1,130 @@
 """
 Utility to interact with the celery task status.
+
+The SDK polls the status of a completed submission until its processing is done.
+Instead of reading the state of every task from the Celery result backend on every
+poll, the states of the on-completion tasks are recorded in the (shared) Django cache
+and all of them are read at once. The record is created when the tasks are scheduled
+and updated by the workers as the tasks finish (or fail, see
+:mod:`openforms.submissions.signals` and
+:func:`openforms.submissions.tasks.record_chord_failure`). There is an entry per task,
+so that tasks running in parallel do not overwrite each others state.
+
+The result backend is only used as fallback when there is no record, e.g. for tasks
+scheduled before the tracking was started or evicted cache entries.
 """
 from dataclasses import dataclass
-from typing import List
+from typing import Dict, List
 
+from django.core.cache import caches
 from django.urls import reverse
 
 from celery import states
+from celery.backends.redis import RedisBackend
 from celery.result import AsyncResult
 from rest_framework.request import Request
 
 from openforms.appointments.models import AppointmentInfo
+from openforms.celery import app
 
 from .constants import ProcessingResults, ProcessingStatuses
 from .models import Submission
-from .tokens import submission_report_token_generator
+from .tokens import submission_report_token_generator, submission_status_token_generator
 from .utils import add_submmission_to_session
 
+CACHE_ALIAS = "default"
+# keep the task states for as long as the status can be checked
+TASK_STATE_TIMEOUT = (submission_status_token_generator.token_timeout_days + 1) * (
+    60 * 60 * 24
+)
+
+
+def _get_task_state_key(task_id: str) -> str:
+    return f"submissions:task-state:{task_id}"
+
+
+def track_task_states(task_ids: List[str]) -> None:
+    """
+    Start recording the states of the tasks, which must not have been scheduled yet.
+
+    The states are recorded by :func:`record_task_state` as the tasks run.
+    """
+    caches[CACHE_ALIAS].set_many(
+        {_get_task_state_key(task_id): states.PENDING for task_id in task_ids},
+        timeout=TASK_STATE_TIMEOUT,
+    )
+
+
+def record_task_state(task_id: str, state: str) -> None:
+    """
+    Record the state of a task, if it is being tracked.
+
+    Other tasks (e.g. tasks not part of the on-completion processing, or the tasks of
+    the retry flow) are ignored.
+    """
+    cache = caches[CACHE_ALIAS]
+    key = _get_task_state_key(task_id)
+    if cache.get(key) is None:
+        return
+    cache.set(key, state, timeout=TASK_STATE_TIMEOUT)
+
+
+def forget_task_states(task_ids: List[str]) -> None:
+    caches[CACHE_ALIAS].delete_many(
+        [_get_task_state_key(task_id) for task_id in task_ids]
+    )
+
+
+def forget_results(task_ids: List[str]) -> None:
+    """
+    Remove the results of the tasks from the result backend, and their recorded states.
+
+    With the Redis result backend, all results are removed in a single command.
+    """
+    if not task_ids:
+        return
+
+    backend = app.backend
+    if isinstance(backend, RedisBackend):
+        keys = [backend.get_key_for_task(task_id) for task_id in task_ids]
+        backend.client.delete(*keys)
+    else:
+        for task_id in task_ids:
+            AsyncResult(task_id).forget()
+    forget_task_states(task_ids)
+
+
+def get_task_states(task_ids: List[str]) -> Dict[str, str]:
+    """
+    Look up the states of the tasks, with a single cache lookup for tracked tasks.
+
+    Only the tasks without a record are looked up in the result backend.
+    """
+    keys = {task_id: _get_task_state_key(task_id) for task_id in task_ids}
+    recorded = caches[CACHE_ALIAS].get_many(keys.values())
+    return {
+        task_id: recorded.get(key) or AsyncResult(task_id).state
+        for task_id, key in keys.items()
+    }
+
 
 @dataclass
 class SubmissionProcessingStatus:
     request: Request
     submission: Submission
 
-    def get_async_results(self) -> List[AsyncResult]:
-        if not hasattr(self, "_async_result"):
-            task_ids = self.submission.on_completion_task_ids
-            self._async_results = [AsyncResult(task_id) for task_id in task_ids]
-        return self._async_results
+    def get_task_states(self) -> List[str]:
+        if not hasattr(self, "_task_states"):
+            task_states = get_task_states(self.submission.on_completion_task_ids)
+            self._task_states = list(task_states.values())
+        return self._task_states
 
     @property
     def status(self) -> str:
-        results = self.get_async_results()
-        any_failed = any((result.state == states.FAILURE for result in results))
-        all_ready = all((result.state in states.READY_STATES for result in results))
-        if results and (any_failed or all_ready):
+        task_states = self.get_task_states()
+        any_failed = any((state == states.FAILURE for state in task_states))
+        all_ready = all((state in states.READY_STATES for state in task_states))
+        if task_states and (any_failed or all_ready):
             return ProcessingStatuses.done
         return ProcessingStatuses.in_progress
 
@@ -43,9 +133,9 @@ class SubmissionProcessingStatus:
         if self.status != ProcessingStatuses.done:
             return ""
 
-        results = self.get_async_results()
-        all_success = all((result.state == states.SUCCESS for result in results))
-        any_failed = any((result.state == states.FAILURE for result in results))
+        task_states = self.get_task_states()
+        all_success = all((state == states.SUCCESS for state in task_states))
+        any_failed = any((state == states.FAILURE for state in task_states))
 
         if all_success:
             return ProcessingResults.success
@@ -60,6 +150,10 @@ class SubmissionProcessingStatus:
 
     @property
     def error_message(self) -> str:
+        # error information is only relevant if the processing failed
+        if self.result != ProcessingResults.failed:
+            return ""
+
         # check if we have error information from appointments
         error_bits = []
 
@@ -119,9 +213,7 @@ class SubmissionProcessingStatus:
 
         Forgetting the results ensures that we don't leak resources.
         """
-        results = self.get_async_results()
-        for result in results:
-            result.forget()
+        forget_results(self.submission.on_completion_task_ids)
 
     def ensure_failure_can_be_managed(self) -> None:
         """
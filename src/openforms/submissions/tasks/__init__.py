@@ -4,15 +4,17 @@ from datetime import timedelta
 from django.conf import settings
 from django.utils import timezone
 
-from celery import chain, group
-from celery.result import AsyncResult
+from celery import chain, group, states
+from celery.utils import uuid
 
 from openforms.celery import app
 
 from ..models import Submission
+from ..status import record_task_state, track_task_states
 from .appointments import *  # noqa
 from .cleanup import *  # noqa
 from .emails import *  # noqa
+from .exports import *  # noqa
 from .payments import *  # noqa
 from .pdf import *  # noqa
 from .registration import *  # noqa
@@ -33,10 +35,41 @@ def on_completion(submission_id: int) -> None:
     register_appointment_task = maybe_register_appointment.si(submission_id)
     update_appointment_task = maybe_update_appointment.si(submission_id)
     generate_report_task = generate_submission_report.si(submission_id)
+    resize_attachments_task = ensure_attachments_resized.si(submission_id)
     register_submission_task = register_submission.si(submission_id)
     obtain_submission_reference_task = obtain_submission_reference.si(submission_id)
     finalize_completion_task = finalize_completion.si(submission_id)
 
+    # The task IDs are determined upfront so we can check the state later, rather
+    # than deriving them from the (nested) result graph of the workflow.
+    tasks = [
+        register_appointment_task,
+        generate_report_task,
+        resize_attachments_task,
+        register_submission_task,
+        obtain_submission_reference_task,
+        update_appointment_task,
+        finalize_completion_task,
+    ]
+    task_ids = []
+    for task in tasks:
+        task_id = uuid()
+        task.set(task_id=task_id)
+        task_ids.append(task_id)
+
+    # If the appointment registration fails, the end-user returns to the form and the
+    # report generated in parallel is outdated - it must be discarded. The chord error
+    # handling only kicks in once all the tasks of the group are done, so this cannot
+    # race with the report generation.
+    register_submission_task.on_error(
+        discard_report_after_failed_appointment.si(submission_id)
+    )
+    # When a task of the group fails, the chord callback never runs and is marked as
+    # failed in the result backend only - record that for the processing status too.
+    register_submission_task.on_error(
+        record_chord_failure.si(register_submission_task.id)
+    )
+
     # for the orchestration with distributed processing and dependencies between
     # tasks, see the Celery documentation:
     # https://docs.celeryproject.org/en/stable/userguide/canvas.html#guide-canvas
@@ -45,36 +78,29 @@ def on_completion(submission_id: int) -> None:
     # The linked task (= next task) is only executed if the previous task returns
     # successfully, so error handling needs to happen inside each task.
     on_completion_chain = chain(
-        # The appointment must be registered before a confirmation PDF is generated and
-        # any backend registration happens, as on-failure, the user should get feedback
-        # about the failure.
-        register_appointment_task,
-        # The submission report needs to already have been generated before it can be
-        # attached in the registration backend.
-        # TODO: can be in parallel with register_appointment_task and if that fails -> delete the report again
-        generate_report_task,
-        # TODO: ensure that any images that need resizing are done so before this is attempted
+        # The appointment must be registered before any backend registration happens,
+        # as on-failure, the user should get feedback about the failure. The submission
+        # report does not depend on the appointment and is generated in parallel - it
+        # needs to already have been generated before it can be attached in the
+        # registration backend. Likewise, the attached images must have been resized.
+        # A group followed by a task is turned into a chord.
+        group(register_appointment_task, generate_report_task, resize_attachments_task),
         register_submission_task,
         obtain_submission_reference_task,
         update_appointment_task,
-        # we schedule the finalization so that the ``async_result`` below is marked
-        # as done, which is the "signal" to show the confirmation page. Actual payment
-        # flow & confirmation e-mail follow later.
+        # we schedule the finalization so that the last task is marked as done, which
+        # is the "signal" to show the confirmation page. Actual payment flow &
+        # confirmation e-mail follow later.
         finalize_completion_task,
     )
 
     # this can run any time because they have been claimed earlier
     cleanup_temporary_files_for.delay(submission_id)
 
-    async_result: AsyncResult = on_completion_chain.delay()
-
-    # obtain all the task IDs so we can check the state later
-    task_ids = []
-
-    node = async_result
-    while node is not None:
-        task_ids.append(node.id)
-        node = node.parent
+    # the states are recorded as the tasks run, so this must happen before the chain
+    # is scheduled
+    track_task_states(task_ids)
+    on_completion_chain.delay()
 
     # NOTE - this is "risky" since we're running outside of the transaction (this code
     # should run in transaction.on_commit)!
@@ -95,6 +121,17 @@ def finalize_completion(submission_id: int) -> None:
     send_confirmation_email_task.delay()
 
 
+@app.task(ignore_result=True)
+def record_chord_failure(task_id: str) -> None:
+    """
+    Record the failure of the chord callback in the on-completion processing.
+
+    The callback is not executed when a task of the chord header fails, so its
+    failure is not recorded by the task signals.
+    """
+    record_task_state(task_id, states.FAILURE)
+
+
 def on_completion_retry(submission_id: int) -> chain:
     """
     Celery chain of tasks to execute on a submission completion processing retry.
@@ -2,6 +2,8 @@ import logging
 
 from celery_once import QueueOnce
 
+from openforms.appointments.constants import AppointmentDetailsStatus
+from openforms.appointments.models import AppointmentInfo
 from openforms.appointments.service import (
     AppointmentRegistrationFailed,
     AppointmentUpdateFailed,
@@ -9,11 +11,12 @@ from openforms.appointments.service import (
 )
 from openforms.celery import app
 
-from ..models import Submission
+from ..models import Submission, SubmissionReport
 
 __all__ = [
     "maybe_register_appointment",
     "maybe_update_appointment",
+    "discard_report_after_failed_appointment",
 ]
 
 logger = logging.getLogger(__name__)
@@ -83,3 +86,33 @@ def maybe_update_appointment(submission_id: int) -> None:
         submission.needs_on_completion_retry = True
         submission.save(update_fields=["needs_on_completion_retry"])
         return
+
+
+@app.task(ignore_result=True)
+def discard_report_after_failed_appointment(submission_id: int) -> None:
+    """
+    Compensate for the submission report generated while the appointment failed.
+
+    The submission report is generated in parallel with the appointment
+    registration. When the registration fails, the end-user has to correct the
+    submission and complete it again, so the report is outdated and must not be
+    re-used by the (idempotent) report generation.
+    """
+    appointment_failed = AppointmentInfo.objects.filter(
+        submission_id=submission_id,
+        status__in=[
+            AppointmentDetailsStatus.failed,
+            AppointmentDetailsStatus.missing_info,
+        ],
+    ).exists()
+    if not appointment_failed:
+        return
+
+    for report in SubmissionReport.objects.filter(submission_id=submission_id):
+        logger.info(
+            "Discarding report %d of submission %d after failed appointment",
+            report.pk,
+            submission_id,
+        )
+        report.content.delete(save=False)
+        report.delete()
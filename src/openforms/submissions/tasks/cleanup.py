@@ -1,15 +1,13 @@
+import logging
+import time
 from datetime import timedelta
 
-from django.db import transaction
-from django.test import RequestFactory
 from django.utils import timezone
 
-from rest_framework.request import Request
-
 from openforms.celery import app
 
 from ..models import Submission
-from ..status import SubmissionProcessingStatus
+from ..status import forget_results
 from ..tokens import submission_status_token_generator
 
 __all__ = ["cleanup_on_completion_results", "finalize_completion_retry"]
@@ -22,9 +20,13 @@ __all__ = ["cleanup_on_completion_results", "finalize_completion_retry"]
 # information.
 RETAIN_RESULTS_NUM_DAYS = submission_status_token_generator.token_timeout_days + 1
 
+CLEANUP_BATCH_SIZE = 1000
+
+logger = logging.getLogger(__name__)
+
 
 @app.task(ignore_result=True)
-def cleanup_on_completion_results():
+def cleanup_on_completion_results(batch_size: int = CLEANUP_BATCH_SIZE):
     """
     Ensure that celery task execution results are removed from the result backend.
 
@@ -35,10 +37,10 @@ def cleanup_on_completion_results():
 
     Note that we can only do that for submissions which don't need no further status
     check processing.
-    """
-    rf = RequestFactory()
-    dummy_request = Request(rf.get("/dummy"))
 
+    The submissions are processed in batches - the results of all the tasks of a batch
+    are removed at once and the task IDs are cleared with a single query.
+    """
     cutoff = timezone.now() - timedelta(days=RETAIN_RESULTS_NUM_DAYS)
 
     submissions = Submission.objects.filter(
@@ -47,16 +49,39 @@ def cleanup_on_completion_results():
         suspended_on__isnull=True,
         # only clean up submissions that have task_ids stored (prevent re-processing)
         on_completion_task_ids__len__gt=0,
-    )
-
-    for submission in submissions:
-        processing_status = SubmissionProcessingStatus(
-            submission=submission, request=dummy_request
+    ).order_by("pk")
+
+    start = time.monotonic()
+    num_submissions, num_tasks = 0, 0
+    last_pk = 0
+    while True:
+        batch = list(
+            submissions.filter(pk__gt=last_pk).values_list(
+                "pk", "on_completion_task_ids"
+            )[:batch_size]
         )
-        with transaction.atomic():
-            processing_status.forget_results()
-            submission.on_completion_task_ids = []
-            submission.save(update_fields=["on_completion_task_ids"])
+        if not batch:
+            break
+
+        pks = [pk for pk, _ in batch]
+        task_ids = [
+            task_id for _, batch_task_ids in batch for task_id in batch_task_ids
+        ]
+        forget_results(task_ids)
+        Submission.objects.filter(pk__in=pks).update(on_completion_task_ids=[])
+
+        num_submissions += len(pks)
+        num_tasks += len(task_ids)
+        last_pk = pks[-1]
+
+    duration = time.monotonic() - start
+    logger.info(
+        "Removed the results of %d tasks of %d submissions in %.2fs (%.0f submissions/s)",
+        num_tasks,
+        num_submissions,
+        duration,
+        num_submissions / duration if duration else 0,
+    )
 
 
 @app.task(ignore_result=True)
@@ -0,0 +1,69 @@
+import logging
+from datetime import timedelta
+from tempfile import TemporaryFile
+
+from django.conf import settings
+from django.core.files import File
+from django.utils import timezone
+
+from openforms.celery import app
+
+from ..constants import SubmissionExportStatuses
+from ..exports import ExportFileTypes, write_submission_export
+from ..models import SubmissionExport
+
+__all__ = ["generate_submission_export", "cleanup_submission_exports"]
+
+
+logger = logging.getLogger(__name__)
+
+
+@app.task(bind=True)
+def generate_submission_export(task, export_id: int) -> None:
+    logger.debug("Generating submission export %d", export_id)
+    export = SubmissionExport.objects.get(id=export_id)
+
+    # idempotency: check if the export was already generated
+    if export.status == SubmissionExportStatuses.done and export.content:
+        logger.debug("Submission export was already generated, skipping...")
+        return
+
+    export.status = SubmissionExportStatuses.in_progress
+    export.task_id = task.request.id or ""
+    export.processed = 0
+    export.save(update_fields=["status", "task_id", "processed"])
+
+    def report_progress(processed: int) -> None:
+        SubmissionExport.objects.filter(pk=export.pk).update(processed=processed)
+
+    try:
+        with TemporaryFile() as export_file:
+            write_submission_export(
+                export.get_submissions(),
+                ExportFileTypes.get(export.file_type),
+                export_file,
+                progress=report_progress,
+            )
+            export_file.seek(0)
+            export.content.save(export.filename, File(export_file), save=False)
+    except Exception as exc:
+        logger.exception("Generating submission export %d failed", export_id)
+        export.status = SubmissionExportStatuses.failed
+        export.error_information = str(exc)
+        export.save(update_fields=["status", "error_information"])
+        raise
+
+    export.status = SubmissionExportStatuses.done
+    export.completed_on = timezone.now()
+    export.save(update_fields=["content", "status", "completed_on"])
+
+
+@app.task(ignore_result=True)
+def cleanup_submission_exports() -> None:
+    """
+    Remove the exports (and their files) older than the configured number of days.
+    """
+    days = settings.SUBMISSION_EXPORTS_REMOVED_AFTER_DAYS
+    cutoff = timezone.now() - timedelta(days=days)
+    num_deleted, _ = SubmissionExport.objects.filter(created_on__lt=cutoff).delete()
+    logger.info("Removed %d submission exports", num_deleted)
@@ -14,6 +14,7 @@ logger = logging.getLogger(__name__)
 
 
 @app.task(bind=True)
+@logevent.buffered_logging()
 def generate_submission_report(task, submission_id: int) -> None:
     logger.debug("Generating submission report for submission %d", submission_id)
     submission = Submission.objects.get(id=submission_id)
@@ -1,13 +1,16 @@
+import logging
 from datetime import timedelta
 from typing import Tuple
 
 from django.conf import settings
+from django.db import transaction
 
 from openforms.celery import app
 
 from ..attachments import (
     cleanup_submission_temporary_uploaded_files,
     cleanup_unclaimed_temporary_uploaded_files,
+    get_attachments_to_resize,
     resize_attachment,
 )
 from ..models import Submission, SubmissionFileAttachment
@@ -16,8 +19,11 @@ __all__ = [
     "cleanup_temporary_files_for",
     "cleanup_unclaimed_temporary_files",
     "resize_submission_attachment",
+    "ensure_attachments_resized",
 ]
 
+logger = logging.getLogger(__name__)
+
 
 @app.task(ignore_result=True)
 def cleanup_temporary_files_for(submission_id: int) -> None:
@@ -33,5 +39,36 @@ def cleanup_unclaimed_temporary_files() -> None:
 
 @app.task(ignore_result=True)
 def resize_submission_attachment(attachment_id: int, size: Tuple[int, int]) -> None:
-    attachment = SubmissionFileAttachment.objects.get(id=attachment_id)
-    resize_attachment(attachment, size)
+    with transaction.atomic():
+        # the completion flow may be resizing the same attachment - the lock makes the
+        # last one to get it see the already resized image, which is left alone.
+        attachment = SubmissionFileAttachment.objects.select_for_update().get(
+            id=attachment_id
+        )
+        resize_attachment(attachment, size)
+
+
+@app.task(ignore_result=False)
+def ensure_attachments_resized(submission_id: int) -> None:
+    """
+    Resize the attached images of the submission that have not been resized yet.
+
+    Images are resized in the background when they are attached to a submission step,
+    which may not have happened yet when the submission is completed. This task is
+    part of the completion flow so that images are never registered unresized - the
+    remaining images are resized in this task, waiting for the resizes that are in
+    progress.
+
+    A failing resize must not block the registration, the image is registered as-is.
+    """
+    submission = Submission.objects.get(id=submission_id)
+    for attachment, size in get_attachments_to_resize(submission):
+        try:
+            resize_submission_attachment(attachment.id, size)
+        except Exception:
+            logger.exception(
+                "Resizing attachment %d of submission %d failed, continuing with the "
+                "original image",
+                attachment.id,
+                submission_id,
+            )
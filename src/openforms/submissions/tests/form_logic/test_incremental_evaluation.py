@@ -0,0 +1,127 @@
+from unittest.mock import patch
+
+from django.core.cache import caches
+from django.test import TestCase
+
+from openforms.forms.logic import get_rules
+from openforms.forms.tests.factories import FormFactory, FormStepFactory
+
+from ...form_logic import evaluate_form_logic
+from ..factories import SubmissionFactory, SubmissionStepFactory
+from .factories import FormLogicFactory
+
+
+def _hide(component: str) -> dict:
+    return {
+        "component": component,
+        "action": {
+            "name": "Hide element",
+            "type": "property",
+            "property": {"type": "bool", "value": "hidden"},
+            "state": True,
+        },
+    }
+
+
+class IncrementalEvaluationTests(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.addCleanup(caches["default"].clear)
+
+        self.form = FormFactory.create()
+        self.form_step = FormStepFactory.create(
+            form=self.form,
+            form_definition__configuration={
+                "components": [
+                    {"type": "textfield", "key": "foo"},
+                    {"type": "textfield", "key": "bar"},
+                    {"type": "textfield", "key": "target1"},
+                    {"type": "textfield", "key": "target2"},
+                ]
+            },
+        )
+        FormLogicFactory.create(
+            form=self.form,
+            json_logic_trigger={"==": [{"var": "foo"}, "hide"]},
+            actions=[_hide("target1")],
+        )
+        FormLogicFactory.create(
+            form=self.form,
+            json_logic_trigger={"==": [{"var": "bar"}, "hide"]},
+            actions=[_hide("target2")],
+        )
+        self.submission = SubmissionFactory.create(form=self.form)
+
+    def _evaluate(self, data: dict) -> dict:
+        step = SubmissionStepFactory.build(
+            submission=self.submission, form_step=self.form_step, data=data
+        )
+        configuration = evaluate_form_logic(self.submission, step, data, dirty=True)
+        return {
+            component["key"]: component.get("hidden", False)
+            for component in configuration["components"]
+        }
+
+    def test_only_affected_rules_are_evaluated(self):
+        rule_foo, rule_bar = get_rules(self.form)
+        self._evaluate({"foo": "hide", "bar": ""})
+
+        with patch.object(
+            rule_foo, "trigger", wraps=rule_foo.trigger
+        ) as mock_foo, patch.object(
+            rule_bar, "trigger", wraps=rule_bar.trigger
+        ) as mock_bar:
+            hidden = self._evaluate({"foo": "hide", "bar": "hide"})
+
+        mock_foo.assert_not_called()
+        mock_bar.assert_called_once()
+        # the previous result of the skipped rule is still applied
+        self.assertTrue(hidden["target1"])
+        self.assertTrue(hidden["target2"])
+
+    def test_all_rules_evaluated_after_logic_changes(self):
+        self._evaluate({"foo": "hide", "bar": ""})
+        FormLogicFactory.create(
+            form=self.form,
+            json_logic_trigger={"==": [{"var": "foo"}, "show"]},
+            actions=[_hide("bar")],
+        )
+        self.submission._execution_state.logic_evaluation = None
+
+        rules = get_rules(self.form)
+        with patch.object(rules[1], "trigger", wraps=rules[1].trigger) as mock_bar:
+            self._evaluate({"foo": "hide", "bar": ""})
+
+        mock_bar.assert_called_once()
+
+    def test_submitted_data_not_stored_in_cache(self):
+        self._evaluate({"foo": "hide", "bar": "secret"})
+
+        evaluation = caches["default"].get(
+            f"submissions:logic-evaluation-v3:{self.submission.uuid}"
+        )
+
+        self.assertIsNotNone(evaluation)
+        self.assertNotIn("secret", str(evaluation))
+        self.assertNotIn("hide", str(evaluation))
+
+    def test_inputs_not_comparable_between_submissions(self):
+        other_submission = SubmissionFactory.create(form=self.form)
+        self._evaluate({"foo": "hide", "bar": "secret"})
+        step = SubmissionStepFactory.build(
+            submission=other_submission,
+            form_step=self.form_step,
+            data={"foo": "hide", "bar": "secret"},
+        )
+        evaluate_form_logic(other_submission, step, step.data, dirty=True)
+
+        inputs = caches["default"].get(
+            f"submissions:logic-evaluation-v3:{self.submission.uuid}"
+        )["inputs"]
+        other_inputs = caches["default"].get(
+            f"submissions:logic-evaluation-v3:{other_submission.uuid}"
+        )["inputs"]
+
+        self.assertEqual(inputs.keys(), other_inputs.keys())
+        self.assertNotEqual(inputs["bar"], other_inputs["bar"])
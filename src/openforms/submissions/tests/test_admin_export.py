@@ -1,14 +1,27 @@
+import os
+from unittest.mock import patch
+
+from django.core.files.base import ContentFile
+from django.test import TestCase, override_settings
 from django.urls import reverse
 from django.utils import timezone
 
 import tablib
+from django_capture_on_commit_callbacks import capture_on_commit_callbacks
 from django_webtest import WebTest
+from freezegun import freeze_time
 from lxml import etree
+from privates.test import temp_private_root
 
 from openforms.accounts.tests.factories import UserFactory
 from openforms.forms.tests.factories import FormDefinitionFactory, FormStepFactory
 from openforms.logging.models import TimelineLogProxy
-from openforms.submissions.models import Submission
+from openforms.submissions.constants import SubmissionExportStatuses
+from openforms.submissions.models import Submission, SubmissionExport
+from openforms.submissions.tasks import (
+    cleanup_submission_exports,
+    generate_submission_export,
+)
 from openforms.submissions.tests.factories import (
     SubmissionFactory,
     SubmissionStepFactory,
@@ -74,29 +87,30 @@ class TestSubmissionExportAdmin(WebTest):
         super().setUp()
         self.user = UserFactory.create(is_superuser=True, is_staff=True, app=self.app)
 
-    def test_export_csv_successfully_exports_csv_file(self):
+    def _export(self, action: str):
         response = self.app.get(
             reverse("admin:submissions_submission_changelist"), user=self.user
         )
 
         form = response.forms["changelist-form"]
-        form["action"] = "export_csv"
+        form["action"] = action
         form["_selected_action"] = [
             str(submission.pk) for submission in Submission.objects.all()
         ]
 
-        response = form.submit()
-
-        self.assertEqual(response.status_code, 200)
-        self.assertEqual(response["content-type"], "text/csv")
-        self.assertEqual(
-            response["content-disposition"],
-            'attachment; filename="submissions_export.csv"',
-        )
-        self.assertIsNotNone(response.content)
-        # check if it parses
-        tablib.Dataset().load(response.content.decode("utf8"), format="csv")
+        with patch(
+            "openforms.submissions.admin.generate_submission_export"
+        ) as mock_task:
+            with capture_on_commit_callbacks(execute=True):
+                response = form.submit()
 
+        # the export is generated in the background
+        self.assertEqual(response.status_code, 302)
+        export = SubmissionExport.objects.get()
+        self.assertEqual(export.status, SubmissionExportStatuses.pending)
+        self.assertEqual(export.total, 2)
+        self.assertEqual(export.user, self.user)
+        mock_task.delay.assert_called_once_with(export.id)
         self.assertEqual(
             TimelineLogProxy.objects.filter(
                 template="logging/events/submission_export_list.txt"
@@ -104,89 +118,54 @@ class TestSubmissionExportAdmin(WebTest):
             1,
         )
 
-    def test_export_xlsx_successfully_exports_xlsx_file(self):
-        response = self.app.get(
-            reverse("admin:submissions_submission_changelist"), user=self.user
+        generate_submission_export(export.id)
+
+        export.refresh_from_db()
+        self.assertEqual(export.status, SubmissionExportStatuses.done)
+        self.assertEqual(export.processed, 2)
+        self.assertIsNotNone(export.completed_on)
+
+        return self.app.get(
+            reverse("admin:submissions_submissionexport_content", args=(export.pk,)),
+            user=self.user,
         )
 
-        form = response.forms["changelist-form"]
-        form["action"] = "export_xlsx"
-        form["_selected_action"] = [
-            str(submission.pk) for submission in Submission.objects.all()
-        ]
+    def test_export_csv_successfully_exports_csv_file(self):
+        response = self._export("export_csv")
 
-        response = form.submit()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["content-type"], "text/csv")
+        self.assertIn("submissions_export.csv", response["content-disposition"])
+        # check if it parses
+        tablib.Dataset().load(response.content.decode("utf8"), format="csv")
+
+    def test_export_xlsx_successfully_exports_xlsx_file(self):
+        response = self._export("export_xlsx")
 
         self.assertEqual(response.status_code, 200)
         self.assertEqual(
             response["content-type"],
             "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
         )
-        self.assertEqual(
-            response["content-disposition"],
-            'attachment; filename="submissions_export.xlsx"',
-        )
-        self.assertIsNotNone(response.content)
+        self.assertIn("submissions_export.xlsx", response["content-disposition"])
         # check if it parses
         tablib.Dataset().load(response.content, format="xlsx")
 
-        self.assertEqual(
-            TimelineLogProxy.objects.filter(
-                template="logging/events/submission_export_list.txt"
-            ).count(),
-            1,
-        )
-
     def test_export_json_successfully_exports_json_file(self):
-        response = self.app.get(
-            reverse("admin:submissions_submission_changelist"), user=self.user
-        )
-
-        form = response.forms["changelist-form"]
-        form["action"] = "export_json"
-        form["_selected_action"] = [
-            str(submission.pk) for submission in Submission.objects.all()
-        ]
-
-        response = form.submit()
+        response = self._export("export_json")
 
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response["content-type"], "application/json")
-        self.assertEqual(
-            response["content-disposition"],
-            'attachment; filename="submissions_export.json"',
-        )
-        self.assertIsNotNone(response.content)
+        self.assertIn("submissions_export.json", response["content-disposition"])
         # check if it parses
         response.json
 
-        self.assertEqual(
-            TimelineLogProxy.objects.filter(
-                template="logging/events/submission_export_list.txt"
-            ).count(),
-            1,
-        )
-
     def test_export_xml_successfully_exports_xml_file(self):
-        response = self.app.get(
-            reverse("admin:submissions_submission_changelist"), user=self.user
-        )
-
-        form = response.forms["changelist-form"]
-        form["action"] = "export_xml"
-        form["_selected_action"] = [
-            str(submission.pk) for submission in Submission.objects.all()
-        ]
-
-        response = form.submit()
+        response = self._export("export_xml")
 
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response["content-type"], "text/xml")
-        self.assertEqual(
-            response["content-disposition"],
-            'attachment; filename="submissions_export.xml"',
-        )
-        self.assertIsNotNone(response.content)
+        self.assertIn("submissions_export.xml", response["content-disposition"])
 
         # check if it parses
         tree = etree.fromstring(response.content)
@@ -200,13 +179,25 @@ class TestSubmissionExportAdmin(WebTest):
         v = tree.xpath("/submissions/submission/field[@name='multi']/value/text()")
         self.assertEqual(v, ["aaa", "bbb"])
 
-        self.assertEqual(
-            TimelineLogProxy.objects.filter(
-                template="logging/events/submission_export_list.txt"
-            ).count(),
-            1,
+    def test_failed_export_is_marked_as_failed(self):
+        export = SubmissionExport.objects.create(
+            file_type="csv",
+            submission_ids=[self.submission_1.pk],
+            total=1,
         )
 
+        with patch(
+            "openforms.submissions.tasks.exports.write_submission_export",
+            side_effect=Exception("boom"),
+        ):
+            with self.assertRaises(Exception):
+                generate_submission_export(export.id)
+
+        export.refresh_from_db()
+        self.assertEqual(export.status, SubmissionExportStatuses.failed)
+        self.assertEqual(export.error_information, "boom")
+        self.assertFalse(export.content)
+
     def test_exporting_multiple_forms_fails(self):
         step = FormStepFactory.create()
         SubmissionFactory.create(form=step.form, completed_on=timezone.now())
@@ -236,3 +227,53 @@ class TestSubmissionExportAdmin(WebTest):
                 template="logging/events/submission_export_list.txt"
             ).exists()
         )
+        self.assertFalse(SubmissionExport.objects.exists())
+
+    @temp_private_root()
+    def test_download_exports_of_other_users(self):
+        owner = UserFactory.create()
+        export = SubmissionExport.objects.create(
+            user=owner,
+            file_type="csv",
+            status=SubmissionExportStatuses.done,
+            content=ContentFile(b"Formuliernaam", name="export.csv"),
+        )
+        url = reverse("admin:submissions_submissionexport_content", args=(export.pk,))
+        staff_user = UserFactory.create(
+            is_staff=True,
+            user_permissions=["submissions.change_submissionexport"],
+            app=self.app,
+        )
+
+        with self.subTest("staff user"):
+            response = self.app.get(url, user=staff_user, status=404)
+
+            self.assertEqual(response.status_code, 404)
+
+        with self.subTest("superuser"):
+            UserFactory.mock_two_factor_flow(self.user, self.app)
+
+            response = self.app.get(url, user=self.user)
+
+            self.assertEqual(response.status_code, 200)
+
+
+@temp_private_root()
+@override_settings(SUBMISSION_EXPORTS_REMOVED_AFTER_DAYS=7)
+class CleanupSubmissionExportsTests(TestCase):
+    def test_old_exports_removed(self):
+        with freeze_time("2022-03-01T12:00:00Z"):
+            old_export = SubmissionExport.objects.create(
+                file_type="csv",
+                content=ContentFile(b"Formuliernaam", name="export.csv"),
+            )
+        with freeze_time("2022-03-05T12:00:00Z"):
+            recent_export = SubmissionExport.objects.create(file_type="csv")
+        file_path = old_export.content.path
+
+        with freeze_time("2022-03-10T12:00:00Z"):
+            with capture_on_commit_callbacks(execute=True):
+                cleanup_submission_exports()
+
+        self.assertEqual(list(SubmissionExport.objects.all()), [recent_export])
+        self.assertFalse(os.path.exists(file_path))
@@ -0,0 +1,55 @@
+from django.test import TestCase
+
+from openforms.forms.tests.factories import FormStepFactory
+
+from ..exports import create_submission_export, get_data_headers, iter_csv
+from ..models import Submission
+from .factories import SubmissionFactory, SubmissionStepFactory
+
+
+class SubmissionExportTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        step = FormStepFactory.create(
+            form_definition__configuration={
+                "components": [
+                    {"type": "textfield", "key": "voornaam"},
+                    {"type": "textfield", "key": "achternaam"},
+                    {"type": "textfield", "key": "unused"},
+                ]
+            }
+        )
+        cls.form = step.form
+        for name in ("Alice", "Bob", "Carol"):
+            submission = SubmissionFactory.create(form=cls.form)
+            SubmissionStepFactory.create(
+                submission=submission,
+                form_step=step,
+                data={"achternaam": "Doe", "voornaam": name, "extra": 1},
+            )
+
+    def test_headers_from_form_definition_and_data(self):
+        headers = get_data_headers(Submission.objects.filter(form=self.form))
+
+        self.assertEqual(headers, ["voornaam", "achternaam", "extra"])
+
+    def test_export_rows(self):
+        dataset = create_submission_export(Submission.objects.filter(form=self.form))
+
+        self.assertEqual(
+            dataset.headers,
+            ["Formuliernaam", "Inzendingdatum", "voornaam", "achternaam", "extra"],
+        )
+        self.assertEqual(dataset["voornaam"], ["Alice", "Bob", "Carol"])
+
+    def test_number_of_queries_independent_of_submissions(self):
+        queryset = Submission.objects.filter(form=self.form)
+
+        # headers: data keys + form (steps); rows: submissions + steps + end of
+        # chunks
+        with self.assertNumQueries(6):
+            lines = list(iter_csv(queryset))
+
+        self.assertEqual(len(lines), 4)
@@ -17,7 +17,7 @@ from openforms.forms.tests.factories import (
     FormStepFactory,
 )
 
-from ..models import Submission, SubmissionFileAttachment
+from ..models import Submission, SubmissionFileAttachment, SubmissionStep
 from .factories import (
     SubmissionFactory,
     SubmissionFileAttachmentFactory,
@@ -48,6 +48,37 @@ class SubmissionTests(TestCase):
             {"key1": "value1", "key2": "value-a", "key3": "value-b"},
         )
 
+    def test_merged_data_cached_until_step_saved(self):
+        submission = SubmissionFactory.create()
+        step = SubmissionStepFactory.create(
+            submission=submission, data={"key1": "value1", "key2": ["a"]}
+        )
+        submission.data
+
+        with self.assertNumQueries(0):
+            data = submission.data
+        # modifying the result does not affect the cached data
+        data["key1"] = "modified"
+        data["key2"].append("b")
+        self.assertEqual(submission.data, {"key1": "value1", "key2": ["a"]})
+
+        step.data = {"key1": "value2"}
+        step.save()
+
+        self.assertEqual(submission.data, {"key1": "value2"})
+
+    def test_merged_data_cache_cleared_on_refresh(self):
+        submission = SubmissionFactory.create()
+        step = SubmissionStepFactory.create(
+            submission=submission, data={"key1": "value1"}
+        )
+        submission.data
+
+        SubmissionStep.objects.filter(pk=step.pk).update(data={"key1": "value2"})
+        submission.refresh_from_db()
+
+        self.assertEqual(submission.data, {"key1": "value2"})
+
     def test_get_ordered_data_with_component_type(self):
         form_definition = FormDefinitionFactory.create(
             configuration={
@@ -1,18 +1,27 @@
 import uuid
+from unittest.mock import patch
 
 from django.core import mail
 from django.test import TestCase, override_settings
 
+from celery import states
 from privates.test import temp_private_root
 
+from openforms.appointments.constants import AppointmentDetailsStatus
 from openforms.appointments.service import AppointmentRegistrationFailed
+from openforms.appointments.tests.factories import AppointmentInfoFactory
 from openforms.appointments.tests.utils import setup_jcc
 from openforms.emails.tests.factories import ConfirmationEmailTemplateFactory
 from openforms.forms.tests.factories import FormDefinitionFactory
 
 from ..models import SubmissionReport, TemporaryFileUpload
-from ..tasks import on_completion
-from .factories import SubmissionFactory, SubmissionFileAttachmentFactory
+from ..status import get_task_states
+from ..tasks import discard_report_after_failed_appointment, on_completion
+from .factories import (
+    SubmissionFactory,
+    SubmissionFileAttachmentFactory,
+    SubmissionReportFactory,
+)
 
 
 @temp_private_root()
@@ -51,8 +60,8 @@ class OnCompletionTests(TestCase):
                     self.fail("Invalid task ID returned")
 
         self.assertEqual(
-            len(submission.on_completion_task_ids), 6
-        )  # 6 tasks in the chain
+            len(submission.on_completion_task_ids), 7
+        )  # 7 tasks in the chain
         # registration result reference
         self.assertTrue(submission.public_registration_reference.startswith("OF-"))
         self.assertTrue(SubmissionReport.objects.filter(submission=submission).exists())
@@ -60,6 +69,11 @@ class OnCompletionTests(TestCase):
         self.assertEqual(
             len(mail.outbox), 2
         )  # registration backend + confirmation email
+        # the states are recorded for the status checks
+        with patch("openforms.submissions.status.AsyncResult") as mock_AsyncResult:
+            task_states = get_task_states(submission.on_completion_task_ids)
+        self.assertEqual(set(task_states.values()), {states.SUCCESS})
+        mock_AsyncResult.assert_not_called()
 
     def test_submission_form_with_incomplete_appointment(self):
         setup_jcc()
@@ -75,3 +89,32 @@ class OnCompletionTests(TestCase):
 
         with self.assertRaises(AppointmentRegistrationFailed):
             on_completion(submission.id)
+
+
+@temp_private_root()
+class DiscardReportAfterFailedAppointmentTests(TestCase):
+    def test_report_discarded_if_appointment_failed(self):
+        appointment_info = AppointmentInfoFactory.create(has_missing_info=True)
+        report = SubmissionReportFactory.create(submission=appointment_info.submission)
+
+        discard_report_after_failed_appointment(appointment_info.submission.id)
+
+        self.assertFalse(SubmissionReport.objects.exists())
+        self.assertFalse(report.content.storage.exists(report.content.name))
+
+    def test_report_kept_if_appointment_succeeded(self):
+        appointment_info = AppointmentInfoFactory.create(
+            status=AppointmentDetailsStatus.success, appointment_id="123456789"
+        )
+        SubmissionReportFactory.create(submission=appointment_info.submission)
+
+        discard_report_after_failed_appointment(appointment_info.submission.id)
+
+        self.assertTrue(SubmissionReport.objects.exists())
+
+    def test_report_kept_without_appointment(self):
+        report = SubmissionReportFactory.create()
+
+        discard_report_after_failed_appointment(report.submission.id)
+
+        self.assertTrue(SubmissionReport.objects.exists())
@@ -1,10 +1,12 @@
 import os
+from io import BytesIO
 from unittest.mock import patch
 
 from django.core.files import File
 from django.test import TestCase, override_settings
 from django.urls import reverse
 
+from django_capture_on_commit_callbacks import capture_on_commit_callbacks
 from PIL import Image, UnidentifiedImageError
 from privates.test import temp_private_root
 
@@ -12,6 +14,7 @@ from openforms.accounts.tests.factories import SuperUserFactory
 from openforms.api.exceptions import RequestEntityTooLarge
 from openforms.forms.tests.factories import FormStepFactory
 from openforms.tests.utils import disable_2fa
+from openforms.utils.files import calculate_sha256
 
 from ..attachments import (
     append_file_num_postfix,
@@ -22,6 +25,7 @@ from ..attachments import (
     resolve_uploads_from_data,
 )
 from ..models import SubmissionFileAttachment
+from ..tasks import ensure_attachments_resized
 from .factories import (
     SubmissionFactory,
     SubmissionFileAttachmentFactory,
@@ -268,7 +272,8 @@ class SubmissionAttachmentTest(TestCase):
         )
 
         # test attaching the file
-        result = attach_uploads_to_submission_step(submission_step)
+        with capture_on_commit_callbacks(execute=True):
+            result = attach_uploads_to_submission_step(submission_step)
 
         self.assertEqual(len(result), 1)
         self.assertEqual(result[0][1], True)  # created new
@@ -386,6 +391,18 @@ class SubmissionAttachmentTest(TestCase):
         res = resize_attachment(attachment, (200, 200))
         self.assertEqual(res, False)
 
+        # large JPEG images are resized while keeping the aspect ratio
+        jpeg = BytesIO()
+        Image.new("RGB", (4000, 3000), color="red").save(jpeg, "jpeg")
+        attachment_jpeg = SubmissionFileAttachmentFactory.create(
+            content__name="my-image.jpg", content__data=jpeg.getvalue()
+        )
+        res = resize_attachment(attachment_jpeg, (200, 200))
+        self.assertEqual(res, True)
+        self.assertImageSize(attachment_jpeg.content, 200, 150, "jpeg")
+        with attachment_jpeg.content.open("rb") as content:
+            self.assertEqual(attachment_jpeg.content_hash, calculate_sha256(content))
+
         # don't crash on corrupt image
         attachment_bad = SubmissionFileAttachmentFactory.create(
             content__name="my-image.png", content__data=b"broken"
@@ -444,3 +461,101 @@ class SubmissionAttachmentTest(TestCase):
         )
 
         self.assertEqual(submission_file_attachment.content_hash, expected_content_hash)
+
+    def test_content_hash_stored(self):
+        submission_file_attachment = SubmissionFileAttachmentFactory.create(
+            content__data=b"a predictable hash source", _content_hash="stored"
+        )
+
+        self.assertEqual(submission_file_attachment.content_hash, "stored")
+
+    def test_create_from_upload_links_content(self):
+        upload = TemporaryFileUploadFactory.create(
+            content__data=b"linked content", content_hash="abc123"
+        )
+        submission_step = SubmissionStepFactory.create()
+
+        attachment, created = SubmissionFileAttachment.objects.create_from_upload(
+            submission_step, "my_file", upload
+        )
+
+        self.assertTrue(created)
+        self.assertEqual(attachment._content_hash, "abc123")
+        self.assertNotEqual(attachment.content.path, upload.content.path)
+        self.assertTrue(os.path.samefile(attachment.content.path, upload.content.path))
+
+        upload.delete()
+
+        attachment.refresh_from_db()
+        with attachment.content.open("rb") as content:
+            self.assertEqual(content.read(), b"linked content")
+
+    def test_ensure_attachments_resized(self):
+        with open(self.test_image_path, "rb") as f:
+            data = f.read()
+        components = [
+            {"key": "my_file", "type": "file"},
+            {
+                "key": "my_image",
+                "type": "file",
+                "of": {
+                    "image": {"resize": {"apply": True, "width": 100, "height": 100}}
+                },
+            },
+        ]
+        submission_step = SubmissionStepFactory.create(
+            form_step__form_definition__configuration={"components": components}
+        )
+        not_resized = SubmissionFileAttachmentFactory.create(
+            submission_step=submission_step,
+            form_key="my_file",
+            content__name="my-image.png",
+            content__data=data,
+        )
+        resized = SubmissionFileAttachmentFactory.create(
+            submission_step=submission_step,
+            form_key="my_image",
+            content__name="my-image.png",
+            content__data=data,
+        )
+
+        ensure_attachments_resized(submission_step.submission.id)
+
+        not_resized.refresh_from_db()
+        resized.refresh_from_db()
+        self.assertImageSize(not_resized.content, 256, 256, "png")
+        self.assertImageSize(resized.content, 100, 100, "png")
+
+    def test_ensure_attachments_resized_failure_does_not_block(self):
+        with open(self.test_image_path, "rb") as f:
+            data = f.read()
+        components = [
+            {
+                "key": "my_image",
+                "type": "file",
+                "of": {
+                    "image": {"resize": {"apply": True, "width": 100, "height": 100}}
+                },
+            },
+        ]
+        submission_step = SubmissionStepFactory.create(
+            form_step__form_definition__configuration={"components": components}
+        )
+        attachment = SubmissionFileAttachmentFactory.create(
+            submission_step=submission_step,
+            form_key="my_image",
+            content__name="my-image.png",
+            content__data=data,
+        )
+
+        with patch(
+            "openforms.submissions.tasks.user_uploads.resize_attachment",
+            side_effect=OSError("disk full"),
+        ):
+            with self.assertLogs(
+                "openforms.submissions.tasks.user_uploads", level="ERROR"
+            ):
+                ensure_attachments_resized(submission_step.submission.id)
+
+        attachment.refresh_from_db()
+        self.assertImageSize(attachment.content, 256, 256, "png")
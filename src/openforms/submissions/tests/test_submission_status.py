@@ -1,11 +1,14 @@
 from datetime import timedelta
 from decimal import Decimal
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
-from django.test import TestCase
+from django.core.cache import caches
+from django.test import SimpleTestCase, TestCase
 from django.utils import timezone
 
 from celery import states
+from celery.backends.redis import RedisBackend
+from celery.signals import task_postrun
 from freezegun import freeze_time
 from privates.test import temp_private_root
 from rest_framework import status
@@ -18,7 +21,13 @@ from openforms.payments.contrib.ogone.tests.factories import OgoneMerchantFactor
 from openforms.payments.tests.factories import SubmissionPaymentFactory
 
 from ..constants import SUBMISSIONS_SESSION_KEY, ProcessingResults, ProcessingStatuses
-from ..tasks import cleanup_on_completion_results
+from ..status import (
+    forget_results,
+    get_task_states,
+    record_task_state,
+    track_task_states,
+)
+from ..tasks import cleanup_on_completion_results, record_chord_failure
 from ..tokens import submission_status_token_generator
 from .factories import SubmissionFactory, SubmissionReportFactory
 
@@ -210,6 +219,83 @@ class SubmissionStatusStatusAndResultTests(APITestCase):
             )
 
 
+@temp_private_root()
+class TrackedTaskStatesTests(APITestCase):
+    def setUp(self):
+        super().setUp()
+        caches["default"].clear()
+        self.addCleanup(caches["default"].clear)
+
+    def _get_status(self, submission):
+        token = submission_status_token_generator.make_token(submission)
+        check_status_url = reverse(
+            "api:submission-status", kwargs={"uuid": submission.uuid, "token": token}
+        )
+        response = self.client.get(check_status_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.json()
+
+    @patch("openforms.submissions.status.AsyncResult")
+    def test_tracked_states_do_not_use_result_backend(self, mock_AsyncResult):
+        submission = SubmissionFactory.create(
+            completed=True, on_completion_task_ids=["task-1", "task-2"]
+        )
+        SubmissionReportFactory.create(submission=submission)
+        track_task_states(["task-1", "task-2"])
+        record_task_state("task-1", states.SUCCESS)
+
+        with self.subTest("in progress"):
+            response_data = self._get_status(submission)
+
+            self.assertEqual(response_data["status"], ProcessingStatuses.in_progress)
+
+        record_task_state("task-2", states.SUCCESS)
+
+        with self.subTest("done"):
+            response_data = self._get_status(submission)
+
+            self.assertEqual(response_data["status"], ProcessingStatuses.done)
+            self.assertEqual(response_data["result"], ProcessingResults.success)
+
+        mock_AsyncResult.assert_not_called()
+
+    @patch("openforms.submissions.status.AsyncResult")
+    def test_untracked_tasks_use_result_backend(self, mock_AsyncResult):
+        mock_AsyncResult.return_value.state = states.PENDING
+        record_task_state("task-1", states.SUCCESS)
+
+        task_states = get_task_states(["task-1"])
+
+        self.assertEqual(task_states, {"task-1": states.PENDING})
+        mock_AsyncResult.assert_called_once_with("task-1")
+
+    @patch("openforms.submissions.status.AsyncResult")
+    def test_finished_task_state_recorded_by_signal(self, mock_AsyncResult):
+        track_task_states(["task-1"])
+
+        task_postrun.send(sender=None, task_id="task-1", state=states.FAILURE)
+
+        self.assertEqual(get_task_states(["task-1"]), {"task-1": states.FAILURE})
+        mock_AsyncResult.assert_not_called()
+
+    @patch("openforms.submissions.status.AsyncResult")
+    def test_untracked_task_state_not_recorded_by_signal(self, mock_AsyncResult):
+        mock_AsyncResult.return_value.state = states.PENDING
+
+        task_postrun.send(sender=None, task_id="task-1", state=states.SUCCESS)
+
+        self.assertEqual(get_task_states(["task-1"]), {"task-1": states.PENDING})
+
+    @patch("openforms.submissions.status.AsyncResult")
+    def test_chord_failure_recorded(self, mock_AsyncResult):
+        track_task_states(["task-1"])
+
+        record_chord_failure("task-1")
+
+        self.assertEqual(get_task_states(["task-1"]), {"task-1": states.FAILURE})
+        mock_AsyncResult.assert_not_called()
+
+
 @temp_private_root()
 class SubmissionStatusExtraInformationTests(APITestCase):
     """
@@ -336,7 +422,7 @@ class SubmissionStatusExtraInformationTests(APITestCase):
             self.assertEqual(response_data["paymentUrl"], "")
 
 
-@patch("openforms.submissions.status.AsyncResult.forget", return_value=None)
+@patch("openforms.submissions.tasks.cleanup.forget_results", return_value=None)
 class CleanupTaskTests(TestCase):
     def test_incomplete_submission(self, mock_forget):
         SubmissionFactory.create(
@@ -382,7 +468,7 @@ class CleanupTaskTests(TestCase):
 
         cleanup_on_completion_results()
 
-        mock_forget.assert_called_once_with()
+        mock_forget.assert_called_once_with(["some-id"])
         submission.refresh_from_db()
         self.assertEqual(submission.on_completion_task_ids, [])
 
@@ -397,7 +483,7 @@ class CleanupTaskTests(TestCase):
         cleanup_on_completion_results()
         cleanup_on_completion_results()
 
-        mock_forget.assert_called_once_with()
+        mock_forget.assert_called_once_with(["some-id"])
 
     def test_cleanup_skips_completed_submissions_without_tasks(self, mock_forget):
         SubmissionFactory.create(
@@ -410,3 +496,49 @@ class CleanupTaskTests(TestCase):
         cleanup_on_completion_results()
 
         mock_forget.assert_not_called()
+
+    def test_results_forgotten_in_batches(self, mock_forget):
+        submissions = SubmissionFactory.create_batch(
+            3,
+            completed=True,
+            completed_on=timezone.now() - timedelta(days=2, seconds=10),
+            suspended_on=None,
+            on_completion_task_ids=["id-1", "id-2"],
+        )
+
+        cleanup_on_completion_results(batch_size=2)
+
+        self.assertEqual(mock_forget.call_count, 2)
+        self.assertEqual(
+            mock_forget.call_args_list[0][0][0], ["id-1", "id-2", "id-1", "id-2"]
+        )
+        self.assertEqual(mock_forget.call_args_list[1][0][0], ["id-1", "id-2"])
+        for submission in submissions:
+            submission.refresh_from_db()
+            self.assertEqual(submission.on_completion_task_ids, [])
+
+
+class ForgetResultsTests(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+        caches["default"].clear()
+        self.addCleanup(caches["default"].clear)
+
+    @patch("openforms.submissions.status.app")
+    def test_redis_results_removed_at_once(self, mock_app):
+        mock_app.backend = Mock(spec=RedisBackend)
+        mock_app.backend.get_key_for_task.side_effect = (
+            lambda task_id: f"meta-{task_id}"
+        )
+        track_task_states(["task-1", "task-2"])
+
+        forget_results(["task-1", "task-2"])
+
+        mock_app.backend.client.delete.assert_called_once_with(
+            "meta-task-1", "meta-task-2"
+        )
+        with patch("openforms.submissions.status.AsyncResult") as mock_AsyncResult:
+            mock_AsyncResult.return_value.state = states.PENDING
+            get_task_states(["task-1", "task-2"])
+        # the recorded states are removed too
+        self.assertEqual(mock_AsyncResult.call_count, 2)
@@ -1,3 +1,4 @@
+import hashlib
 import os
 import uuid
 from datetime import timedelta
@@ -119,10 +120,25 @@ class TemporaryFileUploadTest(SubmissionsMixin, APITestCase):
         self.assertEqual(upload.content_type, "text/bar")
         self.assertEqual(upload.content.read(), b"my content")
         self.assertEqual(upload.file_size, 10)
+        self.assertEqual(upload.content_hash, hashlib.sha256(b"my content").hexdigest())
 
         # added to session
         self.assertEqual([str(upload.uuid)], self.client.session[UPLOADS_SESSION_KEY])
 
+    @override_settings(FILE_UPLOAD_MAX_MEMORY_SIZE=4)
+    def test_upload_view_hashes_large_files(self):
+        self._add_submission_to_session(self.submission)
+
+        url = reverse("api:submissions:temporary-file-upload")
+        file = SimpleUploadedFile("my-file.txt", b"my content", content_type="text/bar")
+
+        response = self.client.post(url, {"file": file}, format="multipart")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        upload = temporary_upload_from_url(response.json()["url"])
+        self.assertEqual(upload.content.read(), b"my content")
+        self.assertEqual(upload.content_hash, hashlib.sha256(b"my content").hexdigest())
+
     @override_settings(MAX_FILE_UPLOAD_SIZE=10)  # only allow 10 bytes upload size
     def test_upload_too_large(self):
         self._add_submission_to_session(self.submission)
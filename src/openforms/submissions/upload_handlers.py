@@ -0,0 +1,60 @@
+"""
+File upload handlers calculating the content hash while the upload is received.
+
+The content hash of uploads is needed later on (e.g. for the download links of
+attachments). Calculating it while the upload streams in avoids reading the whole
+file again afterwards. The hash is available as the ``sha256`` attribute of the
+uploaded file.
+"""
+import hashlib
+
+from django.core.files.uploadhandler import (
+    MemoryFileUploadHandler,
+    TemporaryFileUploadHandler,
+)
+
+
+class HashingMemoryFileUploadHandler(MemoryFileUploadHandler):
+    def new_file(self, *args, **kwargs):
+        self.sha256 = hashlib.sha256()
+        super().new_file(*args, **kwargs)
+
+    def receive_data_chunk(self, raw_data, start):
+        # when the upload is too big to keep in memory, the data is passed on to the
+        # next handler, which hashes it instead
+        if self.activated:
+            self.sha256.update(raw_data)
+        return super().receive_data_chunk(raw_data, start)
+
+    def file_complete(self, file_size):
+        file = super().file_complete(file_size)
+        if file is not None:
+            file.sha256 = self.sha256.hexdigest()
+        return file
+
+
+class HashingTemporaryFileUploadHandler(TemporaryFileUploadHandler):
+    def new_file(self, *args, **kwargs):
+        self.sha256 = hashlib.sha256()
+        super().new_file(*args, **kwargs)
+
+    def receive_data_chunk(self, raw_data, start):
+        self.sha256.update(raw_data)
+        return super().receive_data_chunk(raw_data, start)
+
+    def file_complete(self, file_size):
+        file = super().file_complete(file_size)
+        file.sha256 = self.sha256.hexdigest()
+        return file
+
+
+def use_hashing_upload_handlers(request) -> None:
+    """
+    Replace the upload handlers of the (Django) request with the hashing variants.
+
+    This must be called before the request body is parsed.
+    """
+    request.upload_handlers = [
+        HashingMemoryFileUploadHandler(request),
+        HashingTemporaryFileUploadHandler(request),
+    ]
@@ -0,0 +1,62 @@
+"""
+Utilities for the (shared) Django cache.
+"""
+import time
+from typing import Any, Callable
+
+from django.core.cache.backends.base import BaseCache
+
+# marker for cache misses, so that ``None`` can be cached as a value
+_MISSING = object()
+
+
+def get_or_compute(
+    cache: BaseCache,
+    key: str,
+    compute: Callable[[], Any],
+    timeout: int,
+    lock_timeout: int = 10,
+    wait_interval: float = 0.05,
+) -> Any:
+    """
+    Retrieve the value from the cache, computing (and storing) it on a miss.
+
+    Concurrent misses for the same key are coalesced: only one caller computes the
+    value while the other callers wait for it to appear in the cache. If it does not
+    appear within ``lock_timeout`` seconds (or the computation failed), the waiting
+    callers compute the value themselves.
+
+    :param cache: the cache to use, e.g. ``caches["default"]``.
+    :param key: the cache key of the value.
+    :param compute: callable without arguments producing the value.
+    :param timeout: the cache timeout of the value, in seconds.
+    :param lock_timeout: the maximum time, in seconds, a computation may hold the lock.
+    :param wait_interval: the time, in seconds, between lookups of waiting callers.
+    """
+    value = cache.get(key, _MISSING)
+    if value is not _MISSING:
+        return value
+
+    lock_key = f"{key}:lock"
+    if cache.add(lock_key, 1, timeout=lock_timeout):
+        try:
+            value = compute()
+            cache.set(key, value, timeout=timeout)
+            return value
+        finally:
+            cache.delete(lock_key)
+
+    deadline = time.monotonic() + lock_timeout
+    while True:
+        # check the lock first - the value is stored before the lock is released
+        computing = cache.get(lock_key) is not None
+        value = cache.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+        # the computation finished without storing a value (i.e. it failed) or the
+        # cache is unavailable
+        if not computing or time.monotonic() >= deadline:
+            break
+        time.sleep(wait_interval)
+
+    return compute()
@@ -3,9 +3,12 @@ Implement :class:`django.db.models.FileField` related utilities.
 
 These utilities apply to file fields and subclasses thereof.
 """
+import hashlib
 import logging
-from typing import List
+import os
+from typing import IO, List
 
+from django.core.files import File
 from django.db import models, transaction
 from django.db.models.base import ModelBase
 from django.db.models.fields.files import FieldFile
@@ -22,6 +25,49 @@ def get_file_field_names(model: ModelBase) -> List[str]:
     return [field.name for field in file_fields]
 
 
+def calculate_sha256(file: IO[bytes], chunk_size: int = 64 * 1024) -> str:
+    """
+    Calculate the sha256 hash of the (binary) file content, reading it in chunks.
+    """
+    sha256 = hashlib.sha256()
+    while chunk := file.read(chunk_size):
+        sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+def link_or_copy(source: FieldFile, target: FieldFile, filename: str) -> None:
+    """
+    Store the content of ``source`` as the (new) file of ``target``.
+
+    On storages with files on the local file system, a hard link is created so that
+    the data itself is not copied. Both files remain independent - deleting one of
+    them does not affect the other. If linking is not possible (different file
+    systems or storages without local paths), the content is copied instead.
+
+    The instance of ``target`` is not saved.
+    """
+    storage = target.storage
+    name = target.field.generate_filename(target.instance, filename)
+    try:
+        source_path = source.path
+        name = storage.get_available_name(name, max_length=target.field.max_length)
+        target_path = storage.path(name)
+    except NotImplementedError:
+        target.save(filename, File(source), save=False)
+        return
+
+    os.makedirs(os.path.dirname(target_path), exist_ok=True)
+    try:
+        os.link(source_path, target_path)
+    except OSError as exc:
+        logger.debug("Could not link %s, copying instead: %s", source_path, exc)
+        target.save(filename, File(source), save=False)
+        return
+
+    target.name = name
+    target._committed = True
+
+
 class log_failed_deletes:
     """
     Context manager adding robustness to model file field deletes.
@@ -0,0 +1,33 @@
+"""
+Render templates configured by administrators (stored in the database).
+
+Unlike templates on the file system, these templates are not covered by Django's
+cached template loader. Parsing them again for every render is wasteful, as the same
+confirmation templates are rendered for every submission (e-mail subject and content,
+confirmation page on every status check...).
+
+The compiled templates are kept in a bounded per-process cache, keyed by the template
+source itself. Changing a template results in a different key, so no invalidation is
+needed - the outdated entry is eventually evicted.
+"""
+from functools import lru_cache
+from typing import Any, Dict
+
+from django.template import Context, Template
+
+TEMPLATE_CACHE_SIZE = 128
+
+
+@lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def get_template_from_string(source: str) -> Template:
+    """
+    Return the compiled template for the template source.
+
+    Compiled templates are safe to render concurrently and with different contexts,
+    but must not be modified.
+    """
+    return Template(source)
+
+
+def render_from_string(source: str, context: Dict[str, Any]) -> str:
+    return get_template_from_string(source).render(Context(context))
@@ -0,0 +1,72 @@
+import threading
+from unittest.mock import Mock
+
+from django.core.cache import caches
+from django.test import SimpleTestCase
+
+from ..cache import get_or_compute
+
+
+class GetOrComputeTests(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+        self.cache = caches["default"]
+        self.cache.clear()
+        self.addCleanup(self.cache.clear)
+
+    def test_value_computed_once(self):
+        compute = Mock(return_value=None)
+
+        first = get_or_compute(self.cache, "key", compute, timeout=60)
+        second = get_or_compute(self.cache, "key", compute, timeout=60)
+
+        self.assertIsNone(first)
+        self.assertIsNone(second)
+        compute.assert_called_once_with()
+
+    def test_concurrent_misses_are_coalesced(self):
+        started = threading.Event()
+        release = threading.Event()
+        compute = Mock(return_value="value")
+
+        def slow_compute():
+            started.set()
+            release.wait(5)
+            return compute()
+
+        results = []
+        thread = threading.Thread(
+            target=lambda: results.append(
+                get_or_compute(self.cache, "key", slow_compute, timeout=60)
+            )
+        )
+        thread.start()
+        started.wait(5)
+
+        waiter = threading.Thread(
+            target=lambda: results.append(
+                get_or_compute(self.cache, "key", compute, timeout=60)
+            )
+        )
+        waiter.start()
+        release.set()
+        thread.join()
+        waiter.join()
+
+        self.assertEqual(results, ["value", "value"])
+        compute.assert_called_once_with()
+
+    def test_waiting_callers_compute_after_failure(self):
+        self.cache.add("key:lock", 1)
+        compute = Mock(return_value="value")
+
+        def release_lock():
+            self.cache.delete("key:lock")
+
+        timer = threading.Timer(0.1, release_lock)
+        timer.start()
+        result = get_or_compute(self.cache, "key", compute, timeout=60)
+        timer.join()
+
+        self.assertEqual(result, "value")
+        compute.assert_called_once_with()
@@ -0,0 +1,36 @@
+from django.test import SimpleTestCase
+
+from ..templates import get_template_from_string, render_from_string
+
+
+class TemplateFromStringTests(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+        get_template_from_string.cache_clear()
+        self.addCleanup(get_template_from_string.cache_clear)
+
+    def test_compiled_template_reused(self):
+        first = render_from_string("Hello {{ name }}", {"name": "Alice"})
+        second = render_from_string("Hello {{ name }}", {"name": "Bob"})
+
+        self.assertEqual(first, "Hello Alice")
+        self.assertEqual(second, "Hello Bob")
+        cache_info = get_template_from_string.cache_info()
+        self.assertEqual(cache_info.misses, 1)
+        self.assertEqual(cache_info.hits, 1)
+
+    def test_changed_template_compiled_again(self):
+        render_from_string("Hello {{ name }}", {"name": "Alice"})
+
+        rendered = render_from_string("Bye {{ name }}", {"name": "Alice"})
+
+        self.assertEqual(rendered, "Bye Alice")
+        self.assertEqual(get_template_from_string.cache_info().misses, 2)
+
+    def test_context_not_shared_between_renders(self):
+        source = "{% with greeting='Hi' %}{{ greeting }} {{ name }}{% endwith %}"
+
+        render_from_string(source, {"name": "Alice"})
+        rendered = render_from_string(source, {})
+
+        self.assertEqual(rendered, "Hi ")
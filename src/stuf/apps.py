@@ -5,3 +5,6 @@ from django.utils.translation import gettext_lazy as _
 class StufAppConfig(AppConfig):
     name = "stuf"
     verbose_name = _("StUF Settings & Services")
+
+    def ready(self):
+        from . import signals  # noqa
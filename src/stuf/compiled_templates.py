@@ -0,0 +1,90 @@
+"""
+Pre-rendered SOAP message templates.
+
+Most of a StUF message is identical for every message sent to a service: the SOAP
+envelope, the security header and the sender/receiver information only depend on
+the configuration of the :class:`stuf.models.StufService`. Rendering all of it
+through the template engine for every message wastes CPU in busy registration
+workers.
+
+A :class:`CompiledTemplate` renders a template once with the static context and a
+marker for every per-message field. Rendering a message then only requires
+interpolating the (escaped) per-message values between the pre-rendered parts.
+
+Compiled templates are cached per process, keyed by the template name and the
+static context - a changed service configuration simply results in a different
+compiled template.
+"""
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Tuple
+
+from django.template import loader
+from django.utils.formats import localize
+from django.utils.html import conditional_escape
+from django.utils.safestring import SafeString, mark_safe
+from django.utils.timezone import template_localtime
+
+# NUL characters cannot occur in XML documents, which makes them safe markers
+MARKER = "\x00"
+
+
+def _render_value(value: Any) -> str:
+    # equivalent of how the template engine outputs ``{{ value }}`` (with autoescape)
+    return conditional_escape(localize(template_localtime(value)))
+
+
+class CompiledTemplate:
+    def __init__(
+        self, template_name: str, static_context: Dict[str, Any], fields: Iterable[str]
+    ):
+        """
+        Pre-render the template with the static context.
+
+        The per-message ``fields`` may only be output as plain variables
+        (``{{ field }}``) in the template, they cannot be used in template tags or
+        filters.
+        """
+        self.template_name = template_name
+        self.static_context = static_context
+        self.fields = tuple(fields)
+
+        context = {
+            **static_context,
+            **{field: mark_safe(f"{MARKER}{field}{MARKER}") for field in self.fields},
+        }
+        parts = loader.render_to_string(template_name, context).split(MARKER)
+        # even indices are the pre-rendered parts, odd indices are field names
+        self._parts = parts
+        self._field_indices = range(1, len(parts), 2)
+
+    def render(self, **values) -> SafeString:
+        parts = self._parts.copy()
+        for index in self._field_indices:
+            parts[index] = _render_value(values[parts[index]])
+        return mark_safe("".join(parts))
+
+
+@lru_cache(maxsize=128)
+def _get_compiled_template(
+    template_name: str,
+    static_items: Tuple[Tuple[str, Any], ...],
+    fields: Tuple[str, ...],
+) -> CompiledTemplate:
+    return CompiledTemplate(template_name, dict(static_items), fields)
+
+
+def get_compiled_template(
+    template_name: str, static_context: Dict[str, Any], fields: Iterable[str]
+) -> CompiledTemplate:
+    """
+    Retrieve the (cached) compiled template for the static context.
+
+    Values in the static context for any of the ``fields`` are ignored.
+    """
+    fields = tuple(sorted(fields))
+    static_items = tuple(
+        sorted(
+            (key, value) for key, value in static_context.items() if key not in fields
+        )
+    )
+    return _get_compiled_template(template_name, static_items, fields)
@@ -0,0 +1,111 @@
+"""
+Process-wide, pooled HTTP sessions for the StUF services.
+
+Registering a submission with StUF-ZDS takes a number of consecutive SOAP calls. With
+a new connection for every call, each of them pays for a TCP and (mutual) TLS
+handshake. Instead, every :class:`stuf.models.StufService` gets a
+:class:`requests.Session` with a connection pool that keeps the connections alive.
+The client certificate and credentials are configured once on the session.
+
+The sessions are keyed by the service and a "session version", stored in the shared
+(Django) cache. The version is bumped whenever a SOAP or StUF service is changed,
+see :mod:`stuf.signals`, so that all processes pick up the new configuration.
+"""
+import logging
+import uuid
+from functools import lru_cache
+from typing import List, Optional
+
+from django.conf import settings
+from django.core.cache import caches
+
+from requests import Session
+from requests.adapters import HTTPAdapter
+
+from .models import StufService
+
+logger = logging.getLogger(__name__)
+
+CACHE_ALIAS = "default"
+VERSION_CACHE_KEY = "stuf:session-version"
+
+
+def build_session(service: StufService) -> Session:
+    session = Session()
+    adapter = HTTPAdapter(pool_maxsize=settings.STUF_POOL_MAXSIZE)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.auth = service.get_auth()
+    session.cert = service.get_cert()
+    return session
+
+
+@lru_cache(maxsize=16)
+def _get_cached_session(service: StufService, version: str) -> Session:
+    logger.debug("Creating pooled session for StUF service %s", service.pk)
+    return build_session(service)
+
+
+def get_session_version() -> Optional[str]:
+    cache = caches[CACHE_ALIAS]
+    version = cache.get(VERSION_CACHE_KEY)
+    if version is None:
+        # use add so that concurrent initializations settle on a single version
+        cache.add(VERSION_CACHE_KEY, uuid.uuid4().hex, timeout=None)
+        version = cache.get(VERSION_CACHE_KEY)
+    return version
+
+
+def invalidate_sessions() -> None:
+    caches[CACHE_ALIAS].set(VERSION_CACHE_KEY, uuid.uuid4().hex, timeout=None)
+
+
+def get_session(service: StufService) -> Session:
+    """
+    Retrieve the (cached) pooled session for the StUF service.
+    """
+    version = get_session_version()
+    # the cache is unavailable - do not risk using a session for an outdated
+    # configuration since invalidation cannot be communicated.
+    if version is None or service.pk is None:
+        return build_session(service)
+    return _get_cached_session(service, version)
+
+
+def get_pool_stats(session: Session) -> List[dict]:
+    """
+    Report the usage of the connection pools of the session, per host.
+
+    ``num_connections`` is the number of connections opened so far, while
+    ``num_requests`` is the number of requests made over them - the closer these
+    two are, the less the connections are re-used.
+    """
+    stats = []
+    # the same adapter is mounted for both http and https
+    adapters = {id(adapter): adapter for adapter in session.adapters.values()}
+    for adapter in adapters.values():
+        pools = adapter.poolmanager.pools
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            stats.append(
+                {
+                    "scheme": pool.scheme,
+                    "host": pool.host,
+                    "port": pool.port,
+                    "num_connections": pool.num_connections,
+                    "num_requests": pool.num_requests,
+                }
+            )
+    return stats
+
+
+def log_pool_stats(session: Session) -> None:
+    """
+    Log the usage of the connection pools of the session, to tune
+    ``STUF_POOL_MAXSIZE``. Only done when debug logging is enabled.
+    """
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+    logger.debug("StUF connection pool usage: %r", get_pool_stats(session))
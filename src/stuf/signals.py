@@ -0,0 +1,17 @@
+from django.db import transaction
+from django.db.models.base import ModelBase
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import SoapService, StufService
+from .sessions import invalidate_sessions
+
+
+@receiver(post_save, sender=SoapService, dispatch_uid="stuf.invalidate_soap_save")
+@receiver(post_delete, sender=SoapService, dispatch_uid="stuf.invalidate_soap_delete")
+@receiver(post_save, sender=StufService, dispatch_uid="stuf.invalidate_stuf_save")
+@receiver(post_delete, sender=StufService, dispatch_uid="stuf.invalidate_stuf_delete")
+def invalidate_stuf_sessions(sender: ModelBase, **kwargs) -> None:
+    invalidate_sessions()
+    # other processes may have cached a session while the transaction was open
+    transaction.on_commit(invalidate_sessions)
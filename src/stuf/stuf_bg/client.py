@@ -3,20 +3,28 @@ import uuid
 from datetime import timedelta
 from typing import List
 
-from django.template import loader
 from django.utils import dateformat, timezone
 
-import requests
 import xmltodict
 
 from openforms.logging.logevent import stuf_bg_request, stuf_bg_response
+from stuf.compiled_templates import get_compiled_template
 from stuf.constants import SOAP_VERSION_CONTENT_TYPES, EndpointType
 from stuf.models import StufService
+from stuf.sessions import get_session, log_pool_stats
 
 from .constants import NAMESPACE_REPLACEMENTS, STUF_BG_EXPIRY_MINUTES
 
 logger = logging.getLogger(__name__)
 
+PER_REQUEST_FIELDS = (
+    "bsn",
+    "created",
+    "expires",
+    "referentienummer",
+    "tijdstip_bericht",
+)
+
 
 class StufBGClient:
     def __init__(self, service: StufService):
@@ -49,7 +57,8 @@ class StufBGClient:
         logger.debug("StUF BG client request.\nurl: %s\ndata: %s", url, data)
         stuf_bg_request(self.service, url)
 
-        response = requests.post(
+        session = get_session(self.service)
+        response = session.post(
             url,
             data=data,
             headers={
@@ -59,9 +68,8 @@ class StufBGClient:
                 # we only have one action so lets hardcode for now
                 "SOAPAction": "http://www.egem.nl/StUF/sector/bg/0310/npsLv01",
             },
-            cert=self.service.get_cert(),
-            auth=self.service.get_auth(),
         )
+        log_pool_stats(session)
         # TODO should this raise_for_error() ?
 
         logger.debug(
@@ -79,7 +87,12 @@ class StufBGClient:
             context.update({attribute: attribute})
         context.update({"bsn": bsn})
 
-        return loader.render_to_string("stuf_bg/StufBgRequest.xml", context)
+        # the requested attributes are part of the static context - for a given form,
+        # the same attributes are requested for every submission
+        template = get_compiled_template(
+            "stuf_bg/StufBgRequest.xml", context, fields=PER_REQUEST_FIELDS
+        )
+        return template.render(**{field: context[field] for field in template.fields})
 
     def get_values_for_attributes(self, bsn, attributes):
 
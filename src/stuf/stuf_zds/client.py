@@ -10,7 +10,6 @@ from django.utils import timezone
 from django.utils.safestring import mark_safe
 from django.utils.translation import gettext_lazy as _
 
-import requests
 from defusedxml.lxml import fromstring as df_fromstring
 from lxml import etree
 from lxml.etree import Element
@@ -25,6 +24,7 @@ from openforms.logging.logevent import (
 from openforms.plugins.exceptions import InvalidPluginConfiguration
 from openforms.registrations.exceptions import RegistrationFailed
 from openforms.submissions.models import SubmissionFileAttachment, SubmissionReport
+from stuf.compiled_templates import get_compiled_template
 from stuf.constants import (
     SOAP_VERSION_CONTENT_TYPES,
     STUF_ZDS_EXPIRY_MINUTES,
@@ -32,6 +32,7 @@ from stuf.constants import (
     EndpointType,
 )
 from stuf.models import StufService
+from stuf.sessions import get_session, log_pool_stats
 
 logger = logging.getLogger(__name__)
 
@@ -100,7 +101,7 @@ class StufZDSClient:
 
         self._global_config = GlobalConfiguration.get_solo()
 
-    def _get_request_base_context(self):
+    def _get_service_context(self) -> dict:
         return {
             "zender_organisatie": self.service.zender_organisatie,
             "zender_applicatie": self.service.zender_applicatie,
@@ -110,7 +111,23 @@ class StufZDSClient:
             "ontvanger_applicatie": self.service.ontvanger_applicatie,
             "ontvanger_gebruiker": self.service.ontvanger_gebruiker,
             "ontvanger_administratie": self.service.ontvanger_administratie,
-            "tijdstip_bericht": fmt_soap_datetime(timezone.now()),
+        }
+
+    def _get_request_base_context(self):
+        service_context = self._get_service_context()
+        tijdstip_bericht = fmt_soap_datetime(timezone.now())
+        stuurgegevens = get_compiled_template(
+            "stuf_zds/soap/includes/stuurgegevens.xml",
+            service_context,
+            fields=("referentienummer", "tijdstip_bericht"),
+        ).render(
+            referentienummer=self.options["referentienummer"],
+            tijdstip_bericht=tijdstip_bericht,
+        )
+        return {
+            **service_context,
+            "stuurgegevens": stuurgegevens,
+            "tijdstip_bericht": tijdstip_bericht,
             "tijdstip_registratie": fmt_soap_datetime(timezone.now()),
             "datum_vandaag": fmt_soap_date(timezone.now()),
             "gemeentecode": self.options["gemeentecode"],
@@ -129,7 +146,7 @@ class StufZDSClient:
         }
 
     def _wrap_soap_envelope(self, xml_str: str) -> str:
-        return loader.render_to_string(
+        envelope = get_compiled_template(
             "stuf_zds/soap/includes/envelope.xml",
             {
                 "soap_version": self.service.soap_version,
@@ -139,12 +156,15 @@ class StufZDSClient:
                 ),
                 "wss_username": self.service.user,
                 "wss_password": self.service.password,
-                "wss_created": fmt_soap_date(timezone.now()),
-                "wss_expires": fmt_soap_date(
-                    timezone.now() + timedelta(minutes=STUF_ZDS_EXPIRY_MINUTES)
-                ),
-                "content": mark_safe(xml_str),
             },
+            fields=("wss_created", "wss_expires", "content"),
+        )
+        return envelope.render(
+            wss_created=fmt_soap_date(timezone.now()),
+            wss_expires=fmt_soap_date(
+                timezone.now() + timedelta(minutes=STUF_ZDS_EXPIRY_MINUTES)
+            ),
+            content=mark_safe(xml_str),
         )
 
     def _make_request(
@@ -164,7 +184,8 @@ class StufZDSClient:
 
         try:
             stuf_zds_request(self.service, url)
-            response = requests.post(
+            session = get_session(self.service)
+            response = session.post(
                 url,
                 data=request_data,
                 headers={
@@ -173,9 +194,8 @@ class StufZDSClient:
                     ),
                     "SOAPAction": f"http://www.egem.nl/StUF/sector/zkn/0310/{soap_action}",
                 },
-                auth=self.service.get_auth(),
-                cert=self.service.get_cert(),
             )
+            log_pool_stats(session)
             if response.status_code < 200 or response.status_code >= 400:
                 logger.debug("SOAP-response:\n%s", response.content)
                 error_text = parse_soap_error_text(response)
@@ -0,0 +1,56 @@
+from django.template import loader
+from django.test import SimpleTestCase
+from django.utils.safestring import mark_safe
+
+from stuf.compiled_templates import get_compiled_template
+
+ENVELOPE = "stuf_zds/soap/includes/envelope.xml"
+FIELDS = ("wss_created", "wss_expires", "content")
+
+
+class CompiledTemplateTests(SimpleTestCase):
+    def test_render_equals_template_render(self):
+        static_context = {
+            "soap_version": "1.2",
+            "soap_use_wss": True,
+            "wss_username": "user & co",
+            "wss_password": "<secret>",
+        }
+        values = {
+            "wss_created": "2022-03-01",
+            "wss_expires": "<expires>",
+            "content": mark_safe("<ZKN:bericht/>"),
+        }
+
+        compiled = get_compiled_template(ENVELOPE, static_context, FIELDS)
+
+        self.assertEqual(
+            compiled.render(**values),
+            loader.render_to_string(ENVELOPE, {**static_context, **values}),
+        )
+
+    def test_compiled_once_per_static_context(self):
+        static_context = {"soap_version": "1.1", "soap_use_wss": False}
+
+        compiled = get_compiled_template(ENVELOPE, static_context, FIELDS)
+
+        self.assertIs(
+            get_compiled_template(ENVELOPE, {**static_context}, FIELDS), compiled
+        )
+        self.assertIsNot(
+            get_compiled_template(
+                ENVELOPE, {**static_context, "soap_version": "1.2"}, FIELDS
+            ),
+            compiled,
+        )
+
+    def test_static_values_for_fields_ignored(self):
+        compiled = get_compiled_template(
+            ENVELOPE, {"soap_use_wss": True, "wss_created": "static"}, FIELDS
+        )
+
+        rendered = compiled.render(
+            wss_created="dynamic", wss_expires="", content=mark_safe("")
+        )
+
+        self.assertIn("<Created>dynamic</Created>", rendered)
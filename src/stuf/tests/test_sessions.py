@@ -0,0 +1,70 @@
+from django.test import TestCase
+
+from stuf.constants import EndpointSecurity
+from stuf.sessions import get_pool_stats, get_session, log_pool_stats
+from stuf.tests.factories import StufServiceFactory
+
+
+class SessionTests(TestCase):
+    def test_session_reused_for_service(self):
+        service = StufServiceFactory.create()
+
+        session = get_session(service)
+
+        self.assertIs(get_session(service), session)
+        self.assertIsNot(get_session(StufServiceFactory.create()), session)
+
+    def test_session_configured_with_credentials(self):
+        service = StufServiceFactory.create(
+            endpoint_security=EndpointSecurity.basicauth,
+            user="user",
+            password="secret",
+        )
+
+        session = get_session(service)
+
+        self.assertEqual(session.auth, ("user", "secret"))
+        self.assertEqual(session.cert, (None, None))
+
+    def test_session_invalidated_on_change(self):
+        service = StufServiceFactory.create(
+            endpoint_security=EndpointSecurity.basicauth,
+            user="user",
+            password="secret",
+        )
+        session = get_session(service)
+
+        service.password = "changed"
+        service.save()
+        new_session = get_session(service)
+
+        self.assertIsNot(new_session, session)
+        self.assertEqual(new_session.auth, ("user", "changed"))
+
+    def test_session_invalidated_on_soap_service_change(self):
+        service = StufServiceFactory.create()
+        session = get_session(service)
+
+        service.soap_service.save()
+
+        self.assertIsNot(get_session(service), session)
+
+    def test_pool_stats_without_requests(self):
+        session = get_session(StufServiceFactory.create())
+
+        self.assertEqual(get_pool_stats(session), [])
+
+    def test_pool_stats_logged_at_debug_level(self):
+        session = get_session(StufServiceFactory.create())
+
+        with self.assertLogs("stuf.sessions", level="DEBUG") as logs:
+            log_pool_stats(session)
+
+        self.assertEqual(
+            logs.output, ["DEBUG:stuf.sessions:StUF connection pool usage: []"]
+        )
+
+    def test_unsaved_service_not_cached(self):
+        service = StufServiceFactory.build()
+
+        self.assertIsNot(get_session(service), get_session(service))